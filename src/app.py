@@ -17,12 +17,18 @@ import inflect
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from strawberry.fastapi import GraphQLRouter
 
 from database.migrations.Migration import run_all_migrations
 from database.StaticDatabaseManager import DatabaseManager
+from lib.Broadcast import start_broadcast_hub
 from lib.Environment import env
-from lib.Pydantic2Strawberry import schema
+from lib.Pydantic2Strawberry import (
+    PersistedQueryRouter,
+    get_graphql_context,
+    get_schema,
+    shutdown,
+    startup,
+)
 
 # from lib.Logging import setup_enhanced_logging
 
@@ -322,10 +328,12 @@ def create_app():
         # Initialize services
         db_mgr = DatabaseManager.get_instance()
         db_mgr.init_worker()  # Now the worker can initialize since config exists
+        await startup()  # Connect this worker to the subscription broadcast
         try:
             yield
         finally:
             # Cleanup services
+            await shutdown()
             await db_mgr.close_worker()
 
     # Initialize FastAPI application
@@ -455,7 +463,9 @@ def create_app():
         return {"status": "UP"}
 
     # Set up GraphQL
-    graphql_app = GraphQLRouter(schema=schema, debug=True)
+    graphql_app = PersistedQueryRouter(
+        schema=get_schema(), context_getter=get_graphql_context, debug=True
+    )
     app.include_router(graphql_app, prefix="/graphql")
     logging.debug("==== REGISTERED ROUTES ====")
     for route in app.routes:
@@ -545,6 +555,9 @@ if __name__ == "__main__":
         # Seed data if needed
         seed_data()
 
+        # Workers share subscription events through a hub on unix:// URLs
+        start_broadcast_hub(env("BROADCAST_URL"))
+
         # Start Uvicorn with the app as an import string
         logging.info(
             f"Booting {env('APP_NAME')} server, please report any issues to {env('APP_REPOSITORY')}"
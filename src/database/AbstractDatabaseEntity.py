@@ -1,13 +1,38 @@
+import base64
+import binascii
 import functools
 import logging
 import uuid
-from typing import List, Literal, Optional, Type, TypeVar, Union, get_args, get_origin
+from datetime import datetime
+from typing import (
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from fastapi import HTTPException
-from sqlalchemy import UUID, Column, DateTime, ForeignKey, String, func, inspect
+from sqlalchemy import (
+    UUID,
+    Column,
+    DateTime,
+    ForeignKey,
+    String,
+    event,
+    func,
+    inspect,
+)
+from sqlalchemy import update as sql_update
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import Session, declared_attr, relationship
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.orm.exc import MultipleResultsFound, NoResultFound
+from sqlalchemy.sql import ClauseElement
 
 from database.Base import DATABASE_TYPE, PK_TYPE, get_session
 from database.StaticPermissions import (
@@ -17,6 +42,16 @@ from database.StaticPermissions import (
     generate_permission_filter,
     validate_columns,
 )
+from database.StaticChangeFeed import (
+    DEFAULT_CHANGE_PAGE_SIZE,
+    change_feed_filters,
+    change_feed_order,
+    change_feed_position,
+    encode_cursor,
+    register_change_index,
+    settle_horizon,
+)
+from database.StaticSearchIndex import register_search_index
 from lib.Environment import env
 from lib.Pydantic import obj_to_dict
 
@@ -123,6 +158,27 @@ def build_query(
     return to_return
 
 
+def encode_page_cursor(id: str) -> str:
+    """Encode the id of the last record of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(str(id).encode()).decode().rstrip("=")
+
+
+def decode_page_cursor(cursor: str) -> str:
+    """
+    Decode a cursor produced by `encode_page_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        id = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not id:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return id
+
+
 def db_to_return_type(
     entity: Union[T, List[T]],
     return_type: Literal["db", "dict", "dto", "model"] = "dict",
@@ -190,27 +246,14 @@ def db_to_return_type(
 
         # Convert to DTO or Model
         if isinstance(entity, list):
-            dto_instances = []
-            for item in entity:
-                # Convert each entity to dict first
-                item_dict = obj_to_dict(item)
-                # Process nested objects in the dict
-                item_dict = _process_nested_objects(item_dict, dto_type)
-                # Create DTO instance
-                dto_instance = dto_type(**item_dict)
-                dto_instances.append(dto_instance)
+            dto_instances = [_build_dto(item, dto_type) for item in entity]
 
             # Convert to model if requested
             if return_type == "model":
                 return [dto.to_model() for dto in dto_instances]
             return dto_instances
         else:
-            # Convert entity to dict
-            entity_dict = obj_to_dict(entity)
-            # Process nested objects in the dict
-            entity_dict = _process_nested_objects(entity_dict, dto_type)
-            # Create DTO instance
-            dto_instance = dto_type(**entity_dict)
+            dto_instance = _build_dto(entity, dto_type)
 
             # Convert to model if requested
             if return_type == "model":
@@ -221,6 +264,58 @@ def db_to_return_type(
     return entity
 
 
+def commit_and_convert(
+    db: Session,
+    entity,
+    return_type: Literal["db", "dict", "dto", "model"] = "dict",
+    dto_type=None,
+    fields: List[str] = [],
+):
+    """
+    Commit a flushed entity (or list of entities) and convert it to the
+    requested return type.
+
+    Converted results are built before the commit, while the state written by
+    the flush (including columns returned by INSERT/UPDATE ... RETURNING) is
+    still loaded, so no refresh query is needed. ORM instances are refreshed
+    after the commit so they remain usable once the session is closed.
+    """
+    entities = entity if isinstance(entity, list) else [entity]
+    if return_type == "db":
+        db.commit()
+        for item in entities:
+            db.refresh(item)
+        return entity
+
+    # Columns an INSERT left NULL are not in the instance dict, which
+    # db_to_return_type reads; reading them does not query the database
+    for item in entities:
+        state = inspect(item)
+        for key in state.unloaded & set(state.mapper.column_attrs.keys()):
+            set_committed_value(item, key, getattr(item, key))
+
+    result = db_to_return_type(entity, return_type, dto_type, fields)
+    db.commit()
+    return result
+
+
+def _build_dto(entity, dto_type):
+    """
+    Convert an entity to a DTO.
+
+    Entities loaded with load_only become partial DTOs built without
+    validation, holding only the loaded columns. Reading the others would
+    cost a query per entity.
+    """
+    entity_dict = _process_nested_objects(obj_to_dict(entity), dto_type)
+
+    state = inspect(entity, raiseerr=False)
+    if state is not None and getattr(state, "mapper", None) is not None:
+        if state.unloaded & set(state.mapper.column_attrs.keys()):
+            return dto_type.model_construct(**entity_dict)
+    return dto_type(**entity_dict)
+
+
 def _process_nested_objects(data_dict, parent_dto_type):
     """
     Process nested objects in a dictionary based on parent DTO type annotations.
@@ -384,6 +479,11 @@ class HooksDescriptor:
 class BaseMixin:
     system = False
     seed_list = []
+    # String columns served by a substring search index (see StaticSearchIndex)
+    search_index: List[str] = []
+    # Fetch SQL-generated values (created_at, updated_at, ...) with RETURNING
+    # during the INSERT/UPDATE itself instead of a refresh afterwards
+    __mapper_args__ = {"eager_defaults": True}
 
     @classmethod
     def register_seed_items(cls, items):
@@ -591,8 +691,10 @@ class BaseMixin:
         from database.StaticPermissions import (
             PermissionResult,
             PermissionType,
+            api_key_scopes,
             is_root_id,
             is_system_user_id,
+            scopes_allow,
         )
 
         # Validate fields parameter
@@ -606,6 +708,13 @@ class BaseMixin:
                     detail=f"Only system users can create {cls.__name__} records",
                 )
 
+        # API key scopes must grant create on this table
+        if not scopes_allow(api_key_scopes.get(), cls.__tablename__, "create"):
+            raise HTTPException(
+                status_code=403,
+                detail=f"API key scope does not allow creating {cls.__name__}",
+            )
+
         # Check if the user can create this entity
         # Remove user_id from kwargs if it exists to prevent duplicate parameters
         create_kwargs = kwargs.copy()
@@ -637,14 +746,15 @@ class BaseMixin:
                 # Extract data from the hook dict
                 data = {k: v for k, v in hook_dict.items()}
 
-        # Create the entity
+        # Users are their own creators
+        if cls.__tablename__ == "users":
+            data["created_by_user_id"] = data["id"]
+
+        # Create the entity; the INSERT returns generated columns
         entity = cls(**data)
         db.add(entity)
         db.flush()
-        if cls.__tablename__ == "users":
-            entity.created_by_user_id = entity.id
-        db.commit()
-        db.refresh(entity)
+        result = commit_and_convert(db, entity, return_type, override_dto, fields)
 
         # Get hooks for after_create
         if "create" in hooks and "after" in hooks["create"]:
@@ -653,8 +763,7 @@ class BaseMixin:
                 for hook in after_hooks:
                     hook(entity, db)
 
-        # Convert to requested return type
-        return db_to_return_type(entity, return_type, override_dto, fields)
+        return result
 
     @classmethod
     @with_session
@@ -895,6 +1004,119 @@ class BaseMixin:
                 detail=f"Request uncovered multiple {cls.__name__} when only one was expected.",
             )
 
+    @classmethod
+    @with_session
+    def get_many(
+        cls: Type[T],
+        requester_id: str,
+        db: Optional[Session],
+        ids: List[str],
+        return_type: Literal["db", "dict", "dto", "model"] = "dict",
+        joins=[],
+        options=[],
+        fields=[],
+        override_dto: Optional[Type[DtoT]] = None,
+    ) -> List[Optional[T]]:
+        """
+        Get the records in `ids` with a single permission-filtered query.
+
+        Args:
+            requester_id: The ID of the user making the request
+            db: Database session
+            ids: IDs of the records to get
+            return_type: The return type format ("db", "dict", "dto", "model")
+            joins: List of join conditions
+            options: List of query options
+            fields: List of fields to include in the response (only for return_type="dict")
+            override_dto: Optional DTO class override
+
+        Returns:
+            A list aligned with `ids`, holding None where a record does not
+            exist or is not visible to the requester (as with get, the two
+            are indistinguishable)
+        """
+        # Validate fields parameter
+        if fields and return_type != "dict":
+            raise HTTPException(
+                status_code=400,
+                detail="Fields parameter can only be used with return_type='dict'",
+            )
+
+        # Validate that fields exist on the model
+        validate_fields(cls, fields)
+
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return []
+
+        filters = [cls.id.in_(unique_ids)]
+
+        # Only add deleted_at filter for non-ROOT users
+        from database.StaticPermissions import is_root_id
+
+        if hasattr(cls, "deleted_at") and not is_root_id(requester_id):
+            filters.append(cls.deleted_at == None)
+
+        # One permission filter covers every requested id
+        filters.append(
+            generate_permission_filter(requester_id, cls, db, PermissionType.VIEW)
+        )
+
+        entities = build_query(db, cls, joins, options, filters).all()
+        converted = db_to_return_type(
+            entities, return_type, get_dto_class(cls, override_dto), fields=fields
+        )
+        by_id = {entity.id: item for entity, item in zip(entities, converted)}
+
+        logging.debug(
+            f"Returning {len(by_id)} of {len(unique_ids)} requested {cls.__name__} records"
+        )
+        return [by_id.get(id) for id in ids]
+
+    @classmethod
+    @with_session
+    def fingerprint(
+        cls: Type[T],
+        requester_id: str,
+        db: Optional[Session],
+        filters=[],
+        **kwargs,
+    ) -> Tuple[int, Optional[datetime], bool]:
+        """
+        Cheap fingerprint of the records `list` (or `get`, with an id filter)
+        would return, without loading them: the number of visible records and
+        their latest updated_at (created_at for entities that are never
+        updated). Every insert, update and delete changes one of the two.
+
+        Args:
+            requester_id: The ID of the user making the request
+            db: Database session
+            filters: List of filter conditions
+            **kwargs: Column equality filters
+
+        Returns:
+            (count, latest, settled), where settled is False while the latest
+            change is too recent for a later write to be guaranteed a newer
+            timestamp (see StaticChangeFeed.settle_horizon)
+        """
+        from database.StaticPermissions import is_root_id
+
+        filters = list(filters)
+        if hasattr(cls, "deleted_at") and not is_root_id(requester_id):
+            filters.append(cls.deleted_at == None)
+        filters.append(
+            generate_permission_filter(requester_id, cls, db, PermissionType.VIEW)
+        )
+
+        stamp = cls.updated_at if hasattr(cls, "updated_at") else cls.created_at
+        query = db.query(
+            func.count(cls.id), func.max(stamp), func.max(stamp) <= settle_horizon()
+        )
+        for filter_condition in filters:
+            query = query.filter(filter_condition)
+        count, latest, settled = query.filter_by(**kwargs).one()
+        return count, latest, latest is None or bool(settled)
+
     @classmethod
     @with_session
     def list(
@@ -990,6 +1212,142 @@ class BaseMixin:
             fields=fields,
         )
 
+    @classmethod
+    @with_session
+    def list_page(
+        cls: Type[T],
+        requester_id: str,
+        db: Optional[Session],
+        first: int,
+        after: Optional[str] = None,
+        return_type: Literal["db", "dict", "dto", "model"] = "dict",
+        options=[],
+        filters=[],
+        override_dto: Optional[Type[DtoT]] = None,
+        **kwargs,
+    ) -> dict:
+        """
+        Page through the records `list` would return in primary key order.
+
+        Pages are keyset based: the cursor holds the last id returned, and
+        the next page starts after it using the primary key index, however
+        deep the client pages.
+
+        Args:
+            requester_id: The ID of the user making the request
+            db: Database session
+            first: Maximum number of records to return
+            after: Cursor returned by the previous page
+            return_type: The return type format ("db", "dict", "dto", "model")
+            options: List of query options
+            filters: List of filter conditions
+            override_dto: Optional DTO class override
+            **kwargs: Additional filter criteria
+
+        Returns:
+            A dict with the records (`items`), the cursor of the last one
+            (`cursor`, None for an empty page) and whether more records follow
+            (`has_more`)
+        """
+        filters = list(filters)
+        if after:
+            try:
+                filters.append(cls.id > decode_page_cursor(after))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        rows = cls.list(
+            requester_id,
+            db,
+            return_type="db",
+            options=options,
+            filters=filters,
+            order_by=[cls.id],
+            limit=first + 1,
+            **kwargs,
+        )
+        has_more = len(rows) > first
+        rows = rows[:first]
+        return {
+            "items": db_to_return_type(
+                rows, return_type, get_dto_class(cls, override_dto)
+            ),
+            "cursor": encode_page_cursor(rows[-1].id) if rows else None,
+            "has_more": has_more,
+        }
+
+
+@event.listens_for(BaseMixin, "instrument_class", propagate=True)
+def _register_search_index(mapper, cls):
+    """Attach the search index of entities that declare search_index."""
+    if cls.__dict__.get("search_index"):
+        register_search_index(cls)
+
+
+@event.listens_for(BaseMixin, "instrument_class", propagate=True)
+def _register_change_index(mapper, cls):
+    """Index the change feed of entities that track updated_at."""
+    if issubclass(cls, UpdateMixin):
+        register_change_index(cls)
+
+
+def _check_write_access(cls, entity, requester_id: str, action: str) -> None:
+    """
+    Enforce the system-flag and ownership rules for modifying or deleting
+    `entity`, raising 403 if `requester_id` may not.
+
+    Args:
+        action: "modify" or "delete"; deletes also require being the creator
+    """
+    from database.StaticPermissions import is_root_id, is_system_user_id
+
+    # Check for system flag - only ROOT_ID and SYSTEM_ID can write system-flagged tables
+    if hasattr(cls, "system") and getattr(cls, "system", False):
+        if not (is_root_id(requester_id) or is_system_user_id(requester_id)):
+            raise HTTPException(
+                status_code=403,
+                detail=f"Only system users can {action} {cls.__name__} records",
+            )
+
+    if not hasattr(entity, "created_by_user_id"):
+        return
+
+    # Check if the record was created by ROOT_ID or SYSTEM_ID
+    if entity.created_by_user_id == env("ROOT_ID") and not is_root_id(requester_id):
+        raise HTTPException(
+            status_code=403,
+            detail=f"Only ROOT can {action} records created by ROOT",
+        )
+
+    if entity.created_by_user_id == env("SYSTEM_ID") and not (
+        is_root_id(requester_id) or is_system_user_id(requester_id)
+    ):
+        raise HTTPException(
+            status_code=403,
+            detail=f"Only system users can {action} records created by SYSTEM",
+        )
+
+    if (
+        action == "delete"
+        and entity.created_by_user_id is not None
+        and entity.created_by_user_id != requester_id
+        and not (is_root_id(requester_id) or is_system_user_id(requester_id))
+    ):
+        raise HTTPException(
+            status_code=403,
+            detail=f"Only the creator can delete this record",
+        )
+
+
+def _is_unchanged(entity, key: str, value) -> bool:
+    """Whether setting `key` to `value` would leave `entity` as it is."""
+    if isinstance(value, ClauseElement):
+        return False
+    try:
+        return bool(getattr(entity, key) == value)
+    except Exception:
+        return False
+
 
 class UpdateMixin:
     """Adds update and delete hooks to the hooks registry"""
@@ -1070,31 +1428,7 @@ class UpdateMixin:
                 detail=f"Permission denied: Multiple {cls.__name__} matched query criteria",
             )
 
-        # Check for system flag - only ROOT_ID and SYSTEM_ID can modify system-flagged tables
-        if hasattr(cls, "system") and getattr(cls, "system", False):
-            if not (is_root_id(requester_id) or is_system_user_id(requester_id)):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Only system users can modify {cls.__name__} records",
-                )
-
-        # Check if the record was created by ROOT_ID or SYSTEM_ID
-        if hasattr(entity, "created_by_user_id"):
-            if entity.created_by_user_id == env("ROOT_ID") and not is_root_id(
-                requester_id
-            ):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Only ROOT can modify records created by ROOT",
-                )
-
-            if entity.created_by_user_id == env("SYSTEM_ID") and not (
-                is_root_id(requester_id) or is_system_user_id(requester_id)
-            ):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Only system users can modify records created by SYSTEM",
-                )
+        _check_write_access(cls, entity, requester_id, "modify")
 
         # Copy updated properties to avoid modifying the input
         updated = dict(new_properties)
@@ -1129,13 +1463,20 @@ class UpdateMixin:
                 # Extract updates from the hook dict
                 updated = {k: v for k, v in hook_dict.items()}
 
-        # Apply updates
+        # Skip the write entirely when no property would change
+        if all(
+            _is_unchanged(entity, key, value)
+            for key, value in updated.items()
+            if key not in ("updated_at", "updated_by_user_id")
+        ):
+            return db_to_return_type(entity, return_type, override_dto, fields)
+
+        # Apply updates; the UPDATE returns SQL-generated columns such as
+        # updated_at, so the result is complete without a refresh
         for key, value in updated.items():
             setattr(entity, key, value)
-
-        # Commit changes
-        db.commit()
-        db.refresh(entity)
+        db.flush()
+        result = commit_and_convert(db, entity, return_type, override_dto, fields)
 
         # Get hooks for after_update
         hooks = cls.hooks["update"]["after"]
@@ -1143,8 +1484,7 @@ class UpdateMixin:
             for hook in hooks:
                 hook(entity, updated, db)
 
-        # Convert to requested return type
-        return db_to_return_type(entity, return_type, override_dto, fields)
+        return result
 
     @declared_attr
     def deleted_at(cls):
@@ -1203,41 +1543,7 @@ class UpdateMixin:
                 status_code=500, detail=f"Multiple {cls.__name__} found"
             )
 
-        # Check for system flag - only ROOT_ID and SYSTEM_ID can delete from system-flagged tables
-        if hasattr(cls, "system") and getattr(cls, "system", False):
-            if not (is_root_id(requester_id) or is_system_user_id(requester_id)):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Only system users can delete {cls.__name__} records",
-                )
-
-        # Check if the record was created by ROOT_ID or SYSTEM_ID
-        if hasattr(entity, "created_by_user_id"):
-            if entity.created_by_user_id == env("ROOT_ID") and not is_root_id(
-                requester_id
-            ):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Only ROOT can delete records created by ROOT",
-                )
-
-            if entity.created_by_user_id == env("SYSTEM_ID") and not (
-                is_root_id(requester_id) or is_system_user_id(requester_id)
-            ):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Only system users can delete records created by SYSTEM",
-                )
-        if hasattr(entity, "created_by_user_id"):
-            if (
-                entity.created_by_user_id is not None
-                and entity.created_by_user_id != requester_id
-                and not (is_root_id(requester_id) or is_system_user_id(requester_id))
-            ):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Only the creator can delete this record",
-                )
+        _check_write_access(cls, entity, requester_id, "delete")
         # Get hooks for before_delete
         hooks = cls.hooks
         if "delete" in hooks and "before" in hooks["delete"]:
@@ -1261,6 +1567,225 @@ class UpdateMixin:
             for hook in hooks:
                 hook(entity, db)
 
+    @classmethod
+    def _load_for_write_many(cls, requester_id, db, ids, permission_type, action):
+        """
+        Load the entities in `ids` the requester may write with one
+        permission-filtered query, raising 404 listing the ids that are
+        missing or not permitted.
+        """
+        filters = [cls.id.in_(ids)]
+        if permission_type is not None:
+            filters.append(
+                generate_permission_filter(requester_id, cls, db, permission_type)
+            )
+        entities = {
+            entity.id: entity for entity in build_query(db, cls, filters=filters)
+        }
+
+        missing = [id for id in ids if id not in entities]
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "message": f"{cls.__name__} not found",
+                    "missing_ids": missing,
+                },
+            )
+
+        ordered = [entities[id] for id in ids]
+        denied = []
+        for entity in ordered:
+            try:
+                _check_write_access(cls, entity, requester_id, action)
+            except HTTPException as e:
+                denied.append(entity.id)
+                reason = e.detail
+        if denied:
+            raise HTTPException(
+                status_code=403,
+                detail={"message": reason, "denied_ids": denied},
+            )
+        return ordered
+
+    @classmethod
+    @with_session
+    def update_many(
+        cls: Type[T],
+        requester_id: str,
+        db: Optional[Session],
+        ids: List[str],
+        new_properties,
+        return_type: Literal["db", "dict", "dto", "model"] = "dict",
+        override_dto: Optional[Type[DtoT]] = None,
+        check_permissions=True,
+    ) -> List[T]:
+        """
+        Apply the same properties to every entity in `ids` with a single
+        UPDATE ... WHERE id IN (...) RETURNING statement.
+
+        All or nothing: if any id is missing, not permitted or protected, no
+        row is changed. Results are returned in the order of `ids`.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+
+        entities = cls._load_for_write_many(
+            requester_id,
+            db,
+            ids,
+            PermissionType.EDIT if check_permissions else None,
+            "modify",
+        )
+
+        # Ensure created_by_user_id and id cannot be modified
+        updated = {
+            key: value
+            for key, value in new_properties.items()
+            if key not in ("created_by_user_id", "id")
+        }
+        if hasattr(cls, "updated_by_user_id"):
+            updated["updated_by_user_id"] = requester_id
+        if hasattr(cls, "updated_at"):
+            updated["updated_at"] = func.now()
+
+        # Before hooks see the shared property dict once
+        before_hooks = cls.hooks["update"]["before"]
+        if before_hooks:
+            hook_dict = HookDict(updated)
+            for hook in before_hooks:
+                hook(hook_dict, db)
+            updated = {k: v for k, v in hook_dict.items()}
+
+        # The returned rows refresh the already loaded instances in place
+        db.scalars(
+            sql_update(cls).where(cls.id.in_(ids)).values(**updated).returning(cls),
+            execution_options={"populate_existing": True},
+        ).all()
+        result = commit_and_convert(db, entities, return_type, override_dto)
+
+        after_hooks = cls.hooks["update"]["after"]
+        for entity in entities if after_hooks else []:
+            for hook in after_hooks:
+                hook(entity, updated, db)
+
+        return result
+
+    @classmethod
+    @with_session
+    def delete_many(
+        cls: Type[T],
+        requester_id: str,
+        db: Optional[Session],
+        ids: List[str],
+        check_permissions=True,
+    ) -> None:
+        """
+        Soft delete every entity in `ids` with a single UPDATE ... WHERE id IN
+        (...) statement.
+
+        All or nothing: if any id is missing, not permitted or protected, no
+        row is deleted.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return
+
+        entities = cls._load_for_write_many(
+            requester_id,
+            db,
+            ids,
+            PermissionType.DELETE if check_permissions else None,
+            "delete",
+        )
+
+        before_hooks = cls.hooks["delete"]["before"]
+        for entity in entities if before_hooks else []:
+            for hook in before_hooks:
+                hook(entity, db)
+
+        deleted = {}
+        if hasattr(cls, "deleted_at"):
+            deleted["deleted_at"] = func.now()
+        if hasattr(cls, "deleted_by_user_id"):
+            deleted["deleted_by_user_id"] = requester_id
+        db.execute(
+            sql_update(cls).where(cls.id.in_(ids)).values(**deleted),
+            execution_options={"synchronize_session": False},
+        )
+        db.commit()
+
+        after_hooks = cls.hooks["delete"]["after"]
+        for entity in entities if after_hooks else []:
+            for hook in after_hooks:
+                hook(entity, db)
+
+    @classmethod
+    @with_session
+    def list_changes(
+        cls: Type[T],
+        requester_id: str,
+        db: Optional[Session],
+        since: Optional[str] = None,
+        limit: int = DEFAULT_CHANGE_PAGE_SIZE,
+        return_type: Literal["db", "dict", "dto", "model"] = "dict",
+        options=[],
+        override_dto: Optional[Type[DtoT]] = None,
+    ) -> dict:
+        """
+        Page through the records created, updated or soft deleted after the
+        cursor `since` (from the beginning if omitted), oldest change first.
+        See StaticChangeFeed.py.
+
+        Args:
+            requester_id: The ID of the user making the request
+            db: Database session
+            since: Cursor returned by the previous page
+            limit: Maximum number of changes to return
+            return_type: The return type format ("db", "dict", "dto", "model")
+            options: List of query options
+            override_dto: Optional DTO class override
+
+        Returns:
+            A dict with the changed records that still exist (`changed`), the
+            ids of the soft deleted ones (`deleted_ids`), the cursor to resume
+            from (`cursor`, `since` if there were no changes) and whether more
+            changes are waiting (`has_more`)
+        """
+        try:
+            filters = change_feed_filters(cls, since)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Soft deleted records are reported as tombstones, so unlike list
+        # they are not filtered out; the permission filter still applies
+        filters.append(
+            generate_permission_filter(requester_id, cls, db, PermissionType.VIEW)
+        )
+        query = db.query(cls, change_feed_position(cls))
+        for filter_condition in filters:
+            query = query.filter(filter_condition)
+        for option in options:
+            query = query.options(option)
+        rows = query.order_by(*change_feed_order(cls)).limit(limit + 1).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        cursor = encode_cursor(rows[-1][1], rows[-1][0].id) if rows else since
+
+        changed = [entity for entity, _ in rows if entity.deleted_at is None]
+        return {
+            "changed": db_to_return_type(
+                changed, return_type, get_dto_class(cls, override_dto)
+            ),
+            "deleted_ids": [
+                str(entity.id) for entity, _ in rows if entity.deleted_at is not None
+            ],
+            "cursor": cursor,
+            "has_more": has_more,
+        }
+
 
 class ParentMixin:
     @declared_attr
@@ -1,13 +1,14 @@
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
-from sqlalchemy import UUID, Column, String, create_engine
+from pydantic import BaseModel
+from sqlalchemy import UUID, Column, String, create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import load_only, sessionmaker
 
 from database.AbstractDatabaseEntity import (
     BaseMixin,
@@ -19,6 +20,8 @@ from database.AbstractDatabaseEntity import (
     build_query,
     create_reference_mixin,
     db_to_return_type,
+    decode_page_cursor,
+    encode_page_cursor,
     get_hooks_for_class,
 )
 from database.AbstractDatabaseEntity import (
@@ -508,6 +511,9 @@ def test_create_method(
         assert entity["name"] == "Test Entity"
         assert entity["description"] == "Test Description"
         assert entity["created_by_user_id"] == test_user_id
+        # Columns left unset are present in the result without a refresh
+        assert "user_id" in entity and entity["user_id"] is None
+        assert entity["created_at"] is not None
 
         # Entity should be in database
         db_entity = (
@@ -694,6 +700,103 @@ def test_get_method(
     assert "could not find" in exc_info.value.detail.lower()
 
 
+def test_get_many_method(
+    patched_permissions,
+    patched_permission_types,
+    test_user_id,
+    db_session,
+    db_engine,
+    mock_permission_filter,
+):
+    """Test getting many records by ID with one query"""
+    entities = [TestBaseEntity(name=f"Get Many {i}") for i in range(3)]
+    db_session.add_all(entities)
+    db_session.commit()
+    ids = [entities[2].id, "missing-id", entities[0].id]
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    try:
+        results = TestBaseEntity.get_many(test_user_id, db_session, ids)
+    finally:
+        event.remove(db_engine, "before_cursor_execute", record)
+
+    # Results follow the request order, with None for ids that were not found
+    assert [result and result["name"] for result in results] == [
+        "Get Many 2",
+        None,
+        "Get Many 0",
+    ]
+    assert len(statements) == 1
+    assert mock_permission_filter.call_count == 1
+
+    with_fields = TestBaseEntity.get_many(
+        test_user_id, db_session, [entities[1].id], fields=["name"]
+    )
+    assert with_fields == [{"name": "Get Many 1"}]
+    assert TestBaseEntity.get_many(test_user_id, db_session, []) == []
+
+
+def test_projected_dto_conversion(
+    test_user_id, db_session, db_engine, mock_permission_filter
+):
+    """Entities loaded with load_only become partial DTOs without extra queries"""
+
+    class EntityDTO(BaseModel):
+        id: str
+        name: str
+        description: Optional[str]
+        created_at: datetime
+
+    db_session.add_all(
+        [TestBaseEntity(name=f"Projected {i}", description="d") for i in range(3)]
+    )
+    db_session.commit()
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    try:
+        results = TestBaseEntity.list(
+            test_user_id,
+            db_session,
+            return_type="dto",
+            override_dto=EntityDTO,
+            options=[load_only(TestBaseEntity.name)],
+            filters=[TestBaseEntity.name.like("Projected %")],
+        )
+    finally:
+        event.remove(db_engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert "description" not in statements[0]
+    assert sorted(result.name for result in results) == [
+        "Projected 0",
+        "Projected 1",
+        "Projected 2",
+    ]
+    assert all(result.model_fields_set == {"id", "name"} for result in results)
+
+    # Fully loaded entities are still validated
+    db_session.expunge_all()
+    full = TestBaseEntity.get(
+        test_user_id,
+        db_session,
+        return_type="dto",
+        override_dto=EntityDTO,
+        id=results[0].id,
+    )
+    assert full.description == "d"
+    assert isinstance(full.created_at, datetime)
+
+
 def test_list_method(db_session):
     """Test the list method of the entity"""
     # Clear the table to ensure test isolation
@@ -838,6 +941,43 @@ def test_update_method(
                 TestUpdateEntity.hooks["update"]["after"].remove(after_hook)
 
 
+def test_update_single_round_trip(
+    patched_permissions, patched_permission_types, test_user_id, db_session, db_engine
+):
+    """Updates write once with RETURNING and skip the write when nothing changed"""
+    entity = TestUpdateEntity(name="Round Trip", description="Original")
+    db_session.add(entity)
+    db_session.commit()
+    db_session.refresh(entity)
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    try:
+        with patch("database.AbstractDatabaseEntity.build_query") as mock_build_query:
+            mock_build_query.return_value.one.return_value = entity
+
+            updated = TestUpdateEntity.update(
+                test_user_id, db_session, {"description": "Changed"}, id=entity.id
+            )
+            assert updated["description"] == "Changed"
+            assert updated["updated_at"] is not None
+            assert len(statements) == 1
+            assert statements[0].startswith("UPDATE") and "RETURNING" in statements[0]
+
+            statements.clear()
+            unchanged = TestUpdateEntity.update(
+                test_user_id, db_session, {"description": "Changed"}, id=entity.id
+            )
+            assert unchanged["description"] == "Changed"
+            assert not any(statement.startswith("UPDATE") for statement in statements)
+    finally:
+        event.remove(db_engine, "before_cursor_execute", record)
+
+
 def test_delete_method(
     patched_permissions, patched_permission_types, test_user_id, db_session
 ):
@@ -893,6 +1033,208 @@ def test_delete_method(
             TestUpdateEntity.hooks["delete"]["after"].remove(after_hook)
 
 
+def test_update_many_method(
+    patched_permissions, patched_permission_types, test_user_id, db_session, db_engine
+):
+    """Batch updates write every row with one statement, or none of them"""
+    entities = [TestUpdateEntity(name=f"Batch {i}") for i in range(3)]
+    db_session.add_all(entities)
+    db_session.commit()
+    ids = [entity.id for entity in reversed(entities)]
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    try:
+        updated = TestUpdateEntity.update_many(
+            test_user_id,
+            db_session,
+            ids,
+            {"description": "Batched"},
+            check_permissions=False,
+        )
+    finally:
+        event.remove(db_engine, "before_cursor_execute", record)
+
+    assert [item["id"] for item in updated] == ids
+    assert all(item["description"] == "Batched" for item in updated)
+    assert all(item["updated_by_user_id"] == test_user_id for item in updated)
+    writes = [s for s in statements if s.startswith("UPDATE")]
+    assert len(writes) == 1 and "RETURNING" in writes[0]
+
+    # A missing id rejects the whole batch
+    with pytest.raises(HTTPException) as exc_info:
+        TestUpdateEntity.update_many(
+            test_user_id,
+            db_session,
+            ids + ["missing-id"],
+            {"description": "Nope"},
+            check_permissions=False,
+        )
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail["missing_ids"] == ["missing-id"]
+    assert all(
+        entity.description == "Batched"
+        for entity in db_session.query(TestUpdateEntity).all()
+    )
+
+
+def test_delete_many_method(
+    patched_permissions, patched_permission_types, test_user_id, db_session, db_engine
+):
+    """Batch deletes soft delete every row, or none of them"""
+    entities = [TestUpdateEntity(name=f"Batch Delete {i}") for i in range(3)]
+    db_session.add_all(entities)
+    db_session.commit()
+    ids = [entity.id for entity in entities]
+
+    protected = TestUpdateEntity(name="Protected", created_by_user_id="other")
+    db_session.add(protected)
+    db_session.commit()
+    protected_id = protected.id
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # Only the creator may delete, so the protected entity rejects the batch
+    # before anything is written
+    event.listen(db_engine, "before_cursor_execute", record)
+    try:
+        with pytest.raises(HTTPException) as exc_info:
+            TestUpdateEntity.delete_many(
+                test_user_id, db_session, ids + [protected_id], check_permissions=False
+            )
+    finally:
+        event.remove(db_engine, "before_cursor_execute", record)
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.detail["denied_ids"] == [protected_id]
+    assert not any(statement.startswith("UPDATE") for statement in statements)
+
+    entities = [TestUpdateEntity(name=f"Batch Delete {i}") for i in range(3)]
+    db_session.add_all(entities)
+    db_session.commit()
+    TestUpdateEntity.delete_many(
+        test_user_id,
+        db_session,
+        [entity.id for entity in entities],
+        check_permissions=False,
+    )
+    for entity in entities:
+        db_session.refresh(entity)
+        assert entity.deleted_at is not None
+        assert entity.deleted_by_user_id == test_user_id
+
+
+def test_list_changes_method(test_user_id, db_session, mock_permission_filter):
+    """The change feed pages through writes by (updated_at, id)"""
+    t0 = datetime(2020, 1, 1)
+    tied = [TestUpdateEntity(name=f"Tied {i}", updated_at=t0) for i in range(3)]
+    later = TestUpdateEntity(name="Later", updated_at=t0 + timedelta(seconds=1))
+    unsettled = TestUpdateEntity(name="Unsettled")
+    db_session.add_all(tied + [later, unsettled])
+    db_session.commit()
+    tied_ids = sorted(entity.id for entity in tied)
+
+    first = TestUpdateEntity.list_changes(test_user_id, db_session, limit=2)
+    assert [entity["id"] for entity in first["changed"]] == tied_ids[:2]
+    assert first["has_more"]
+
+    # Rows sharing a timestamp are split across pages by id
+    second = TestUpdateEntity.list_changes(
+        test_user_id, db_session, since=first["cursor"], limit=2
+    )
+    assert [entity["id"] for entity in second["changed"]] == [tied_ids[2], later.id]
+    assert not second["has_more"]
+
+    # Nothing new: the cursor stays put and the unsettled write is held back
+    third = TestUpdateEntity.list_changes(
+        test_user_id, db_session, since=second["cursor"]
+    )
+    assert third["changed"] == [] and third["deleted_ids"] == []
+    assert third["cursor"] == second["cursor"]
+
+    # Soft deletes bump updated_at and come back as tombstones
+    TestUpdateEntity.delete_many(
+        test_user_id, db_session, [later.id], check_permissions=False
+    )
+    with patch("database.StaticChangeFeed.CHANGE_FEED_SETTLE_SECONDS", 0):
+        fourth = TestUpdateEntity.list_changes(
+            test_user_id, db_session, since=second["cursor"]
+        )
+    assert fourth["deleted_ids"] == [later.id]
+    assert [entity["id"] for entity in fourth["changed"]] == [unsettled.id]
+
+    with pytest.raises(HTTPException) as exc_info:
+        TestUpdateEntity.list_changes(test_user_id, db_session, since="not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+def test_list_page_method(test_user_id, db_session, mock_permission_filter):
+    """Keyset pages follow the primary key and reject foreign cursors"""
+    entities = [TestBaseEntity(name=f"Paged {i}") for i in range(5)]
+    db_session.add_all(entities)
+    db_session.commit()
+    ids = sorted(entity.id for entity in entities)
+    filters = [TestBaseEntity.name.like("Paged %")]
+
+    first = TestBaseEntity.list_page(test_user_id, db_session, 2, filters=filters)
+    assert [entity["id"] for entity in first["items"]] == ids[:2]
+    assert first["cursor"] == encode_page_cursor(ids[1])
+    assert first["has_more"]
+
+    second = TestBaseEntity.list_page(
+        test_user_id, db_session, 3, after=first["cursor"], filters=filters
+    )
+    assert [entity["id"] for entity in second["items"]] == ids[2:]
+    assert not second["has_more"]
+    assert len(filters) == 1
+
+    assert decode_page_cursor(encode_page_cursor(ids[0])) == ids[0]
+    with pytest.raises(HTTPException) as exc_info:
+        TestBaseEntity.list_page(test_user_id, db_session, 2, after="not-a-cursor!")
+    assert exc_info.value.status_code == 400
+
+
+def test_fingerprint_method(test_user_id, db_session, mock_permission_filter):
+    """Fingerprints count visible rows and track their latest change"""
+    t0 = datetime(2020, 1, 1)
+    entities = [
+        TestUpdateEntity(name="First", updated_at=t0),
+        TestUpdateEntity(name="Second", updated_at=t0 + timedelta(seconds=1)),
+    ]
+    db_session.add_all(entities)
+    db_session.commit()
+
+    assert TestUpdateEntity.fingerprint(test_user_id, db_session) == (
+        2,
+        t0 + timedelta(seconds=1),
+        True,
+    )
+    assert TestUpdateEntity.fingerprint(
+        test_user_id, db_session, filters=[TestUpdateEntity.id == entities[0].id]
+    ) == (1, t0, True)
+
+    # A write in the settle window makes the fingerprint unreliable for now
+    db_session.add(TestUpdateEntity(name="Fresh"))
+    db_session.commit()
+    count, _, settled = TestUpdateEntity.fingerprint(test_user_id, db_session)
+    assert count == 3 and not settled
+
+
+def test_change_feed_index():
+    """UpdateMixin tables get the (updated_at, id) index"""
+    indexes = {
+        index.name: [column.name for column in index.columns]
+        for index in TestUpdateEntity.__table__.indexes
+    }
+    assert indexes["ix_test_update_entity_updated_at_id"] == ["updated_at", "id"]
+
+
 # Test ParentMixin functionality
 def test_parent_mixin_columns():
     """Test the ParentMixin columns"""
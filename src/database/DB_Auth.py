@@ -75,6 +75,7 @@ class User(Base, BaseMixin, UpdateMixin, ImageMixin):
         default=True,
         comment="Whether this user account is active and allowed to log in",
     )
+    search_index = ["email", "username", "display_name"]
     # TODO #44 Get the base domain from APP_URI (no https, paths or subdomains).
     seed_list = [
         {
@@ -683,7 +684,7 @@ class Permission(
             )
 
         # Now use the standard update logic but without the system user checks
-        from database.AbstractDatabaseEntity import db_to_return_type, validate_fields
+        from database.AbstractDatabaseEntity import commit_and_convert, validate_fields
         from lib.Environment import env
 
         # Validate fields parameter
@@ -700,16 +701,12 @@ class Permission(
         if hasattr(cls, "updated_by_user_id"):
             updated["updated_by_user_id"] = requester_id
 
-        # Apply updates
+        # Apply updates; generated columns come back with the UPDATE
         for key, value in updated.items():
             setattr(entity, key, value)
+        db.flush()
 
-        # Commit changes
-        db.commit()
-        db.refresh(entity)
-
-        # Convert to requested return type
-        return db_to_return_type(entity, return_type, override_dto, fields)
+        return commit_and_convert(db, entity, return_type, override_dto, fields)
 
     @classmethod
     def create(
@@ -768,16 +765,14 @@ class Permission(
         # Add created_by_user_id if the entity has this column
         data["created_by_user_id"] = requester_id
 
-        # Create the entity
+        # Create the entity; generated columns come back with the INSERT
         entity = cls(**data)
         db.add(entity)
-        db.commit()
-        db.refresh(entity)
+        db.flush()
 
-        # Convert to requested return type
-        from database.AbstractDatabaseEntity import db_to_return_type
+        from database.AbstractDatabaseEntity import commit_and_convert
 
-        return db_to_return_type(entity, return_type, override_dto, fields)
+        return commit_and_convert(db, entity, return_type, override_dto, fields)
 
 
 class UserTeam(Base, BaseMixin, UpdateMixin, UserRefMixin, TeamRefMixin, RoleRefMixin):
@@ -924,6 +919,36 @@ class AuthSession(Base, BaseMixin, UpdateMixin, UserRefMixin):
     )
 
 
+class ApiKey(Base, BaseMixin, UpdateMixin, UserRefMixin, TeamRefMixin.Optional):
+    __tablename__ = "api_keys"
+    __table_args__ = {
+        "comment": "Scoped API keys for machine-to-machine authentication"
+    }
+
+    name = Column(String, nullable=False, comment="Human-readable name of the key")
+    prefix = Column(
+        String,
+        nullable=False,
+        unique=True,
+        index=True,
+        comment="Public identifier embedded in the key, used to look it up",
+    )
+    key_hash = Column(
+        String,
+        nullable=False,
+        comment="Keyed HMAC-SHA256 of the secret part of the key",
+    )
+    scopes = Column(
+        String,
+        nullable=True,
+        comment="Space-separated scopes (e.g. 'providers:view'); empty grants the owner's full access",
+    )
+    expires_at = Column(DateTime, nullable=True, comment="When this key expires")
+    revoked = Column(
+        Boolean, default=False, comment="Whether this key has been explicitly revoked"
+    )
+
+
 class RateLimitPolicy(
     Base,
     BaseMixin,
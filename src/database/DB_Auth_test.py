@@ -6,6 +6,7 @@ from faker import Faker
 from AbstractTest import ParentEntity
 from database.AbstractDBTest import AbstractDBTest
 from database.DB_Auth import (
+    ApiKey,
     AuthSession,
     FailedLoginAttempt,
     Invitation,
@@ -332,6 +333,24 @@ class TestAuthSession(AbstractDBTest):
     unique_field = "session_key"
 
 
+class TestApiKey(AbstractDBTest):
+    class_under_test = ApiKey
+    create_fields = {
+        "user_id": "",  # Will be populated in setup
+        "name": "Test API Key",
+        "prefix": faker.uuid4,
+        "key_hash": "test_hash",
+        "scopes": "providers:view",
+    }
+    update_fields = {
+        "name": "Updated API Key",
+        "scopes": "providers:*",
+        "revoked": True,
+    }
+    unique_field = "prefix"
+    unique_fields = ["name", "prefix"]
+
+
 class TestRateLimitPolicy(AbstractDBTest):
     class_under_test = RateLimitPolicy
     create_fields = {
@@ -26,6 +26,7 @@ class Extension(Base, BaseMixin, UpdateMixin):
     __tablename__ = "extensions"
     name = Column(Text, nullable=False)
     description = Column(Text, nullable=True, default="")
+    search_index = ["name"]
     __table_args__ = {
         "comment": "An Extension represents a third-party integration. This is SEPARATE from an oauth link."
     }
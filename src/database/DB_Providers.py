@@ -16,6 +16,7 @@ class Provider(Base, BaseMixin, UpdateMixin):
     system = True
     name = Column(Text, nullable=False)
     friendly_name = Column(Text, nullable=True)
+    search_index = ["name", "friendly_name"]
     agent_settings_json = Column(Text, nullable=True)
     # Define a class-specific seed_list to avoid sharing with other BaseMixin classes
     seed_id = "SYSTEM_ID"
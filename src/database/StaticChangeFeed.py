@@ -0,0 +1,137 @@
+"""
+Change feed: incremental sync of entities by `(updated_at, id)`.
+
+Every `UpdateMixin` entity stamps `updated_at` on insert, update and soft
+delete, so the rows changed since a point in time are a range scan over an
+index on `(updated_at, id)`. `UpdateMixin.list_changes` walks that range in
+keyset order and hands back an opaque cursor encoding the last
+`(updated_at, id)` it returned; passing the cursor back resumes right after
+it, so clients sync in small deltas instead of re-reading whole lists.
+
+`updated_at` is stamped by the database when the write executes, not when it
+commits, so a slow transaction can commit rows with a timestamp the feed has
+already passed. The feed therefore stops `CHANGE_FEED_SETTLE_SECONDS` short
+of the current time; only writes in transactions running longer than that
+can be missed.
+
+Tables created with `Base.metadata.create_all` get the index from the model.
+Alembic migrations use `change_index_name` with an explicit table list so the
+revision does not depend on later model changes.
+"""
+
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple, Union
+
+from sqlalchemy import Index, String, and_, func, or_, type_coerce
+
+from database.Base import DATABASE_TYPE
+
+# Changes younger than this are held back until concurrent writes settle
+CHANGE_FEED_SETTLE_SECONDS = 2
+
+# Number of changes returned by one page of the feed unless asked otherwise
+DEFAULT_CHANGE_PAGE_SIZE = 100
+
+_CURSOR_SEPARATOR = "|"
+
+
+def change_index_name(tablename: str) -> str:
+    """Name of the `(updated_at, id)` index backing the change feed of a table."""
+    return f"ix_{tablename}_updated_at_id"
+
+
+def register_change_index(cls) -> None:
+    """Attach the change feed index to the table of `cls`."""
+    table = cls.__table__
+    name = change_index_name(table.name)
+    if "updated_at" not in table.c or any(i.name == name for i in table.indexes):
+        return
+    Index(name, table.c.updated_at, table.c.id)
+
+
+def change_feed_position(cls):
+    """
+    `updated_at` as compared by the feed. SQLite stores timestamps as text in
+    whatever precision they were written, so positions are kept and compared
+    as the stored text rather than round-tripped through datetime.
+    """
+    if DATABASE_TYPE == "sqlite":
+        return type_coerce(cls.updated_at, String)
+    return cls.updated_at
+
+
+def encode_cursor(updated_at: Union[datetime, str], id: str) -> str:
+    """Encode a feed position as an opaque, URL-safe cursor."""
+    if isinstance(updated_at, datetime):
+        updated_at = updated_at.isoformat()
+    raw = f"{updated_at}{_CURSOR_SEPARATOR}{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Union[datetime, str], str]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    updated_at, separator, id = raw.rpartition(_CURSOR_SEPARATOR)
+    if not separator or not updated_at or not id:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if DATABASE_TYPE == "sqlite":
+        return updated_at, id
+    return datetime.fromisoformat(updated_at), id
+
+
+def settle_horizon():
+    """
+    SQL expression for the newest `updated_at` considered settled: writes
+    stamped after it may still be joined by slower concurrent ones.
+    """
+    if DATABASE_TYPE == "sqlite":
+        return func.datetime("now", f"-{CHANGE_FEED_SETTLE_SECONDS} seconds")
+    return func.now() - timedelta(seconds=CHANGE_FEED_SETTLE_SECONDS)
+
+
+def is_settled(stamp: datetime) -> bool:
+    """
+    Whether a loaded `updated_at` is older than the settle horizon, checked
+    without a query. Only SQLite stamps whole seconds, so only there can a
+    later write share the stamp; its clock is UTC.
+    """
+    if DATABASE_TYPE != "sqlite":
+        return True
+    now = datetime.now(timezone.utc)
+    if stamp.tzinfo is None:
+        now = now.replace(tzinfo=None)
+    return stamp <= now - timedelta(seconds=CHANGE_FEED_SETTLE_SECONDS)
+
+
+def change_feed_filters(cls, since: Optional[str] = None) -> list:
+    """
+    Filters selecting the changes of `cls` after the cursor `since` (or all
+    of them), up to the settle horizon.
+
+    Raises:
+        ValueError: If `since` is not a valid cursor
+    """
+    position = change_feed_position(cls)
+    filters = [cls.updated_at != None, position <= settle_horizon()]
+
+    if since:
+        updated_at, id = decode_cursor(since)
+        filters.append(
+            or_(position > updated_at, and_(position == updated_at, cls.id > id))
+        )
+    return filters
+
+
+def change_feed_order(cls) -> list:
+    """Keyset order of the change feed, matching the `(updated_at, id)` index."""
+    return [change_feed_position(cls), cls.id]
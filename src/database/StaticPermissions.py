@@ -1,7 +1,8 @@
 import inspect
 import logging
+from contextvars import ContextVar
 from enum import Enum as PyEnum  # Import Python Enum
-from typing import Optional, Type, TypeVar
+from typing import FrozenSet, Iterable, Optional, Type, TypeVar, Union
 
 from sqlalchemy import (  # Import inspect and Integer
     Integer,
@@ -29,6 +30,53 @@ ROOT_ID = env("ROOT_ID")
 SYSTEM_ID = env("SYSTEM_ID")
 TEMPLATE_ID = env("TEMPLATE_ID")
 
+# Scopes of the API key authenticating the current request. None means the
+# request is not scope-restricted (JWT, Basic auth or an unscoped API key).
+api_key_scopes: ContextVar[Optional[FrozenSet[str]]] = ContextVar(
+    "api_key_scopes", default=None
+)
+
+
+def scopes_allow(
+    scopes: Optional[Iterable[str]],
+    resource_type: str,
+    required_permission_level: Union["PermissionType", str, None] = None,
+) -> bool:
+    """
+    Check whether a set of API key scopes grants an operation on a table.
+
+    Scopes take the form "<table>:<operation>", where operation is one of
+    view, execute, copy, edit, delete, share or create, and either side may
+    be "*". A bare "<table>" or "*" grants every operation.
+
+    Args:
+        scopes: The granted scopes, or None for an unrestricted principal
+        resource_type: The table name of the resource being accessed
+        required_permission_level: PermissionType or operation name (default: view)
+
+    Returns:
+        bool: True if the operation is within scope
+    """
+    if scopes is None:
+        return True
+
+    if required_permission_level is None:
+        operation = "view"
+    elif isinstance(required_permission_level, PermissionType):
+        operation = required_permission_level.value.replace("can_", "")
+    else:
+        operation = str(required_permission_level).replace("can_", "")
+
+    candidates = {
+        "*",
+        "*:*",
+        resource_type,
+        f"{resource_type}:*",
+        f"*:{operation}",
+        f"{resource_type}:{operation}",
+    }
+    return not candidates.isdisjoint(scopes)
+
 
 def is_system_id(user_id: str) -> bool:
     """Check if the user ID is any of the system IDs."""
@@ -887,6 +935,33 @@ def _get_admin_accessible_team_ids_cte(
     return recursive_cte
 
 
+def acl_fingerprint(db: Session) -> Optional[tuple]:
+    """
+    Cheap fingerprint of the state the permission filter depends on: the row
+    count and latest change of the permission, team, role and membership
+    tables. It changes whenever any of them is written to, so it can be
+    folded into cache validators of permission-filtered results.
+
+    Returns None while the latest change is too recent to be relied on (see
+    StaticChangeFeed.settle_horizon).
+    """
+    # Local import to break cycle
+    from database.DB_Auth import Permission, Role, Team, UserTeam
+    from database.StaticChangeFeed import settle_horizon
+
+    aggregates = []
+    settled = []
+    for table_cls in (Permission, Role, Team, UserTeam):
+        latest = func.max(table_cls.updated_at)
+        aggregates.append(select(func.count(table_cls.id)).scalar_subquery())
+        aggregates.append(select(latest).scalar_subquery())
+        settled.append(select(latest <= settle_horizon()).scalar_subquery())
+    row = db.execute(select(*aggregates, *settled)).one()
+    if any(flag is not None and not flag for flag in row[len(aggregates) :]):
+        return None
+    return tuple(row[: len(aggregates)])
+
+
 def _get_role_hierarchy_map(db: Session) -> dict:
     """
     Get the role hierarchy map {role_name: level}.
@@ -1112,6 +1187,12 @@ def generate_permission_filter(
     if required_permission_level is None:
         required_permission_level = PermissionType.VIEW
 
+    # API key scopes restrict the top-level resource, including for ROOT
+    if _visited_classes is None and not scopes_allow(
+        api_key_scopes.get(), resource_cls.__tablename__, required_permission_level
+    ):
+        return false()
+
     # 0. Root User Check
     if is_root_id(user_id):
         # Root can see everything, including deleted records
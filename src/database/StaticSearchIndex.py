@@ -0,0 +1,199 @@
+"""
+Opt-in substring search indexes for string columns.
+
+Entities declare the columns to index with a `search_index` class attribute:
+
+    class User(Base, BaseMixin, UpdateMixin):
+        search_index = ["email", "display_name"]
+
+On PostgreSQL each column gets a `pg_trgm` GIN index, which serves the
+`ILIKE '%term%'` filters produced by the search DSL directly. On SQLite the
+table gets an external-content FTS5 shadow table using the trigram tokenizer,
+kept in sync by triggers; `search_index_filter` routes substring filters on
+indexed columns through it.
+
+Tables created with `Base.metadata.create_all` get their indexes through DDL
+events. Alembic migrations use `search_index_ddl` / `drop_search_index_ddl`
+with an explicit column list so the revision does not depend on later model
+changes.
+"""
+
+import logging
+import re
+from typing import List, Sequence
+
+from sqlalchemy import DDL, Index, event, literal_column, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import column as sql_column
+from sqlalchemy.sql import table as sql_table
+
+from database.Base import DATABASE_TYPE
+
+# Trigram indexes cannot narrow down terms shorter than one trigram
+MIN_INDEXED_TERM_LENGTH = 3
+
+# FTS5 creates <name>_data, _idx, _content, _docsize and _config tables
+_SEARCH_TABLE_PATTERN = re.compile(r"_search(_data|_idx|_content|_docsize|_config)?$")
+
+
+def search_table_name(tablename: str) -> str:
+    """Name of the SQLite FTS5 shadow table for `tablename`."""
+    return f"{tablename}_search"
+
+
+def is_search_table(name: str) -> bool:
+    """Whether `name` is an FTS5 shadow table (or one of its internal tables)."""
+    return _SEARCH_TABLE_PATTERN.search(name) is not None
+
+
+def trigram_index_name(tablename: str, column_name: str) -> str:
+    """Name of the PostgreSQL trigram index for a column."""
+    return f"ix_{tablename}_{column_name}_trgm"
+
+
+def _sqlite_ddl(tablename: str, columns: Sequence[str]) -> List[str]:
+    search_table = search_table_name(tablename)
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{name}" for name in columns)
+    old_values = ", ".join(f"old.{name}" for name in columns)
+    delete_old = (
+        f"INSERT INTO {search_table}({search_table}, rowid, {names}) "
+        f"VALUES ('delete', old.rowid, {old_values});"
+    )
+    insert_new = (
+        f"INSERT INTO {search_table}(rowid, {names}) "
+        f"VALUES (new.rowid, {new_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {search_table} USING fts5("
+        f"{names}, content='{tablename}', content_rowid='rowid', "
+        f"tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {search_table}_ai AFTER INSERT ON "
+        f"{tablename} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {search_table}_ad AFTER DELETE ON "
+        f"{tablename} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {search_table}_au AFTER UPDATE OF {names} "
+        f"ON {tablename} BEGIN {delete_old} {insert_new} END",
+        # Index rows that existed before the shadow table was created
+        f"INSERT INTO {search_table}({search_table}) VALUES ('rebuild')",
+    ]
+
+
+def _sqlite_drop_ddl(tablename: str) -> List[str]:
+    search_table = search_table_name(tablename)
+    return [
+        f"DROP TRIGGER IF EXISTS {search_table}_ai",
+        f"DROP TRIGGER IF EXISTS {search_table}_ad",
+        f"DROP TRIGGER IF EXISTS {search_table}_au",
+        f"DROP TABLE IF EXISTS {search_table}",
+    ]
+
+
+def _postgres_ddl(tablename: str, columns: Sequence[str]) -> List[str]:
+    return ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+        f"CREATE INDEX IF NOT EXISTS {trigram_index_name(tablename, name)} "
+        f"ON {tablename} USING gin ({name} gin_trgm_ops)"
+        for name in columns
+    ]
+
+
+def _postgres_drop_ddl(tablename: str, columns: Sequence[str]) -> List[str]:
+    return [
+        f"DROP INDEX IF EXISTS {trigram_index_name(tablename, name)}"
+        for name in columns
+    ]
+
+
+def search_index_ddl(tablename: str, columns: Sequence[str], dialect: str) -> List[str]:
+    """DDL statements that create the search index for `columns` on `dialect`."""
+    if dialect == "sqlite":
+        return _sqlite_ddl(tablename, columns)
+    if dialect == "postgresql":
+        return _postgres_ddl(tablename, columns)
+    return []
+
+
+def drop_search_index_ddl(
+    tablename: str, columns: Sequence[str], dialect: str
+) -> List[str]:
+    """DDL statements that drop the search index for `columns` on `dialect`."""
+    if dialect == "sqlite":
+        return _sqlite_drop_ddl(tablename)
+    if dialect == "postgresql":
+        return _postgres_drop_ddl(tablename, columns)
+    return []
+
+
+def register_search_index(cls) -> None:
+    """Attach the search index declared by `cls.search_index` to its table."""
+    table = cls.__table__
+    columns = list(cls.search_index)
+    missing = [name for name in columns if name not in table.c]
+    if missing:
+        raise ValueError(
+            f"{cls.__name__}.search_index references unknown columns: {missing}"
+        )
+
+    # PostgreSQL: trigram GIN indexes, visible to Alembic autogenerate
+    event.listen(
+        table,
+        "before_create",
+        DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+    )
+    for name in columns:
+        Index(
+            trigram_index_name(table.name, name),
+            table.c[name],
+            postgresql_using="gin",
+            postgresql_ops={name: "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql")
+
+    # SQLite: FTS5 trigram shadow table maintained by triggers
+    for statement in _sqlite_ddl(table.name, columns):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in _sqlite_drop_ddl(table.name):
+        event.listen(table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
+
+    logging.debug(f"Registered search index for {table.name}: {columns}")
+
+
+def search_index_filter(field, pattern: str):
+    """
+    Build a case-insensitive LIKE filter for `pattern`, served by the search
+    index when the column has one.
+
+    Args:
+        field: Instrumented column attribute, e.g. User.email
+        pattern: LIKE pattern such as '%term%'
+    """
+    cls = getattr(field, "class_", None)
+    tablename = getattr(cls, "__tablename__", None)
+    if (
+        DATABASE_TYPE != "sqlite"
+        or tablename is None
+        or field.key not in getattr(cls, "search_index", ())
+        or len(pattern.replace("%", "")) < MIN_INDEXED_TERM_LENGTH
+    ):
+        # PostgreSQL trigram indexes serve ILIKE directly
+        return field.ilike(pattern)
+
+    search_table = sql_table(
+        search_table_name(tablename), sql_column("rowid"), sql_column(field.key)
+    )
+    return literal_column(f"{tablename}.rowid").in_(
+        select(search_table.c.rowid).where(search_table.c[field.key].like(pattern))
+    )
+
+
+def rebuild_search_index(cls, db: Session) -> None:
+    """
+    Rebuild the SQLite shadow table for `cls` from its content table.
+
+    SQLite may renumber rowids during VACUUM on tables without an INTEGER
+    PRIMARY KEY, so the index should be rebuilt afterwards.
+    """
+    if DATABASE_TYPE != "sqlite" or not getattr(cls, "search_index", None):
+        return
+    search_table = search_table_name(cls.__tablename__)
+    db.execute(text(f"INSERT INTO {search_table}({search_table}) VALUES ('rebuild')"))
+    db.commit()
@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+from database.StaticSearchIndex import (
+    drop_search_index_ddl,
+    is_search_table,
+    register_search_index,
+    search_index_ddl,
+    search_index_filter,
+)
+
+SearchBase = declarative_base()
+
+
+class SearchableEntity(SearchBase):
+    __tablename__ = "searchable_entities"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    note = Column(String)
+    search_index = ["name"]
+
+
+register_search_index(SearchableEntity)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    SearchBase.metadata.create_all(engine)
+    with Session(engine) as db:
+        yield db
+    SearchBase.metadata.drop_all(engine)
+
+
+def _names(db, pattern):
+    query = select(SearchableEntity.name).where(
+        search_index_filter(SearchableEntity.name, pattern)
+    )
+    return sorted(db.scalars(query))
+
+
+def test_search_index_follows_writes(session):
+    """Inserts, updates and deletes are reflected in the shadow table."""
+    session.add_all(
+        [SearchableEntity(name="Alpha Centauri"), SearchableEntity(name="Betelgeuse")]
+    )
+    session.commit()
+    assert _names(session, "%centauri%") == ["Alpha Centauri"]
+
+    entity = session.scalars(select(SearchableEntity)).first()
+    entity.name = "Proxima"
+    session.commit()
+    assert _names(session, "%centauri%") == []
+    assert _names(session, "prox%") == ["Proxima"]
+
+    session.delete(entity)
+    session.commit()
+    assert _names(session, "%prox%") == []
+
+
+def test_search_index_routing(session):
+    """Only indexed columns with long enough terms use the shadow table."""
+    indexed = str(search_index_filter(SearchableEntity.name, "%abc%"))
+    short = str(search_index_filter(SearchableEntity.name, "%ab%"))
+    unindexed = str(search_index_filter(SearchableEntity.note, "%abc%"))
+
+    assert "searchable_entities_search" in indexed
+    assert "searchable_entities_search" not in short
+    assert "searchable_entities_search" not in unindexed
+
+
+def test_search_index_ddl():
+    """Migration DDL covers both dialects and is reversible."""
+    postgres = search_index_ddl("users", ["email"], "postgresql")
+    assert "CREATE EXTENSION IF NOT EXISTS pg_trgm" in postgres
+    assert any("gin_trgm_ops" in statement for statement in postgres)
+    assert drop_search_index_ddl("users", ["email"], "postgresql") == [
+        "DROP INDEX IF EXISTS ix_users_email_trgm"
+    ]
+
+    sqlite = search_index_ddl("users", ["email"], "sqlite")
+    assert any("tokenize='trigram'" in statement for statement in sqlite)
+    assert search_index_ddl("users", ["email"], "mysql") == []
+
+
+def test_is_search_table():
+    """FTS5 shadow tables are recognised so autogenerate ignores them."""
+    assert is_search_table("users_search")
+    assert is_search_table("users_search_docsize")
+    assert not is_search_table("users")
@@ -0,0 +1,154 @@
+"""
+Unit of work: compose several create/update/delete calls into one commit.
+
+`BaseMixin.create/update/delete` (and most managers) call `db.commit()` after
+every write. Inside a `UnitOfWork` the session is bound to a connection whose
+transaction the unit of work owns, and the session is joined to it in
+"create_savepoint" mode: each inner `commit()` only releases a SAVEPOINT and
+each inner `rollback()` (e.g. from `with_session` after a failed write) only
+rolls back to the last one. The real COMMIT happens once, when the outermost
+unit of work exits cleanly; an exception escaping it rolls everything back.
+
+    with UnitOfWork(manager.db):
+        team = manager.create(name="Team")
+        manager.team_metadata.create(team_id=team.id, key="k", value="v")
+
+Entering a unit of work on a session that is already in one opens a nested
+SAVEPOINT instead, so a failed step can be discarded without losing the rest:
+
+    with UnitOfWork(db):
+        create_required_rows(db)
+        try:
+            with UnitOfWork(db):
+                create_optional_rows(db)
+        except HTTPException:
+            pass  # only the optional rows are rolled back
+
+Work that must only happen once the writes are durable (e.g. invalidating
+caches other requests read from) is deferred with `on_commit`; it is dropped
+if the unit of work, or the nested one it was registered in, rolls back.
+"""
+
+import logging
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from database.Base import get_session
+
+# Session.info key holding the active outermost unit of work
+_UNIT_OF_WORK_KEY = "unit_of_work"
+# Session.info key holding the innermost active unit of work
+_CURRENT_UNIT_OF_WORK_KEY = "current_unit_of_work"
+
+
+def in_unit_of_work(db: Session) -> bool:
+    """Whether `db` is currently inside a unit of work."""
+    return db.info.get(_UNIT_OF_WORK_KEY) is not None
+
+
+def on_commit(db: Session, callback: Callable[[], None]) -> None:
+    """
+    Call `callback` once the writes made so far on `db` are committed: when
+    the outermost unit of work commits, or immediately outside of one (the
+    write has then already committed).
+    """
+    unit = db.info.get(_CURRENT_UNIT_OF_WORK_KEY)
+    if unit is None:
+        callback()
+    else:
+        unit._on_commit.append(callback)
+
+
+class UnitOfWork:
+    """Context manager that turns the commits made on a session into one."""
+
+    def __init__(self, db: Optional[Session] = None):
+        """
+        Args:
+            db: Session to run the unit of work on; a new session is opened
+                (and closed on exit) if omitted
+        """
+        self._close_db_on_exit = db is None
+        self.db = db if db is not None else get_session()
+        self._outer: Optional["UnitOfWork"] = None
+        self._enclosing: Optional["UnitOfWork"] = None
+        self._on_commit: List[Callable[[], None]] = []
+        self._connection = None
+        self._transaction = None
+        self._previous_bind = None
+        self._previous_join_mode = None
+
+    def __enter__(self) -> Session:
+        db = self.db
+        # Close the session's current transaction (autobegun for reads, or a
+        # SAVEPOINT of the enclosing unit of work) so ours nests beneath it
+        if db.in_transaction():
+            db.commit()
+
+        self._outer = db.info.get(_UNIT_OF_WORK_KEY)
+        self._enclosing = db.info.get(_CURRENT_UNIT_OF_WORK_KEY)
+        db.info[_CURRENT_UNIT_OF_WORK_KEY] = self
+        if self._outer is not None:
+            self._connection = self._outer._connection
+            self._transaction = self._connection.begin_nested()
+            return db
+
+        self._connection = db.get_bind().connect()
+        self._transaction = self._connection.begin()
+        if self._connection.dialect.name == "sqlite":
+            # pysqlite defers BEGIN until the first write, which would let the
+            # first RELEASE SAVEPOINT commit on its own
+            self._connection.exec_driver_sql("BEGIN")
+
+        self._previous_bind = db.bind
+        self._previous_join_mode = db.join_transaction_mode
+        db.bind = self._connection
+        db.join_transaction_mode = "create_savepoint"
+        db.info[_UNIT_OF_WORK_KEY] = self
+        return db
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        db = self.db
+        outermost = self._outer is None
+        callbacks, self._on_commit = self._on_commit, []
+        try:
+            if exc_type is None:
+                try:
+                    db.commit()
+                    self._transaction.commit()
+                except Exception:
+                    self._rollback()
+                    raise
+                if not outermost:
+                    # Released into the enclosing transaction, not yet durable
+                    self._enclosing._on_commit.extend(callbacks)
+                    callbacks = []
+            else:
+                logging.debug(f"Rolling back unit of work: {exc_value}")
+                self._rollback()
+                callbacks = []
+        finally:
+            if self._enclosing is None:
+                db.info.pop(_CURRENT_UNIT_OF_WORK_KEY, None)
+            else:
+                db.info[_CURRENT_UNIT_OF_WORK_KEY] = self._enclosing
+            if outermost:
+                db.info.pop(_UNIT_OF_WORK_KEY, None)
+                db.bind = self._previous_bind
+                db.join_transaction_mode = self._previous_join_mode
+                self._connection.close()
+                if self._close_db_on_exit:
+                    db.close()
+            self._outer = None
+            self._enclosing = None
+            self._connection = None
+            self._transaction = None
+        for callback in callbacks:
+            callback()
+        return False
+
+    def _rollback(self) -> None:
+        self.db.rollback()
+        if self._transaction.is_active:
+            self._transaction.rollback()
@@ -0,0 +1,124 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, event, select
+from sqlalchemy.orm import Session, declarative_base
+
+from database.StaticUnitOfWork import UnitOfWork, in_unit_of_work, on_commit
+
+WorkBase = declarative_base()
+
+
+class WorkItem(WorkBase):
+    __tablename__ = "work_items"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'uow.db'}")
+    WorkBase.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+
+def _add(db, id, name):
+    """Write the way BaseMixin.create does: add and commit immediately."""
+    try:
+        db.add(WorkItem(id=id, name=name))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def _names(engine):
+    with Session(engine) as other:
+        return sorted(other.scalars(select(WorkItem.name)))
+
+
+def test_inner_commits_are_suppressed(engine, db):
+    """Writes become visible together, with a single COMMIT."""
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(conn))
+
+    with UnitOfWork(db):
+        assert in_unit_of_work(db)
+        _add(db, 1, "a")
+        _add(db, 2, "b")
+        assert _names(engine) == []
+
+    assert _names(engine) == ["a", "b"]
+    assert len(commits) == 1
+    assert not in_unit_of_work(db)
+    assert db.bind is engine
+
+
+def test_failed_write_rolls_back_to_savepoint(engine, db):
+    """A failed inner write only discards itself."""
+    with UnitOfWork(db):
+        _add(db, 1, "a")
+        with pytest.raises(Exception):
+            _add(db, 1, "duplicate")
+        _add(db, 2, "b")
+
+    assert _names(engine) == ["a", "b"]
+
+
+def test_nested_unit_of_work(engine, db):
+    """A failing nested unit of work discards all of its writes, not the outer ones."""
+    with UnitOfWork(db):
+        _add(db, 1, "kept")
+        with pytest.raises(ValueError):
+            with UnitOfWork(db):
+                _add(db, 2, "dropped")
+                _add(db, 3, "dropped too")
+                raise ValueError()
+        with UnitOfWork(db):
+            _add(db, 4, "nested")
+
+    assert _names(engine) == ["kept", "nested"]
+
+
+def test_exception_rolls_back_everything(engine, db):
+    """An exception escaping the outermost unit of work discards every write."""
+    with pytest.raises(ValueError):
+        with UnitOfWork(db):
+            _add(db, 1, "a")
+            raise ValueError()
+
+    assert _names(engine) == []
+    _add(db, 2, "after")
+    assert _names(engine) == ["after"]
+
+
+def test_on_commit_waits_for_outermost_commit(engine, db):
+    """Callbacks run after the real COMMIT, and not for rolled back work."""
+    calls = []
+
+    on_commit(db, lambda: calls.append("outside"))
+    assert calls == ["outside"]
+
+    with UnitOfWork(db):
+        _add(db, 1, "a")
+        on_commit(db, lambda: calls.append(_names(engine)))
+        with UnitOfWork(db):
+            on_commit(db, lambda: calls.append("nested"))
+        with pytest.raises(ValueError):
+            with UnitOfWork(db):
+                on_commit(db, lambda: calls.append("dropped"))
+                raise ValueError()
+        assert calls == ["outside"]
+
+    assert calls == ["outside", ["a"], "nested"]
+
+    with pytest.raises(ValueError):
+        with UnitOfWork(db):
+            on_commit(db, lambda: calls.append("rolled back"))
+            raise ValueError()
+    assert calls == ["outside", ["a"], "nested"]
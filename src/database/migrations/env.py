@@ -389,6 +389,13 @@ def include_object(object, name, type_, reflected, compare_to):
     This function determines whether a database object should be included
     in the autogeneration process based on ownership.
     """
+    # Search index shadow tables are managed by StaticSearchIndex, not the models
+    if type_ == "table" and reflected and compare_to is None:
+        from database.StaticSearchIndex import is_search_table
+
+        if is_search_table(name):
+            return False
+
     if type_ == "table":
         # Get the current extension being processed (if any)
         extension_name = env("ALEMBIC_EXTENSION")
@@ -0,0 +1,42 @@
+"""add search indexes
+
+Revision ID: 3f9a6c1e8b27
+Revises: 7d1e4b9a2c53
+Create Date: 2026-10-18 11:04:27.552913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from database.StaticSearchIndex import drop_search_index_ddl, search_index_ddl
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a6c1e8b27"
+down_revision: Union[str, None] = "7d1e4b9a2c53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns declared in each entity's search_index at this revision
+SEARCH_INDEXES = {
+    "users": ["email", "username", "display_name"],
+    "providers": ["name", "friendly_name"],
+    "extensions": ["name"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for tablename, columns in SEARCH_INDEXES.items():
+        for statement in search_index_ddl(tablename, columns, dialect):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for tablename, columns in SEARCH_INDEXES.items():
+        for statement in drop_search_index_ddl(tablename, columns, dialect):
+            op.execute(statement)
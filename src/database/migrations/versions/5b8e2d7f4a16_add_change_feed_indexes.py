@@ -0,0 +1,72 @@
+"""add change feed indexes
+
+Revision ID: 5b8e2d7f4a16
+Revises: 3f9a6c1e8b27
+Create Date: 2026-10-18 14:37:09.604218
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from database.StaticChangeFeed import change_index_name
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e2d7f4a16"
+down_revision: Union[str, None] = "3f9a6c1e8b27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables with an updated_at column at this revision
+CHANGE_FEED_TABLES = [
+    "abilities",
+    "api_keys",
+    "auth_sessions",
+    "extensions",
+    "invitation_invitees",
+    "invitations",
+    "permissions",
+    "provider_extension_abilities",
+    "provider_extensions",
+    "provider_instance_extension_abilities",
+    "provider_instance_settings",
+    "provider_instance_usage",
+    "provider_instances",
+    "providers",
+    "rate_limit_policies",
+    "roles",
+    "rotation_provider_instances",
+    "rotations",
+    "team_metadata",
+    "teams",
+    "user_credentials",
+    "user_metadata",
+    "user_recovery_questions",
+    "user_teams",
+    "users",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for tablename in CHANGE_FEED_TABLES:
+        # Rows without updated_at would never show up in the change feed
+        table = sa.table(
+            tablename, sa.column("updated_at", sa.DateTime), sa.column("created_at")
+        )
+        op.execute(
+            table.update()
+            .where(table.c.updated_at == None)
+            .values(updated_at=table.c.created_at)
+        )
+        op.create_index(
+            change_index_name(tablename), tablename, ["updated_at", "id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for tablename in reversed(CHANGE_FEED_TABLES):
+        op.drop_index(change_index_name(tablename), table_name=tablename)
@@ -17,10 +17,12 @@ from lib.Pydantic2FastAPI import (
     handle_resource_operation_error,
     register_batch_delete_route,
     register_batch_update_route,
+    register_changes_route,
     register_create_route,
     register_delete_route,
     register_get_route,
     register_list_route,
+    register_lookup_route,
     register_nested_create_route,
     register_nested_list_route,
     register_nested_search_route,
@@ -154,6 +156,7 @@ class AbstractEPRouter(APIRouter, Generic[T]):
         auth_type: AuthType = AuthType.JWT,
         parent_router: Optional["AbstractEPRouter"] = None,
         parent_param_name: Optional[str] = None,
+        include_strategies: Optional[Dict[str, Dict[str, str]]] = None,
     ):
         """
         Initialize the abstract router.
@@ -170,6 +173,8 @@ class AbstractEPRouter(APIRouter, Generic[T]):
             auth_type: Authentication type to use for this router (JWT, API Key, Basic, or None)
             parent_router: Optional parent router for nested resources
             parent_param_name: Optional parent parameter name for nested resources
+            include_strategies: Optional loader strategy overrides per route, e.g.
+                {"list": {"user_teams": "selectin"}, "get": {"user_teams": "joined"}}
         """
         logger.debug(f"Initializing AbstractEPRouter with prefix {prefix}")
 
@@ -208,6 +213,7 @@ class AbstractEPRouter(APIRouter, Generic[T]):
         self.auth_type = auth_type
         self.parent_router = parent_router
         self.parent_param_name = parent_param_name
+        self.include_strategies = include_strategies or {}
 
         # Derive resource names if not provided
         if not resource_name:
@@ -230,8 +236,10 @@ class AbstractEPRouter(APIRouter, Generic[T]):
         """Get the default routes to register."""
         return [
             "create",
+            "changes",
             "get",
             "list",
+            "lookup",
             "search",
             "update",
             "delete",
@@ -287,8 +295,10 @@ class AbstractEPRouter(APIRouter, Generic[T]):
         """Register standard CRUD routes based on routes_to_register."""
         route_mapping = {
             "create": self._register_create_route,
+            "changes": self._register_changes_route,
             "get": self._register_get_route,
             "list": self._register_list_route,
+            "lookup": self._register_lookup_route,
             "search": self._register_search_route,
             "update": self._register_update_route,
             "delete": self._register_delete_route,
@@ -296,8 +306,9 @@ class AbstractEPRouter(APIRouter, Generic[T]):
             "batch_delete": self._register_batch_delete_route,
         }
 
-        # Register only the requested routes
-        for route in self.routes_to_register:
+        # Register only the requested routes; /changes goes first so that
+        # GET /{id} does not shadow it
+        for route in sorted(self.routes_to_register, key=lambda r: r != "changes"):
             if route in route_mapping:
                 logger.debug(f"Registering route: {route} for {self.resource_name}")
                 route_mapping[route]()
@@ -332,6 +343,7 @@ class AbstractEPRouter(APIRouter, Generic[T]):
             examples=self.examples,
             manager_property=self.manager_property,
             auth_dependency=self.auth_dependency,
+            include_strategies=self.include_strategies.get("get"),
         )
 
     def _register_list_route(self) -> None:
@@ -345,6 +357,35 @@ class AbstractEPRouter(APIRouter, Generic[T]):
             examples=self.examples,
             manager_property=self.manager_property,
             auth_dependency=self.auth_dependency,
+            include_strategies=self.include_strategies.get("list"),
+        )
+
+    def _register_changes_route(self) -> None:
+        """Register the GET /changes route for incremental sync."""
+        register_changes_route(
+            router=self,
+            resource_name=self.resource_name,
+            resource_name_plural=self.resource_name_plural,
+            network_model_cls=self.network_model_cls,
+            manager_factory=self.manager_factory,
+            examples=self.examples,
+            manager_property=self.manager_property,
+            auth_dependency=self.auth_dependency,
+            include_strategies=self.include_strategies.get("list"),
+        )
+
+    def _register_lookup_route(self) -> None:
+        """Register the POST /lookup route for getting many resources by ID."""
+        register_lookup_route(
+            router=self,
+            resource_name=self.resource_name,
+            resource_name_plural=self.resource_name_plural,
+            network_model_cls=self.network_model_cls,
+            manager_factory=self.manager_factory,
+            examples=self.examples,
+            manager_property=self.manager_property,
+            auth_dependency=self.auth_dependency,
+            include_strategies=self.include_strategies.get("list"),
         )
 
     def _register_search_route(self) -> None:
@@ -358,6 +399,7 @@ class AbstractEPRouter(APIRouter, Generic[T]):
             examples=self.examples,
             manager_property=self.manager_property,
             auth_dependency=self.auth_dependency,
+            include_strategies=self.include_strategies.get("search"),
         )
 
     def _register_update_route(self) -> None:
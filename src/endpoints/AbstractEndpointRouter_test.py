@@ -61,6 +61,33 @@ class MockManager:
             raise ResourceNotFoundError("resource", id)
         return TestResource(id=id, name="Test", description="Test description")
 
+    def get_many(self, ids, **kwargs):
+        return [
+            None if id == "not-found" else TestResource(id=id, name="Test")
+            for id in ids
+        ]
+
+    def fingerprint(self, id=None):
+        return None if id == "not-found" else f"version-1:{id}"
+
+    def entity_fingerprint(self, entity):
+        return f"version-1:{entity.id}"
+
+    def changes(self, since=None, **kwargs):
+        if since == "end":
+            return {
+                "changed": [],
+                "deleted_ids": [],
+                "cursor": since,
+                "has_more": False,
+            }
+        return {
+            "changed": [TestResource(id="a", name="Test")],
+            "deleted_ids": ["b"],
+            "cursor": "end",
+            "has_more": False,
+        }
+
     def list(self, **kwargs):
         # Handle pagination parameters
         offset = kwargs.get("offset", 0)
@@ -523,6 +550,100 @@ class TestRouteHandlers:
         assert len(resources) > 0
         assert isinstance(resources[0], TestResource)
 
+    def test_multi_get_routes(self, router):
+        """GET ?ids= and POST /lookup return resources in request order."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+
+        response = client.get("/v1/resource", params={"ids": "b,not-found,a"})
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["resources"]] == ["b", "a"]
+        assert response.headers["X-Missing-Ids"] == "not-found"
+
+        response = client.post("/v1/resource/lookup", json={"ids": ["a", "b"]})
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["resources"]] == ["a", "b"]
+        assert "X-Missing-Ids" not in response.headers
+
+        response = client.post("/v1/resource/lookup", json={"ids": []})
+        assert response.status_code == 422
+
+    def test_changes_route(self, router):
+        """GET /changes pages through changes and is not shadowed by GET /{id}."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+
+        response = client.get("/v1/resource/changes")
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["id"] for item in body["resources"]] == ["a"]
+        assert body["deleted_ids"] == ["b"]
+        assert body["next_cursor"] == "end"
+        assert body["has_more"] is False
+
+        response = client.get("/v1/resource/changes", params={"since": "end"})
+        assert response.json()["resources"] == []
+        assert response.json()["next_cursor"] == "end"
+
+    def test_conditional_get_routes(self, router):
+        """GET routes send weak ETags and honour If-None-Match with 304."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+
+        for path in ["/v1/resource/a", "/v1/resource"]:
+            response = client.get(path)
+            assert response.status_code == 200
+            etag = response.headers["ETag"]
+            assert etag.startswith('W/"')
+
+            response = client.get(path, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["ETag"] == etag
+
+            response = client.get(path, headers={"If-None-Match": '"stale"'})
+            assert response.status_code == 200
+
+        # Query parameters change the representation, so they change the ETag
+        assert (
+            client.get("/v1/resource", params={"limit": 5}).headers["ETag"]
+            != client.get("/v1/resource").headers["ETag"]
+        )
+        # Included relations are not fingerprinted
+        response = client.get("/v1/resource/a", params={"include": "children"})
+        assert "ETag" not in response.headers
+        # No fingerprint, no ETag; the route still answers normally
+        response = client.get("/v1/resource/not-found")
+        assert response.status_code == 404
+
+    def test_unconditional_get_skips_fingerprint(self, router):
+        """A GET without If-None-Match tags the loaded entity, with no pre-read."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+
+        with patch.object(MockManager, "fingerprint") as fingerprint:
+            response = client.get("/v1/resource/a")
+
+        fingerprint.assert_not_called()
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"')
+
     @pytest.mark.asyncio
     async def test_update_route(self):
         """Test the update route handler."""
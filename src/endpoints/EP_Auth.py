@@ -18,6 +18,8 @@ from endpoints.AbstractEndpointRouter import AbstractEPRouter
 from endpoints.StaticExampleFactory import ExampleGenerator
 from lib.Environment import env
 from logic.BLL_Auth import (
+    ApiKeyManager,
+    ApiKeyNetworkModel,
     FailedLoginAttemptManager,
     InvitationInviteeManager,
     InvitationManager,
@@ -49,7 +51,7 @@ def get_user_manager(
     ),
 ):
     """Get an initialized User manager instance."""
-    return UserManager(requester_id=user.id, target_user_id=target_user_id or user.id)
+    return UserManager(requester=user, target_user_id=target_user_id or user.id)
 
 
 def get_team_manager(
@@ -59,62 +61,67 @@ def get_team_manager(
     ),
 ):
     """Get an initialized Team manager instance."""
-    return TeamManager(requester_id=user.id, target_team_id=target_team_id)
+    return TeamManager(requester=user, target_team_id=target_team_id)
 
 
 def get_invitation_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized Invitation manager instance."""
-    return InvitationManager(requester_id=user.id)
+    return InvitationManager(requester=user)
 
 
 def get_invitation_invitee_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized InvitationInvitee manager instance."""
-    return InvitationInviteeManager(requester_id=user.id)
+    return InvitationInviteeManager(requester=user)
 
 
 def get_role_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized Role manager instance."""
-    return RoleManager(requester_id=user.id)
+    return RoleManager(requester=user)
 
 
 def get_user_team_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized UserTeam manager instance."""
-    return UserTeamManager(requester_id=user.id)
+    return UserTeamManager(requester=user)
 
 
 def get_team_metadata_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized TeamMetadata manager instance."""
-    return TeamMetadataManager(requester_id=user.id)
+    return TeamMetadataManager(requester=user)
 
 
 def get_user_metadata_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized UserMetadata manager instance."""
-    return UserMetadataManager(requester_id=user.id)
+    return UserMetadataManager(requester=user)
 
 
 def get_user_credential_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized UserCredential manager instance."""
-    return UserCredentialManager(requester_id=user.id)
+    return UserCredentialManager(requester=user)
 
 
 def get_recovery_question_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized UserRecoveryQuestion manager instance."""
-    return UserRecoveryQuestionManager(requester_id=user.id)
+    return UserRecoveryQuestionManager(requester=user)
 
 
 def get_failed_login_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized FailedLoginAttempt manager instance."""
-    return FailedLoginAttemptManager(requester_id=user.id)
+    return FailedLoginAttemptManager(requester=user)
 
 
 def get_user_session_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized UserSession manager instance."""
-    return UserSessionManager(requester_id=user.id)
+    return UserSessionManager(requester=user)
 
 
 def get_permission_manager(user: UserModel = Depends(UserManager.auth)):
     """Get an initialized Permission manager instance."""
-    return PermissionManager(requester_id=user.id)
+    return PermissionManager(requester=user)
+
+
+def get_api_key_manager(user: UserModel = Depends(UserManager.auth)):
+    """Get an initialized ApiKey manager instance."""
+    return ApiKeyManager(requester=user)
 
 
 # Generate examples using ExampleGenerator for OpenAPI documentation
@@ -163,6 +170,10 @@ role_examples["get"]["role"].update(
     }
 )
 
+api_key_examples = ExampleGenerator.generate_operation_examples(
+    ApiKeyNetworkModel, "api_key"
+)
+
 user_session_examples = ExampleGenerator.generate_operation_examples(
     UserSessionNetworkModel, "user_session"
 )
@@ -271,6 +282,16 @@ session_router = AbstractEPRouter(
     example_overrides=user_session_examples,
 )
 
+api_key_router = AbstractEPRouter(
+    prefix="/v1/api-key",
+    tags=["User Management"],
+    manager_factory=get_api_key_manager,
+    network_model_cls=ApiKeyNetworkModel,
+    resource_name="api_key",
+    example_overrides=api_key_examples,
+    routes_to_register=["create", "get", "list", "search", "update", "delete"],
+)
+
 # Create nested routers
 team_invitation_router = team_router.create_nested_router(
     parent_prefix="/v1/team",
@@ -669,6 +690,7 @@ all_routers = [
     team_router,
     invitation_router,
     session_router,
+    api_key_router,
     team_invitation_router,
     user_team_router,
     team_metadata_router,
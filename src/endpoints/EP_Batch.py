@@ -0,0 +1,215 @@
+import json
+import logging
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from pydantic import BaseModel, Field
+
+from logic.BLL_Auth import AUTHENTICATED_USER_STATE, UserManager, UserModel
+
+# Maximum number of sub-requests in one batch
+MAX_BATCH_REQUESTS = 50
+
+# Headers of the batch request that sub-requests may not override
+PROTECTED_HEADERS = {"authorization", "x-api-key", "cookie", "host"}
+
+
+class BatchSubRequest(BaseModel):
+    """A single request multiplexed into a batch."""
+
+    id: Optional[str] = Field(
+        None, description="Client reference echoed back on the matching response"
+    )
+    method: Literal["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"] = Field(
+        ..., description="HTTP method"
+    )
+    path: str = Field(
+        ..., description="Path of the route, with optional query string, e.g. /v1/team"
+    )
+    body: Optional[Any] = Field(None, description="JSON request body")
+    headers: Dict[str, str] = Field(
+        default_factory=dict, description="Additional request headers"
+    )
+
+
+class BatchSubResponse(BaseModel):
+    """The response to one sub-request of a batch."""
+
+    id: Optional[str] = Field(None, description="Client reference of the request")
+    status: int = Field(..., description="HTTP status code")
+    headers: Dict[str, str] = Field(
+        default_factory=dict, description="Response headers"
+    )
+    body: Optional[Any] = Field(None, description="Response body")
+
+
+class BatchNetworkModel:
+    class POST(BaseModel):
+        requests: List[BatchSubRequest] = Field(
+            ...,
+            min_length=1,
+            max_length=MAX_BATCH_REQUESTS,
+            description="Sub-requests to run, in order",
+        )
+
+    class Response(BaseModel):
+        responses: List[BatchSubResponse] = Field(
+            ..., description="Responses in the order of the requests"
+        )
+
+
+def _validate_path(path: str) -> None:
+    """Only relative API paths may be targeted, and batches may not nest."""
+    if not path.startswith("/v1/") or "://" in path:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch sub-request paths must start with /v1/: {path}",
+        )
+    if path.split("?", 1)[0].rstrip("/") == "/v1/batch":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch requests cannot be nested",
+        )
+
+
+def _sub_request_scope(
+    request: Request, sub_request: BatchSubRequest, user: Any, body: bytes
+) -> Dict[str, Any]:
+    """Build the ASGI scope of a sub-request from the batch request."""
+    path, _, query_string = sub_request.path.partition("?")
+
+    headers = {
+        key: value
+        for key, value in request.headers.items()
+        if key not in ("content-length", "content-type")
+    }
+    for key, value in sub_request.headers.items():
+        if key.lower() not in PROTECTED_HEADERS:
+            headers[key.lower()] = value
+    if body:
+        headers["content-type"] = "application/json"
+        headers["content-length"] = str(len(body))
+
+    scope = dict(request.scope)
+    scope.update(
+        {
+            "method": sub_request.method,
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": query_string.encode(),
+            "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+            # The route tree resolves the endpoint again for the new path
+            "state": {**request.scope.get("state", {}), AUTHENTICATED_USER_STATE: user},
+        }
+    )
+    for key in list(scope):
+        if key in ("endpoint", "route", "path_params", "router") or key.startswith(
+            "fastapi"
+        ):
+            scope.pop(key)
+    return scope
+
+
+async def _dispatch(
+    request: Request, sub_request: BatchSubRequest, user: Any
+) -> BatchSubResponse:
+    """Run one sub-request through the application in process."""
+    try:
+        _validate_path(sub_request.path)
+    except HTTPException as e:
+        return BatchSubResponse(
+            id=sub_request.id, status=e.status_code, body={"detail": e.detail}
+        )
+
+    body = b"" if sub_request.body is None else json.dumps(sub_request.body).encode()
+    scope = _sub_request_scope(request, sub_request, user, body)
+
+    received = False
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    status_code = 500
+    headers: List[Tuple[bytes, bytes]] = []
+    chunks: List[bytes] = []
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status_code, headers
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            headers = message.get("headers", [])
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # The server error middleware has already sent the 500 response
+        logging.exception(
+            f"Batch sub-request {sub_request.method} {sub_request.path} failed"
+        )
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    response_headers = {k.decode(): v.decode() for k, v in headers}
+    content = b"".join(chunks)
+    response_body: Any = None
+    if content:
+        if response_headers.get("content-type", "").startswith("application/json"):
+            response_body = json.loads(content)
+        else:
+            response_body = content.decode(errors="replace")
+    response_headers.pop("content-length", None)
+
+    return BatchSubResponse(
+        id=sub_request.id,
+        status=status_code,
+        headers=response_headers,
+        body=response_body,
+    )
+
+
+router = APIRouter(prefix="/v1", tags=["Batch"])
+
+
+@router.post(
+    "/batch",
+    summary="Run multiple requests",
+    description=f"""
+    Runs up to {MAX_BATCH_REQUESTS} API requests in one round trip.
+
+    The batch request is authenticated once and every sub-request runs as the
+    same user, in process, against the regular `/v1/` routes. Sub-requests
+    execute one after another, in order, so each sees the effects of the
+    requests before it. Each sub-request succeeds or fails on its own and its
+    status, headers and body are returned in request order.
+
+    Format:
+    ```json
+    {{
+        "requests": [
+            {{"id": "team", "method": "GET", "path": "/v1/team/<id>"}},
+            {{"method": "POST", "path": "/v1/team", "body": {{"team": {{"name": "New"}}}}}}
+        ]
+    }}
+    ```
+    """,
+    response_model=BatchNetworkModel.Response,
+    status_code=status.HTTP_200_OK,
+)
+async def run_batch(
+    request: Request,
+    body: BatchNetworkModel.POST = Body(...),
+    user: UserModel = Depends(UserManager.auth),
+):
+    """Run the sub-requests of a batch as the authenticated user."""
+    # The routes make blocking database calls from async handlers, so running
+    # sub-requests concurrently on this event loop would not overlap them
+    responses = [
+        await _dispatch(request, sub_request, user) for sub_request in body.requests
+    ]
+    return BatchNetworkModel.Response(responses=responses)
@@ -0,0 +1,116 @@
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from endpoints.EP_Batch import router
+from logic.BLL_Auth import AUTHENTICATED_USER_STATE, UserManager
+
+
+@pytest.fixture
+def auth_calls():
+    return []
+
+
+@pytest.fixture
+def client(auth_calls):
+    """An app with the batch router and a few routes that require a user."""
+    app = FastAPI()
+    app.include_router(router)
+
+    def fake_auth(request: Request):
+        user = request.scope.get("state", {}).get(AUTHENTICATED_USER_STATE)
+        if user is not None:
+            return user
+        auth_calls.append(request.headers.get("authorization"))
+        if request.headers.get("authorization") != "Bearer token":
+            raise HTTPException(status_code=401, detail="Unauthorized")
+        return {"id": "user-1"}
+
+    app.dependency_overrides[UserManager.auth] = fake_auth
+    items = {}
+
+    @app.get("/v1/item/{id}")
+    def get_item(id: str, user=Depends(UserManager.auth)):
+        if id not in items:
+            raise HTTPException(status_code=404, detail="Item not found")
+        return {"item": items[id], "user": user["id"]}
+
+    @app.post("/v1/item", status_code=201)
+    async def create_item(request: Request, user=Depends(UserManager.auth)):
+        body = await request.json()
+        items[body["id"]] = body
+        return {"item": body, "tenant": request.headers.get("x-tenant")}
+
+    return TestClient(app)
+
+
+def test_batch_authenticates_once(client, auth_calls):
+    """Every sub-request runs as the user the batch authenticated."""
+    response = client.post(
+        "/v1/batch",
+        headers={"Authorization": "Bearer token"},
+        json={
+            "requests": [
+                {"id": "missing", "method": "GET", "path": "/v1/item/a"},
+                {
+                    "id": "create",
+                    "method": "POST",
+                    "path": "/v1/item",
+                    "body": {"id": "a", "name": "A"},
+                    "headers": {"X-Tenant": "t1", "Authorization": "Bearer other"},
+                },
+                {"id": "read", "method": "GET", "path": "/v1/item/a"},
+                {"method": "GET", "path": "/v1/item/a?verbose=true"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    assert auth_calls == ["Bearer token"]
+    responses = response.json()["responses"]
+    assert [r["id"] for r in responses] == ["missing", "create", "read", None]
+    assert [r["status"] for r in responses] == [404, 201, 200, 200]
+    assert responses[0]["body"] == {"detail": "Item not found"}
+    assert responses[1]["body"]["tenant"] == "t1"
+    assert responses[2]["body"] == {"item": {"id": "a", "name": "A"}, "user": "user-1"}
+    assert responses[2]["headers"]["content-type"] == "application/json"
+
+
+def test_batch_requires_authentication(client, auth_calls):
+    """An unauthenticated batch is rejected before any sub-request runs."""
+    response = client.post(
+        "/v1/batch",
+        json={"requests": [{"method": "GET", "path": "/v1/item/a"}]},
+    )
+
+    assert response.status_code == 401
+    assert auth_calls == [None]
+
+
+def test_batch_rejects_invalid_paths(client):
+    """Nested batches and paths outside the API fail individually."""
+    response = client.post(
+        "/v1/batch",
+        headers={"Authorization": "Bearer token"},
+        json={
+            "requests": [
+                {"method": "POST", "path": "/v1/batch", "body": {"requests": []}},
+                {"method": "GET", "path": "http://example.com/v1/item/a"},
+                {"method": "GET", "path": "/v1/item/a"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    statuses = [r["status"] for r in response.json()["responses"]]
+    assert statuses == [400, 400, 404]
+
+
+def test_auth_reuses_batch_user():
+    """UserManager.auth returns the user handed down by the batch."""
+    user = object()
+    request = Request(
+        {"type": "http", "headers": [], "state": {AUTHENTICATED_USER_STATE: user}}
+    )
+
+    assert UserManager.auth(request=request) is user
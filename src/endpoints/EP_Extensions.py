@@ -17,7 +17,7 @@ def get_provider_extension_manager(user: User = Depends(UserManager.auth)):
     Returns:
         ExtensionManager: An initialized extension manager with the user's permissions
     """
-    return ExtensionManager(requester_id=user.id)
+    return ExtensionManager(requester=user)
 
 
 # Create router tree for provider extensions following EP.schema.md specification
@@ -119,7 +119,7 @@ async def get_provider_extensions(
     """
     try:
         # Verify provider exists
-        provider_manager = ProviderManager(requester_id=manager.requester.id)
+        provider_manager = ProviderManager(requester=manager.requester)
         provider = provider_manager.get(id=provider_id)
 
         if not provider:
@@ -182,7 +182,7 @@ async def install_extension(
     """
     try:
         # Verify provider exists
-        provider_manager = ProviderManager(requester_id=manager.requester.id)
+        provider_manager = ProviderManager(requester=manager.requester)
         provider = provider_manager.get(id=provider_id)
 
         if not provider:
@@ -246,7 +246,7 @@ async def uninstall_extension(
     """
     try:
         # Verify provider exists
-        provider_manager = ProviderManager(requester_id=manager.requester.id)
+        provider_manager = ProviderManager(requester=manager.requester)
         provider = provider_manager.get(id=provider_id)
 
         if not provider:
@@ -3,8 +3,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query
 
 from endpoints.AbstractEndpointRouter import AbstractEPRouter, AuthType
-from lib.Environment import env
-from logic.BLL_Auth import User, UserManager
+from logic.BLL_Auth import ApiKeyManager, Principal, User, UserManager
 from logic.BLL_Providers import (
     ProviderExtensionAbilityNetworkModel,
     ProviderExtensionNetworkModel,
@@ -30,7 +29,7 @@ def get_provider_manager(
 ):
     """Get an initialized ProviderManager instance."""
     return ProviderManager(
-        requester_id=user.id,
+        requester=user,
         target_user_id=target_user_id or user.id,
         target_team_id=target_team_id,
     )
@@ -38,6 +37,7 @@ def get_provider_manager(
 
 # Factory for API Key authenticated routes
 def get_provider_manager_api_key(
+    principal: Principal = Depends(ApiKeyManager.auth),
     target_user_id: Optional[str] = Query(
         None, description="Target user ID for admin operations"
     ),
@@ -46,11 +46,11 @@ def get_provider_manager_api_key(
     ),
 ):
     """Get an initialized ProviderManager instance for API key authenticated routes."""
-    # Use ROOT_ID as the requester for system operations
-    effective_target_user_id = target_user_id or env("ROOT_ID")
+    # The key owner is the requester; ROOT_API_KEY resolves to ROOT_ID
+    effective_target_user_id = target_user_id or principal.id
 
     return ProviderManager(
-        requester_id=env("ROOT_ID"),
+        requester=principal,
         target_user_id=effective_target_user_id,
         target_team_id=target_team_id,
     )
@@ -0,0 +1,446 @@
+import asyncio
+import importlib
+import json
+import logging
+import os
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from broadcaster import Broadcast, BroadcastBackend, Event
+from broadcaster._base import Subscriber
+from pydantic import BaseModel
+
+# Longest frame, in bytes, accepted on the hub's Unix domain socket
+FRAME_LIMIT = 16 * 1024 * 1024
+# Postgres NOTIFY payloads must be shorter than 8000 bytes
+POSTGRES_PAYLOAD_LIMIT = 7999
+
+
+@lru_cache(maxsize=None)
+def _model_class(path: str):
+    """Resolve a "module:QualName" path to the Pydantic model it names."""
+    module_name, _, qualname = path.partition(":")
+    target = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    if not (isinstance(target, type) and issubclass(target, BaseModel)):
+        raise ValueError(f"{path} is not a Pydantic model")
+    return target
+
+
+def encode_message(message: Any) -> Dict[str, Any]:
+    """
+    Turn a published message into JSON-compatible data from which another
+    process can rebuild it: Pydantic models keep their class, lists (batch
+    messages) their items.
+    """
+    if isinstance(message, list):
+        return {"items": [encode_message(item) for item in message]}
+    if isinstance(message, BaseModel):
+        cls = type(message)
+        return {
+            "model": f"{cls.__module__}:{cls.__qualname__}",
+            "data": message.model_dump(mode="json", by_alias=True),
+        }
+    return {"value": message}
+
+
+def decode_message(data: Dict[str, Any]) -> Any:
+    """Rebuild a message encoded by `encode_message`."""
+    if "items" in data:
+        return [decode_message(item) for item in data["items"]]
+    if "model" in data:
+        return _model_class(data["model"]).model_validate(data["data"])
+    return data["value"]
+
+
+def _coalesce_key(event: Optional[Event]) -> Optional[Tuple[str, str]]:
+    """Events for the same entity on the same channel share a key."""
+    if event is None:
+        return None
+    message = event.message
+    id = (
+        message.get("id") if isinstance(message, dict) else getattr(message, "id", None)
+    )
+    return (event.channel, id) if isinstance(id, str) else None
+
+
+class CoalescingQueue:
+    """
+    Bounded queue of the events waiting for one subscriber, which never makes
+    the publisher wait.
+
+    An event for an entity that already has an event waiting replaces it in
+    place, so a slow subscriber receives the latest state of each entity
+    instead of every intermediate one. When the queue is full of distinct
+    events the oldest is dropped and counted in `dropped`.
+    """
+
+    def __init__(self, maxsize: int = 100):
+        self.maxsize = max(int(maxsize), 1)
+        self.coalesced = 0
+        self.dropped = 0
+        self._slots: Deque[List[Optional[Event]]] = deque()
+        self._pending: Dict[Tuple[str, str], List[Optional[Event]]] = {}
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _discard(self, slot: List[Optional[Event]]) -> None:
+        key = _coalesce_key(slot[0])
+        if key is not None and self._pending.get(key) is slot:
+            del self._pending[key]
+
+    def put_nowait(self, event: Optional[Event]) -> None:
+        key = _coalesce_key(event)
+        slot = self._pending.get(key) if key is not None else None
+        if slot is not None:
+            slot[0] = event
+            self.coalesced += 1
+            return
+
+        # None closes the subscriber and is never dropped
+        if event is not None and len(self._slots) >= self.maxsize:
+            self._discard(self._slots.popleft())
+            if not self.dropped:
+                logging.warning(
+                    f"Broadcast subscriber fell {self.maxsize} events behind on "
+                    f"{event.channel}; dropping its oldest events"
+                )
+            self.dropped += 1
+
+        slot = [event]
+        self._slots.append(slot)
+        if key is not None:
+            self._pending[key] = slot
+        self._ready.set()
+
+    async def put(self, event: Optional[Event]) -> None:
+        self.put_nowait(event)
+
+    async def get(self) -> Optional[Event]:
+        while not self._slots:
+            self._ready.clear()
+            await self._ready.wait()
+        slot = self._slots.popleft()
+        self._discard(slot)
+        return slot[0]
+
+
+class FanoutBroadcast(Broadcast):
+    """
+    `Broadcast` whose subscribers each get a `CoalescingQueue`, so one slow
+    subscriber can neither stall the listener nor the other subscribers of
+    its channel.
+    """
+
+    def __init__(self, backend: BroadcastBackend, queue_size: int = 100):
+        super().__init__(backend=backend)
+        self.queue_size = queue_size
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscriber]:
+        queue = CoalescingQueue(self.queue_size)
+
+        try:
+            if not self._subscribers.get(channel):
+                await self._backend.subscribe(channel)
+                self._subscribers[channel] = {queue}
+            else:
+                self._subscribers[channel].add(queue)
+
+            yield Subscriber(queue)
+        finally:
+            self._subscribers[channel].remove(queue)
+            if not self._subscribers.get(channel):
+                del self._subscribers[channel]
+                await self._backend.unsubscribe(channel)
+            await queue.put(None)
+
+
+class JsonBackend(BroadcastBackend):
+    """
+    Wraps a backend that carries text between processes (Postgres
+    LISTEN/NOTIFY, Redis) so messages travel as `encode_message` JSON.
+
+    With a `payload_limit`, a batch message too large for one payload is sent
+    as several smaller batches, which subscribers unpack the same way. A
+    single item too large for a payload raises ValueError.
+    """
+
+    def __init__(self, backend: BroadcastBackend, payload_limit: Optional[int] = None):
+        self._backend = backend
+        self.payload_limit = payload_limit
+
+    async def connect(self) -> None:
+        await self._backend.connect()
+
+    async def disconnect(self) -> None:
+        await self._backend.disconnect()
+
+    async def subscribe(self, channel: str) -> None:
+        await self._backend.subscribe(channel)
+
+    async def unsubscribe(self, channel: str) -> None:
+        await self._backend.unsubscribe(channel)
+
+    async def publish(self, channel: str, message: Any) -> None:
+        for payload in self._payloads(channel, message):
+            await self._backend.publish(channel, payload)
+
+    def _payloads(self, channel: str, message: Any) -> List[str]:
+        """`message` as JSON, split into batches that fit the payload limit"""
+        payload = json.dumps(encode_message(message))
+        limit = self.payload_limit
+        if limit is None or len(payload.encode()) <= limit:
+            return [payload]
+        if not isinstance(message, list):
+            raise ValueError(
+                f"{channel} message of {len(payload.encode())} bytes exceeds the "
+                f"{limit} byte broadcast payload limit"
+            )
+
+        # Join the encoded items the way json.dumps does, as many per payload as fit
+        opening, separator, closing = '{"items": [', ", ", "]}"
+        payloads = []
+        parts: List[str] = []
+        size = len(opening) + len(closing)
+        for item in message:
+            part = json.dumps(encode_message(item))
+            part_size = len(part.encode()) + (len(separator) if parts else 0)
+            if parts and size + part_size > limit:
+                payloads.append(opening + separator.join(parts) + closing)
+                parts, size = [], len(opening) + len(closing)
+                part_size = len(part.encode())
+            if size + part_size > limit:
+                raise ValueError(
+                    f"{channel} item of {len(part.encode())} bytes exceeds the "
+                    f"{limit} byte broadcast payload limit"
+                )
+            parts.append(part)
+            size += part_size
+        if parts:
+            payloads.append(opening + separator.join(parts) + closing)
+        return payloads
+
+    async def next_published(self) -> Event:
+        while True:
+            event = await self._backend.next_published()
+            try:
+                message = decode_message(json.loads(event.message))
+            except Exception as e:
+                logging.error(f"Dropping undecodable {event.channel} message: {e}")
+                continue
+            return Event(channel=event.channel, message=message)
+
+
+class UnixSocketBackend(BroadcastBackend):
+    """
+    Worker side of a `BroadcastHub`: publishes to and receives from the hub
+    listening on the socket path of a `unix:///path` URL.
+    """
+
+    def __init__(self, url: str):
+        self._path = urlparse(url).path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_unix_connection(
+            self._path, limit=FRAME_LIMIT
+        )
+
+    async def disconnect(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _send(self, frame: Dict[str, Any]) -> None:
+        self._writer.write(json.dumps(frame).encode() + b"\n")
+        await self._writer.drain()
+
+    async def subscribe(self, channel: str) -> None:
+        await self._send({"op": "subscribe", "channel": channel})
+
+    async def unsubscribe(self, channel: str) -> None:
+        await self._send({"op": "unsubscribe", "channel": channel})
+
+    async def publish(self, channel: str, message: Any) -> None:
+        await self._send(
+            {"op": "publish", "channel": channel, "message": encode_message(message)}
+        )
+
+    async def next_published(self) -> Event:
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                raise ConnectionError(f"Broadcast hub at {self._path} went away")
+            try:
+                frame = json.loads(line)
+                message = decode_message(frame["message"])
+            except Exception as e:
+                logging.error(f"Dropping undecodable broadcast frame: {e}")
+                continue
+            return Event(channel=frame["channel"], message=message)
+
+
+class BroadcastHub:
+    """
+    Relays broadcast frames between the worker processes of one host.
+
+    Started by the parent process before the workers, it listens on a Unix
+    domain socket. Workers send subscribe, unsubscribe and publish frames, and
+    every publish is forwarded to each connection subscribed to its channel,
+    the publisher's included. Each connection has an outbox of at most
+    `queue_size` frames, so a worker that stops reading loses frames instead
+    of stalling the hub and the other workers.
+    """
+
+    def __init__(self, path: str, queue_size: int = 1000):
+        self.path = path
+        self.queue_size = queue_size
+        self.dropped = 0
+        self._connections: Dict[
+            asyncio.StreamWriter, Tuple[Set[str], asyncio.Queue]
+        ] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    def start(self) -> "BroadcastHub":
+        """Serve from a daemon thread; returns once the socket accepts connections."""
+        self._thread = threading.Thread(
+            target=self._run, name="broadcast-hub", daemon=True
+        )
+        self._thread.start()
+        self._started.wait()
+        if self._error is not None:
+            raise self._error
+        return self
+
+    def stop(self) -> None:
+        if self._loop is not None and self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._server = self._loop.run_until_complete(self._listen())
+        except BaseException as e:
+            self._error = e
+            self._started.set()
+            self._loop.close()
+            return
+        self._started.set()
+        try:
+            self._loop.run_until_complete(self._server.wait_closed())
+        finally:
+            self._loop.close()
+
+    async def _listen(self) -> asyncio.AbstractServer:
+        # A socket file left behind by a previous run would make bind fail
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(
+            self._handle, path=self.path, limit=FRAME_LIMIT
+        )
+        os.chmod(self.path, 0o600)
+        return server
+
+    def _relay(self, channel: str, message: Any) -> None:
+        data = json.dumps({"channel": channel, "message": message}).encode() + b"\n"
+        for channels, outbox in self._connections.values():
+            if channel in channels:
+                try:
+                    outbox.put_nowait(data)
+                except asyncio.QueueFull:
+                    self.dropped += 1
+
+    async def _send(self, writer: asyncio.StreamWriter, outbox: asyncio.Queue) -> None:
+        while True:
+            writer.write(await outbox.get())
+            await writer.drain()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        channels: Set[str] = set()
+        outbox: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self._connections[writer] = (channels, outbox)
+        sender = asyncio.create_task(self._send(writer, outbox))
+        try:
+            async for line in reader:
+                try:
+                    frame = json.loads(line)
+                    op, channel = frame["op"], frame["channel"]
+                except (ValueError, KeyError, TypeError):
+                    logging.error("Ignoring malformed broadcast hub frame")
+                    continue
+                if op == "subscribe":
+                    channels.add(channel)
+                elif op == "unsubscribe":
+                    channels.discard(channel)
+                elif op == "publish":
+                    self._relay(channel, frame.get("message"))
+        except ConnectionError:
+            pass
+        finally:
+            del self._connections[writer]
+            sender.cancel()
+            writer.close()
+
+
+def create_backend(url: str) -> BroadcastBackend:
+    """
+    Backend for a broadcast URL:
+
+    - memory:// delivers within this process only
+    - unix:///path/to/socket goes through the `BroadcastHub` on that socket,
+      reaching every worker on the host
+    - postgres:// uses LISTEN/NOTIFY and redis:// pub/sub, reaching every
+      worker connected to the same server; batches larger than a NOTIFY
+      payload are split into several messages
+    """
+    scheme = urlparse(url).scheme
+    if scheme == "memory":
+        from broadcaster._backends.memory import MemoryBackend
+
+        return MemoryBackend(url)
+    if scheme == "unix":
+        return UnixSocketBackend(url)
+    if scheme in ("postgres", "postgresql"):
+        from broadcaster._backends.postgres import PostgresBackend
+
+        return JsonBackend(PostgresBackend(url), payload_limit=POSTGRES_PAYLOAD_LIMIT)
+    if scheme in ("redis", "rediss"):
+        from broadcaster._backends.redis import RedisBackend
+
+        return JsonBackend(RedisBackend(url))
+    raise ValueError(f"Unsupported broadcast backend: {url}")
+
+
+def create_broadcast(url: str, queue_size: int = 100) -> FanoutBroadcast:
+    """Broadcast over the backend of `url`, with bounded subscriber queues."""
+    return FanoutBroadcast(create_backend(url), queue_size=queue_size)
+
+
+def start_broadcast_hub(url: str) -> Optional[BroadcastHub]:
+    """Start the hub for a unix:// broadcast URL; other backends need none."""
+    parsed = urlparse(url)
+    if parsed.scheme != "unix":
+        return None
+    return BroadcastHub(parsed.path).start()
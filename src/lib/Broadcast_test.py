@@ -0,0 +1,185 @@
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+from typing import Optional
+
+import pytest
+from broadcaster import Event
+from broadcaster._backends.memory import MemoryBackend
+from pydantic import BaseModel
+
+from lib.Broadcast import (
+    BroadcastHub,
+    CoalescingQueue,
+    FanoutBroadcast,
+    JsonBackend,
+    UnixSocketBackend,
+    create_backend,
+    decode_message,
+    encode_message,
+)
+
+
+class ItemModel(BaseModel):
+    id: str
+    name: str
+    updated_at: Optional[datetime] = None
+
+
+def _item(id: str, name: str = "Item") -> ItemModel:
+    return ItemModel(id=id, name=name, updated_at=datetime(2026, 1, 1, 12, 30))
+
+
+def test_message_round_trip():
+    """Models, batches and plain values survive encoding between processes."""
+    for message in [_item("a"), [_item("a"), _item("b", "B")], {"id": "x"}, "text"]:
+        assert decode_message(encode_message(message)) == message
+
+    with pytest.raises(ValueError):
+        decode_message({"model": "lib.Broadcast:encode_message", "data": {}})
+
+
+def test_coalescing_queue():
+    """Waiting events for one entity coalesce; a full queue drops its oldest."""
+
+    async def run():
+        queue = CoalescingQueue(maxsize=3)
+        queue.put_nowait(Event("item_updated", _item("a", "first")))
+        queue.put_nowait(Event("item_updated", _item("b")))
+        queue.put_nowait(Event("item_updated", _item("a", "latest")))
+        assert (len(queue), queue.coalesced) == (2, 1)
+
+        queue.put_nowait(Event("item_updated", [_item("c"), _item("d")]))
+        queue.put_nowait(Event("item_updated", "no id"))
+        assert (len(queue), queue.dropped) == (3, 1)
+
+        # Closing never drops a waiting event
+        queue.put_nowait(None)
+        return [await queue.get() for _ in range(4)]
+
+    events = asyncio.run(run())
+
+    assert events[0].message == _item("b")
+    assert [item.id for item in events[1].message] == ["c", "d"]
+    assert events[2].message == "no id"
+    assert events[3] is None
+
+
+def test_slow_subscriber_does_not_stall_publisher():
+    """Publishing completes while a subscriber reads nothing."""
+
+    async def run():
+        broadcast = FanoutBroadcast(MemoryBackend("memory://"), queue_size=5)
+        await broadcast.connect()
+        try:
+            async with broadcast.subscribe("item_updated") as subscriber:
+                for i in range(50):
+                    await broadcast.publish("item_updated", _item(f"item{i}"))
+                await asyncio.wait_for(broadcast.publish("item_updated", "done"), 1)
+                await asyncio.sleep(0.01)
+
+                queue = subscriber._queue
+                received = [(await subscriber.get()).message for _ in range(5)]
+                return queue.dropped, received
+        finally:
+            await broadcast.disconnect()
+
+    dropped, received = asyncio.run(run())
+
+    assert dropped == 46
+    assert received[-1] == "done"
+    assert [item.id for item in received[:-1]] == [f"item{i}" for i in range(46, 50)]
+
+
+def test_hub_fans_out_between_workers():
+    """Events published by one worker reach the subscribers of every worker."""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "broadcast.sock")
+    hub = BroadcastHub(path).start()
+
+    async def run():
+        url = f"unix://{path}"
+        workers = [FanoutBroadcast(UnixSocketBackend(url)) for _ in range(2)]
+        for worker in workers:
+            await worker.connect()
+        try:
+            async with workers[1].subscribe("item_created") as subscriber:
+                async with workers[0].subscribe("item_created") as own:
+                    # Let the hub register both subscriptions
+                    await asyncio.sleep(0.05)
+                    await workers[0].publish("item_deleted", _item("ignored"))
+                    await workers[0].publish("item_created", [_item("a"), _item("b")])
+                    remote = await asyncio.wait_for(subscriber.get(), 2)
+                    local = await asyncio.wait_for(own.get(), 2)
+                    return remote.message, local.message
+        finally:
+            for worker in workers:
+                await worker.disconnect()
+
+    try:
+        remote, local = asyncio.run(run())
+    finally:
+        hub.stop()
+
+    assert remote == local == [_item("a"), _item("b")]
+    assert isinstance(remote[0], ItemModel)
+    assert not os.path.exists(path)
+
+
+def test_create_backend():
+    """The backend is chosen by the URL scheme."""
+    assert isinstance(create_backend("memory://"), MemoryBackend)
+    assert isinstance(create_backend("unix:///tmp/hub.sock"), UnixSocketBackend)
+    with pytest.raises(ValueError):
+        create_backend("carrier-pigeon://loft")
+
+
+def test_json_backend():
+    """Text backends carry models as JSON and rebuild them on receipt."""
+
+    async def run():
+        inner = MemoryBackend("memory://")
+        backend = JsonBackend(inner)
+        await backend.connect()
+        await backend.subscribe("item_created")
+        await backend.publish("item_created", _item("a"))
+        sent = await inner._published.get()
+        await inner._published.put(sent)
+        return sent.message, await backend.next_published()
+
+    sent, event = asyncio.run(run())
+
+    assert isinstance(sent, str)
+    assert event.channel == "item_created"
+    assert event.message == _item("a")
+
+
+def test_json_backend_splits_large_batches():
+    """Batches over the payload limit go out as several batches that fit."""
+    items = [_item(str(index), "x" * 50) for index in range(20)]
+
+    async def run():
+        inner = MemoryBackend("memory://")
+        backend = JsonBackend(inner, payload_limit=500)
+        await backend.connect()
+        await backend.subscribe("item_created")
+        await backend.publish("item_created", items)
+        sent = []
+        while not inner._published.empty():
+            sent.append(await inner._published.get())
+        for event in sent:
+            await inner._published.put(event)
+        received = [await backend.next_published() for _ in sent]
+
+        with pytest.raises(ValueError):
+            await backend.publish("item_created", _item("big", "x" * 1000))
+        with pytest.raises(ValueError):
+            await backend.publish("item_created", [_item("big", "x" * 1000)])
+        return sent, received
+
+    sent, received = asyncio.run(run())
+
+    assert len(sent) > 1
+    assert all(len(event.message.encode()) <= 500 for event in sent)
+    assert [item for event in received for item in event.message] == items
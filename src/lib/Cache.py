@@ -0,0 +1,158 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    Used for per-process caches of hot lookups (API keys, principals, parsed
+    documents) where a bounded staleness window is acceptable and explicit
+    invalidation covers the local process.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        """Return the cached value for `key`, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    if count:
+                        self.hits += 1
+                    return value
+                del self._entries[key]
+            if count:
+                self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key`, evicting the least recently used entry if full."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for monitoring."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# A change loader receives the watermark to poll from and yields
+# (key, changed_at) for every key changed since then.
+ChangeLoader = Callable[[datetime], Iterable[Tuple[Hashable, Optional[datetime]]]]
+
+
+class ChangeWatcher:
+    """
+    Evicts entries of per-process caches that other processes changed.
+
+    `loader` is polled at most every `refresh_interval` seconds for the keys
+    changed since the newest change seen, reaching `overlap` seconds further
+    back for changes committed late, and `evict` is called for each of them.
+    Call `poll()` before reading the caches it covers.
+    """
+
+    def __init__(
+        self,
+        loader: ChangeLoader,
+        evict: Callable[[Hashable], None],
+        refresh_interval: float = 5.0,
+        overlap: float = 60.0,
+    ):
+        self.loader = loader
+        self.evict = evict
+        self.refresh_interval = refresh_interval
+        self.overlap = overlap
+        self._lock = threading.Lock()
+        # Caches start empty, so changes before now need no eviction
+        self._watermark = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._next_poll = 0.0
+
+    def poll(self, force: bool = False) -> None:
+        """Evict the keys changed since the last poll, if one is due."""
+        now = time.monotonic()
+        if not force and now < self._next_poll:
+            return
+        if not self._lock.acquire(blocking=force):
+            # Another thread is already polling
+            return
+        try:
+            if not force and now < self._next_poll:
+                return
+            self._next_poll = now + self.refresh_interval
+            try:
+                changes = list(
+                    self.loader(self._watermark - timedelta(seconds=self.overlap))
+                )
+            except Exception as e:
+                logging.warning(f"Failed to poll for cache changes: {e}")
+                return
+
+            for key, changed_at in changes:
+                self.evict(key)
+                if changed_at is not None:
+                    if changed_at.tzinfo is not None:
+                        changed_at = changed_at.astimezone(timezone.utc)
+                        changed_at = changed_at.replace(tzinfo=None)
+                    self._watermark = max(self._watermark, changed_at)
+        finally:
+            self._lock.release()
+
+
+@dataclass(frozen=True)
+class CacheHint:
+    """
+    How long results of a type may be served from a response cache.
+
+    Set as a manager's `cache_hint` for data that rarely changes, such as
+    catalogs of providers or roles. Writes through the DB layer invalidate
+    cached results in the writing process; other processes may serve the old
+    results for up to `max_age` seconds.
+    """
+
+    max_age: float = 60.0
@@ -0,0 +1,115 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to sys.path to import Cache
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib.Cache import ChangeWatcher, TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test suite for TTLCache."""
+
+    def test_get_and_set(self):
+        """Stored values are returned until invalidated."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertIn("a", cache)
+
+        cache.invalidate("a")
+        self.assertNotIn("a", cache)
+
+    def test_none_values_are_cached(self):
+        """A cached None is distinguishable from a miss via the default."""
+        cache = TTLCache()
+        cache.set("a", None)
+
+        self.assertIsNone(cache.get("a", default="missing"))
+        self.assertEqual(cache.get("b", default="missing"), "missing")
+
+    def test_expiry(self):
+        """Entries are dropped once their TTL has elapsed."""
+        cache = TTLCache(ttl=10)
+        with patch("lib.Cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("lib.Cache.time.monotonic", return_value=105.0):
+            self.assertEqual(cache.get("a"), 1)
+        with patch("lib.Cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get("a"))
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=None)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+
+    def test_stats(self):
+        """Hits and misses are counted."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+
+class TestChangeWatcher(unittest.TestCase):
+    """Test suite for ChangeWatcher."""
+
+    def test_poll_evicts_changed_keys(self):
+        """Keys changed elsewhere are evicted, polling from the newest change."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        changed_at = datetime(2030, 1, 1, 12, 0, 0)
+        loader = MagicMock(return_value=[("a", changed_at)])
+        watcher = ChangeWatcher(
+            loader, cache.invalidate, refresh_interval=0, overlap=30
+        )
+
+        watcher.poll()
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+
+        loader.return_value = []
+        watcher.poll()
+        loader.assert_called_with(changed_at - timedelta(seconds=30))
+
+    def test_poll_is_throttled(self):
+        """Polls within the refresh interval do not hit the loader."""
+        loader = MagicMock(return_value=[])
+        watcher = ChangeWatcher(loader, MagicMock(), refresh_interval=60)
+
+        watcher.poll()
+        watcher.poll()
+        self.assertEqual(loader.call_count, 1)
+
+        watcher.poll(force=True)
+        self.assertEqual(loader.call_count, 2)
+
+    def test_loader_failure_keeps_cache(self):
+        """A failing loader evicts nothing."""
+        evict = MagicMock()
+        loader = MagicMock(side_effect=Exception("database unavailable"))
+        watcher = ChangeWatcher(loader, evict, refresh_interval=0)
+
+        watcher.poll()
+        evict.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,6 +19,8 @@ class AppSettings(BaseModel):
     APP_EXTENSIONS: str = ""
 
     ROOT_API_KEY: str = "n0ne"
+    API_KEY_SECRET: str = ""
+    API_KEY_CACHE_SECONDS: str = "60"
     SERVER_URI: str = "http://localhost:1996"
     ALLOWED_DOMAINS: str = "*"
 
@@ -36,6 +38,17 @@ class AppSettings(BaseModel):
     LOG_LEVEL: str = "DEBUG"
     REGISTRATION_DISABLED: str = "false"
     SEED_DATA: str = "true"
+    SESSION_REVOCATION_REFRESH_SECONDS: str = "5"
+    PRINCIPAL_CACHE_SECONDS: str = "30"
+    GRAPHQL_MAX_QUERY_DEPTH: str = "10"
+    GRAPHQL_MAX_QUERY_COST: str = "5000"
+    GRAPHQL_DOCUMENT_CACHE_SIZE: str = "1000"
+    GRAPHQL_QUERY_ALLOWLIST: str = ""
+    GRAPHQL_MAX_LIST_SIZE: str = "1000"
+    GRAPHQL_SCHEMA_PLAN_CACHE: str = ""
+    GRAPHQL_RESPONSE_CACHE_SIZE: str = "10000"
+    BROADCAST_URL: str = "memory://"
+    BROADCAST_QUEUE_SIZE: str = "100"
 
     ROOT_ID: str = "FFFFFFFF-FFFF-FFFF-FFFF-FFFFFFFFFFFF"
     SYSTEM_ID: str = "FFFFFFFF-FFFF-FFFF-AAAA-FFFFFFFFFFFF"
@@ -309,6 +309,18 @@ class PydanticUtility:
         for model in models:
             self.register_model(model)
 
+    def get_model_registry(self) -> Dict[str, Type[BaseModel]]:
+        """
+        Get a copy of the name-based model registry.
+
+        Registering its entries again with `register_model`, in order,
+        restores the registry exactly.
+
+        Returns:
+            Dict of registered names to model classes
+        """
+        return dict(self._model_name_to_class)
+
     def find_model_by_name(self, name: str) -> Optional[Type[BaseModel]]:
         """
         Find a model class by name.
@@ -656,23 +668,13 @@ class PydanticUtility:
                 )
 
                 if not ref_model_class:
-                    ref_model_class = type(
-                        ref_model_name,
-                        (BaseModel,),
-                        {
-                            "__annotations__": {"id": str},
-                            "__module__": model_class.__module__,
-                        },
+                    ref_model_class = self.placeholder_model(
+                        ref_model_name, model_class
                     )
 
                 if not network_model_class:
-                    network_model_class = type(
-                        network_model_name,
-                        (BaseModel,),
-                        {
-                            "__annotations__": {"id": str},
-                            "__module__": model_class.__module__,
-                        },
+                    network_model_class = self.placeholder_model(
+                        network_model_name, model_class
                     )
 
                 if manager_class:
@@ -687,6 +689,25 @@ class PydanticUtility:
 
         return relationships
 
+    @staticmethod
+    def placeholder_model(name: str, model_class: Type[BaseModel]) -> Type[BaseModel]:
+        """
+        Create a stand-in for a reference or network model that a BLL module
+        does not define, holding only an id.
+
+        Args:
+            name: Name of the missing model, e.g. "ProjectReferenceModel"
+            model_class: Main model the stand-in belongs to
+
+        Returns:
+            A new model class in the main model's module
+        """
+        return type(
+            name,
+            (BaseModel,),
+            {"__annotations__": {"id": str}, "__module__": model_class.__module__},
+        )
+
     def collect_model_fields(
         self, model_relationships: List[Tuple]
     ) -> Dict[Type[BaseModel], Dict[str, Any]]:
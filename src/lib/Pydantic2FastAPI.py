@@ -1,3 +1,5 @@
+import functools
+import hashlib
 import logging
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
@@ -10,12 +12,13 @@ from fastapi import (
     Path,
     Query,
     Request,
+    Response,
     Security,
     status,
 )
 from fastapi.security import APIKeyHeader, HTTPBasic
 from pluralizer import Pluralizer
-from pydantic import BaseModel, ValidationError, create_model
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -26,6 +29,12 @@ pluralizer = Pluralizer()
 # Generic type variables for network models
 T = TypeVar("T", bound=BaseModel)
 
+# Maximum number of ids resolved by one multi-get request
+MAX_LOOKUP_IDS = 1000
+
+# Response header listing requested ids that were not returned
+MISSING_IDS_HEADER = "X-Missing-Ids"
+
 
 class AuthType(Enum):
     """Authentication types supported by the API."""
@@ -165,6 +174,199 @@ def generate_batch_update_model(resource_name: str) -> Type[BaseModel]:
     )
 
 
+class LookupRequest(BaseModel):
+    """Body of the POST /lookup multi-get route."""
+
+    ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_LOOKUP_IDS,
+        description="IDs of the resources to get",
+    )
+
+
+def get_many_resources(
+    manager: Any, ids: List[str], response: Response, **kwargs
+) -> List[Any]:
+    """
+    Resolve `ids` through `manager.get_many`, in request order, listing the
+    ids that are missing or not permitted in the X-Missing-Ids header.
+
+    Args:
+        manager: The manager to query
+        ids: IDs of the resources to get
+        response: The response to add the header to
+        **kwargs: Passed through to get_many (include, fields, include_strategies)
+
+    Returns:
+        The resources that were found
+    """
+    if len(ids) > MAX_LOOKUP_IDS:
+        from endpoints.AbstractEndpointRouter import InvalidRequestError
+
+        raise InvalidRequestError(f"At most {MAX_LOOKUP_IDS} ids can be requested")
+
+    results = manager.get_many(ids=ids, **kwargs)
+    missing = [id for id, item in zip(ids, results) if item is None]
+    if missing:
+        response.headers[MISSING_IDS_HEADER] = ",".join(dict.fromkeys(missing))
+    return [item for item in results if item is not None]
+
+
+@functools.lru_cache(maxsize=None)
+def response_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Cached TypeAdapter serializing instances of a response model."""
+    return TypeAdapter(model)
+
+
+def json_response(
+    content: BaseModel,
+    status_code: int = status.HTTP_200_OK,
+    response: Optional[Response] = None,
+) -> Response:
+    """
+    Serialize a response model straight to JSON.
+
+    Routes build their response models from manager output, which has been
+    validated already. Returning the serialized Response makes FastAPI skip
+    validating it against `response_model` a second time and converting it
+    with `jsonable_encoder` before the stdlib `json` encoding; pydantic-core
+    writes the JSON in one pass instead.
+
+    Args:
+        content: The response model instance
+        status_code: HTTP status code of the response
+        response: The route's injected Response, whose headers are kept
+
+    Returns:
+        The JSON response
+    """
+    headers = None
+    if response is not None:
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key != "content-length"
+        }
+    return Response(
+        content=response_adapter(type(content)).dump_json(content, by_alias=True),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+_batch_results_adapter = TypeAdapter(Dict[str, List[Dict[str, Any]]])
+
+
+def batch_results_response(
+    results: List[Any],
+    resource_name: Optional[str] = None,
+    network_model_cls: Any = None,
+) -> Optional[Response]:
+    """
+    The 207 Multi-Status response of a non-atomic batch with failed items.
+
+    Its other chunks are committed by then, so rather than an error the
+    client gets every item's status code and either the entity written or
+    the error, by index. None when every item succeeded, and the route
+    answers as usual.
+
+    Args:
+        results: The BatchItemResults returned by the manager
+        resource_name: Key of each entity, as in the single-item response
+        network_model_cls: The network model class, when entities are returned
+
+    Returns:
+        The 207 response, or None
+    """
+    if all(result.ok for result in results):
+        return None
+
+    entries = []
+    for result in results:
+        entry = {"index": result.index, "status_code": result.status_code}
+        if result.id is not None:
+            entry["id"] = result.id
+        if not result.ok:
+            entry["error"] = result.error
+        elif result.item is not None and network_model_cls is not None:
+            single = network_model_cls.ResponseSingle(**{resource_name: result.item})
+            entry[resource_name] = getattr(single, resource_name)
+        entries.append(entry)
+    return Response(
+        content=_batch_results_adapter.dump_json({"results": entries}, by_alias=True),
+        status_code=status.HTTP_207_MULTI_STATUS,
+        media_type="application/json",
+    )
+
+
+def resource_etag(manager: Any, request: Request, **kwargs) -> Optional[str]:
+    """
+    Weak ETag for the response to `request`, derived from the manager's
+    fingerprint of the data and the request URL, without loading the data.
+
+    Args:
+        manager: The manager serving the request
+        request: The request being served
+        **kwargs: Passed through to the manager's fingerprint (id)
+
+    Returns:
+        The ETag, or None if the manager cannot fingerprint the response
+    """
+    fingerprint = getattr(manager, "fingerprint", None)
+    value = fingerprint(**kwargs) if callable(fingerprint) else None
+    return _weak_etag(value, request)
+
+
+def entity_etag(manager: Any, request: Request, entity: Any) -> Optional[str]:
+    """
+    Weak ETag for the response to `request` from an entity that has already
+    been loaded, matching `resource_etag(manager, request, id=entity.id)`.
+
+    Args:
+        manager: The manager serving the request
+        request: The request being served
+        entity: The entity returned by the manager's get
+
+    Returns:
+        The ETag, or None if the manager cannot fingerprint the entity
+    """
+    fingerprint = getattr(manager, "entity_fingerprint", None)
+    value = fingerprint(entity) if callable(fingerprint) else None
+    return _weak_etag(value, request)
+
+
+def _weak_etag(fingerprint: Any, request: Request) -> Optional[str]:
+    if not isinstance(fingerprint, str):
+        return None
+    digest = hashlib.sha256(f"{fingerprint}|{request.url}".encode()).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of `etag` against an If-None-Match header value."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return any(opaque(tag) == opaque(etag) for tag in if_none_match.split(","))
+
+
+def not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """The 304 response to `request` if its If-None-Match covers `etag`."""
+    if etag and etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    return None
+
+
 def create_router(config: RouterConfig) -> APIRouter:
     """
     Create a FastAPI router from Pydantic models.
@@ -259,6 +461,13 @@ def register_create_route(
         1. Single creation: `{{{resource_name}: {{...}}}}`
         2. Batch creation: `{{{resource_name_plural}: [{{...}}, {{...}}, ...]}}`
         
+        Batches are committed in chunks of `chunk_size` items. If any item
+        fails, the others are still created and the response is 207
+        Multi-Status: `{{"results": [...]}}` with each item's `index`,
+        `status_code` and either the created `{resource_name}` or its `error`.
+        With `atomic=true` the whole batch is committed or rolled back as one
+        transaction, and a failure is reported as an error.
+        
         Returns the created resource(s) with generated ID(s).
         """,
         response_model=Union[
@@ -270,6 +479,9 @@ def register_create_route(
                 "description": f"{resource_name.title()} successfully created",
                 "content": {"application/json": create_example},
             },
+            status.HTTP_207_MULTI_STATUS: {
+                "description": "Some items of a non-atomic batch failed; per-item results",
+            },
             status.HTTP_400_BAD_REQUEST: {
                 "description": f"Invalid {resource_name} configuration provided",
             },
@@ -284,31 +496,58 @@ def register_create_route(
             network_model_cls.POST, List[network_model_cls.POST], Dict[str, Any]
         ] = Body(...),
         manager=Depends(manager_factory),
+        atomic: bool = Query(
+            False, description="Create the whole batch in a single transaction"
+        ),
+        chunk_size: Optional[int] = Query(
+            None, ge=1, le=10000, description="Items per transaction for batches"
+        ),
     ):
         """Create a new resource or batch of resources."""
+
+        def batch_created_response(items):
+            if not atomic:
+                multi_status = batch_results_response(
+                    items, resource_name, network_model_cls
+                )
+                if multi_status is not None:
+                    return multi_status
+                items = [result.item for result in items]
+            return json_response(
+                network_model_cls.ResponsePlural(**{resource_name_plural: items}),
+                status.HTTP_201_CREATED,
+            )
+
         try:
             # Handle batch creation from list format
             if isinstance(body, list):
-                items = []
-                for item in body:
-                    item_data = extract_body_data(
-                        item, resource_name, resource_name_plural
-                    )
-                    items.append(manager.create(**item_data))
-                return network_model_cls.ResponsePlural(**{resource_name_plural: items})
+                items = manager.batch_create(
+                    items=[
+                        extract_body_data(item, resource_name, resource_name_plural)
+                        for item in body
+                    ],
+                    atomic=atomic,
+                    chunk_size=chunk_size,
+                )
+                return batch_created_response(items)
 
             # Handle batch creation from dict format with pluralized key
             elif isinstance(body, dict) and resource_name_plural in body:
-                items = []
-                for item_data in body[resource_name_plural]:
-                    items.append(manager.create(**item_data))
-                return network_model_cls.ResponsePlural(**{resource_name_plural: items})
+                items = manager.batch_create(
+                    items=body[resource_name_plural],
+                    atomic=atomic,
+                    chunk_size=chunk_size,
+                )
+                return batch_created_response(items)
 
             # Handle single resource creation
             else:
                 item_data = extract_body_data(body, resource_name, resource_name_plural)
                 result = manager.create(**item_data)
-                return network_model_cls.ResponseSingle(**{resource_name: result})
+                return json_response(
+                    network_model_cls.ResponseSingle(**{resource_name: result}),
+                    status.HTTP_201_CREATED,
+                )
         except Exception as err:
             handle_resource_operation_error(err)
 
@@ -321,6 +560,7 @@ def register_get_route(
     examples: Dict[str, Dict[str, Any]],
     manager_property: Optional[str] = None,
     auth_dependency: Optional[Any] = None,
+    include_strategies: Optional[Dict[str, str]] = None,
 ) -> None:
     """
     Register the GET route for retrieving a single resource.
@@ -333,6 +573,7 @@ def register_get_route(
         examples: Dict of examples for documentation
         manager_property: Optional property path to access on manager
         auth_dependency: Optional authentication dependency
+        include_strategies: Optional loader strategy overrides by include path
     """
     # Handle dependencies
     depends_list = []
@@ -352,6 +593,9 @@ def register_get_route(
         Supports optional query parameters:
         - `include`: List of related entities to include
         - `fields`: List of specific fields to include in the response
+        
+        Responses without `include` carry a weak `ETag`; send it back in
+        `If-None-Match` to get a `304 Not Modified` while it is unchanged.
         """,
         response_model=network_model_cls.ResponseSingle,
         status_code=status.HTTP_200_OK,
@@ -360,6 +604,9 @@ def register_get_route(
                 "description": f"{resource_name.title()} details retrieved successfully",
                 "content": {"application/json": get_example},
             },
+            status.HTTP_304_NOT_MODIFIED: {
+                "description": f"{resource_name.title()} matches the If-None-Match ETag",
+            },
             status.HTTP_404_NOT_FOUND: {
                 "description": f"{resource_name.title()} with specified ID not found",
             },
@@ -367,6 +614,8 @@ def register_get_route(
         dependencies=depends_list,
     )
     async def get_resource(
+        request: Request,
+        response: Response,
         id: str = Path(..., description=f"{resource_name.title()} ID"),
         include: Optional[List[str]] = Query(
             None, description="Related entities to include"
@@ -383,9 +632,26 @@ def register_get_route(
                 for prop in manager_property.split("."):
                     manager = getattr(manager, prop)
 
-            return network_model_cls.ResponseSingle(
-                **{resource_name: manager.get(id=id, include=include, fields=fields)}
+            # Related entities are not fingerprinted. Only a conditional
+            # request pays for checking the tag before the entity is loaded.
+            if not include and request.headers.get("if-none-match"):
+                unchanged = not_modified(
+                    request, resource_etag(manager, request, id=id)
+                )
+                if unchanged:
+                    return unchanged
+
+            entity = manager.get(
+                id=id,
+                include=include,
+                fields=fields,
+                include_strategies=include_strategies,
             )
+            result = network_model_cls.ResponseSingle(**{resource_name: entity})
+            etag = None if include else entity_etag(manager, request, entity)
+            if etag:
+                response.headers["ETag"] = etag
+            return json_response(result, status.HTTP_200_OK, response=response)
         except Exception as err:
             handle_resource_operation_error(err)
 
@@ -399,6 +665,7 @@ def register_list_route(
     examples: Dict[str, Dict[str, Any]],
     manager_property: Optional[str] = None,
     auth_dependency: Optional[Any] = None,
+    include_strategies: Optional[Dict[str, str]] = None,
 ) -> None:
     """
     Register the GET route for listing resources.
@@ -412,6 +679,7 @@ def register_list_route(
         examples: Dict of examples for documentation
         manager_property: Optional property path to access on manager
         auth_dependency: Optional authentication dependency
+        include_strategies: Optional loader strategy overrides by include path
     """
     # Handle dependencies
     depends_list = []
@@ -435,6 +703,13 @@ def register_list_route(
         - `limit`: Maximum number of items to return
         - `sort_by`: Field to sort results by
         - `sort_order`: Sort direction ('asc' or 'desc')
+        
+        With `ids=id1,id2,...` the listed {resource_name_plural} are returned in
+        request order instead (pagination and sorting are ignored). IDs that are
+        missing or not permitted are listed in the `{MISSING_IDS_HEADER}` header.
+        
+        Responses without `include` carry a weak `ETag`; send it back in
+        `If-None-Match` to get a `304 Not Modified` while it is unchanged.
         """,
         response_model=network_model_cls.ResponsePlural,
         status_code=status.HTTP_200_OK,
@@ -443,10 +718,15 @@ def register_list_route(
                 "description": f"List of {resource_name_plural} retrieved successfully",
                 "content": {"application/json": list_example},
             },
+            status.HTTP_304_NOT_MODIFIED: {
+                "description": f"{resource_name_plural.title()} match the If-None-Match ETag",
+            },
         },
         dependencies=depends_list,
     )
     async def list_resources(
+        request: Request,
+        response: Response,
         include: Optional[List[str]] = Query(
             None, description="Related entities to include"
         ),
@@ -461,6 +741,10 @@ def register_list_route(
         sort_order: Optional[str] = Query(
             "asc", description="Sort order (asc or desc)"
         ),
+        ids: Optional[str] = Query(
+            None,
+            description=f"Comma-separated list of {resource_name_plural} IDs to get",
+        ),
         manager=Depends(manager_factory),
     ):
         """List resources with pagination and filtering options."""
@@ -468,17 +752,275 @@ def register_list_route(
             # Get the appropriate manager
             actual_manager = get_manager(manager, manager_property)
 
-            return network_model_cls.ResponsePlural(
-                **{
-                    resource_name_plural: actual_manager.list(
-                        include=include,
-                        fields=fields,
-                        offset=offset,
-                        limit=limit,
-                        sort_by=sort_by,
-                        sort_order=sort_order,
-                    )
-                }
+            # Related entities are not fingerprinted
+            etag = None if include else resource_etag(actual_manager, request)
+            unchanged = not_modified(request, etag)
+            if unchanged:
+                return unchanged
+            if etag:
+                response.headers["ETag"] = etag
+
+            if ids is not None:
+                ids_list = [id.strip() for id in ids.split(",") if id.strip()]
+                return json_response(
+                    network_model_cls.ResponsePlural(
+                        **{
+                            resource_name_plural: get_many_resources(
+                                actual_manager,
+                                ids_list,
+                                response,
+                                include=include,
+                                fields=fields,
+                                include_strategies=include_strategies,
+                            )
+                        }
+                    ),
+                    status.HTTP_200_OK,
+                    response=response,
+                )
+
+            return json_response(
+                network_model_cls.ResponsePlural(
+                    **{
+                        resource_name_plural: actual_manager.list(
+                            include=include,
+                            fields=fields,
+                            offset=offset,
+                            limit=limit,
+                            sort_by=sort_by,
+                            sort_order=sort_order,
+                            include_strategies=include_strategies,
+                        )
+                    }
+                ),
+                status.HTTP_200_OK,
+                response=response,
+            )
+        except Exception as err:
+            handle_resource_operation_error(err)
+
+
+def register_lookup_route(
+    router: APIRouter,
+    resource_name: str,
+    resource_name_plural: str,
+    network_model_cls: Any,
+    manager_factory: Callable,
+    examples: Dict[str, Dict[str, Any]],
+    manager_property: Optional[str] = None,
+    auth_dependency: Optional[Any] = None,
+    include_strategies: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Register the POST /lookup route for getting many resources by ID.
+
+    Args:
+        router: The FastAPI router
+        resource_name: Name of the resource in singular form
+        resource_name_plural: Name of the resource in plural form
+        network_model_cls: The network model class
+        manager_factory: Function that returns manager instance
+        examples: Dict of examples for documentation
+        manager_property: Optional property path to access on manager
+        auth_dependency: Optional authentication dependency
+        include_strategies: Optional loader strategy overrides by include path
+    """
+    # Handle dependencies
+    depends_list = []
+    if auth_dependency:
+        depends_list.append(auth_dependency)
+    depends_list = depends_list if depends_list else None
+
+    # Create example response
+    list_example = create_example_response(examples, "list")
+
+    @router.post(
+        "/lookup",
+        summary=f"Get {resource_name_plural} by ID",
+        description=f"""
+        Retrieves the {resource_name_plural} with the given IDs, in request order.
+        
+        The body form of `GET ?ids=` for lists too long for a URL:
+        `{{"ids": ["id1", "id2", ...]}}` (at most {MAX_LOOKUP_IDS} IDs).
+        IDs that are missing or not permitted are listed in the
+        `{MISSING_IDS_HEADER}` header.
+        """,
+        response_model=network_model_cls.ResponsePlural,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {
+                "description": f"{resource_name_plural.title()} retrieved successfully",
+                "content": {"application/json": list_example},
+            },
+        },
+        dependencies=depends_list,
+    )
+    async def lookup_resources(
+        response: Response,
+        body: LookupRequest = Body(...),
+        include: Optional[List[str]] = Query(
+            None, description="Related entities to include"
+        ),
+        fields: Optional[List[str]] = Query(
+            None, description="Fields to include in response"
+        ),
+        manager=Depends(manager_factory),
+    ):
+        """Get many resources by ID."""
+        try:
+            # Get the appropriate manager
+            actual_manager = get_manager(manager, manager_property)
+
+            return json_response(
+                network_model_cls.ResponsePlural(
+                    **{
+                        resource_name_plural: get_many_resources(
+                            actual_manager,
+                            body.ids,
+                            response,
+                            include=include,
+                            fields=fields,
+                            include_strategies=include_strategies,
+                        )
+                    }
+                ),
+                status.HTTP_200_OK,
+                response=response,
+            )
+        except Exception as err:
+            handle_resource_operation_error(err)
+
+
+def generate_changes_model(
+    resource_name: str, resource_name_plural: str, network_model_cls: Any
+) -> Type[BaseModel]:
+    """
+    Create a dynamic response model for the change feed of a resource.
+
+    Args:
+        resource_name: The name of the resource
+        resource_name_plural: The name of the resource in plural form
+        network_model_cls: The network model class
+
+    Returns:
+        A Pydantic model class for change feed pages
+    """
+    field = network_model_cls.ResponsePlural.model_fields.get(resource_name_plural)
+    item_list_type = field.annotation if field is not None else List[Any]
+    return create_model(
+        f"{resource_name.capitalize()}ChangesModel",
+        **{
+            resource_name_plural: (
+                item_list_type,
+                Field(..., description="Created or updated resources"),
+            ),
+            "deleted_ids": (
+                List[str],
+                Field(..., description="IDs of deleted resources"),
+            ),
+            "next_cursor": (
+                Optional[str],
+                Field(None, description="Cursor to pass as `since` next time"),
+            ),
+            "has_more": (
+                bool,
+                Field(..., description="Whether more changes are waiting"),
+            ),
+        },
+    )
+
+
+def register_changes_route(
+    router: APIRouter,
+    resource_name: str,
+    resource_name_plural: str,
+    network_model_cls: Any,
+    manager_factory: Callable,
+    examples: Dict[str, Dict[str, Any]],
+    manager_property: Optional[str] = None,
+    auth_dependency: Optional[Any] = None,
+    include_strategies: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Register the GET /changes route for incremental sync of resources.
+
+    Must be registered before the GET /{id} route, which would match it.
+
+    Args:
+        router: The FastAPI router
+        resource_name: Name of the resource in singular form
+        resource_name_plural: Name of the resource in plural form
+        network_model_cls: The network model class
+        manager_factory: Function that returns manager instance
+        examples: Dict of examples for documentation
+        manager_property: Optional property path to access on manager
+        auth_dependency: Optional authentication dependency
+        include_strategies: Optional loader strategy overrides by include path
+    """
+    # Handle dependencies
+    depends_list = []
+    if auth_dependency:
+        depends_list.append(auth_dependency)
+    depends_list = depends_list if depends_list else None
+
+    changes_model = generate_changes_model(
+        resource_name, resource_name_plural, network_model_cls
+    )
+
+    @router.get(
+        "/changes",
+        summary=f"Get changed {resource_name_plural}",
+        description=f"""
+        Retrieves the {resource_name_plural} created, updated or deleted since
+        a cursor, oldest change first.
+        
+        Start without `since` to get every {resource_name}, then pass the
+        returned `next_cursor` as `since` to get only what changed afterwards.
+        While `has_more` is true, request the next page straight away.
+        Deleted {resource_name_plural} are listed in `deleted_ids`.
+        """,
+        response_model=changes_model,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {
+                "description": f"Changed {resource_name_plural} retrieved successfully",
+            },
+        },
+        dependencies=depends_list,
+    )
+    async def list_resource_changes(
+        since: Optional[str] = Query(
+            None, description="Cursor returned by the previous request"
+        ),
+        limit: int = Query(
+            100, ge=1, le=1000, description="Maximum number of changes to return"
+        ),
+        include: Optional[List[str]] = Query(
+            None, description="Related entities to include"
+        ),
+        manager=Depends(manager_factory),
+    ):
+        """Get the resources changed since a cursor."""
+        try:
+            # Get the appropriate manager
+            actual_manager = get_manager(manager, manager_property)
+
+            changes = actual_manager.changes(
+                since=since,
+                limit=limit,
+                include=include,
+                include_strategies=include_strategies,
+            )
+            return json_response(
+                changes_model(
+                    **{
+                        resource_name_plural: changes["changed"],
+                        "deleted_ids": changes["deleted_ids"],
+                        "next_cursor": changes["cursor"],
+                        "has_more": changes["has_more"],
+                    }
+                ),
+                status.HTTP_200_OK,
             )
         except Exception as err:
             handle_resource_operation_error(err)
@@ -493,6 +1035,7 @@ def register_search_route(
     examples: Dict[str, Dict[str, Any]],
     manager_property: Optional[str] = None,
     auth_dependency: Optional[Any] = None,
+    include_strategies: Optional[Dict[str, str]] = None,
 ) -> None:
     """
     Register the POST /search route for searching resources.
@@ -506,6 +1049,7 @@ def register_search_route(
         examples: Dict of examples for documentation
         manager_property: Optional property path to access on manager
         auth_dependency: Optional authentication dependency
+        include_strategies: Optional loader strategy overrides by include path
     """
     # Handle dependencies
     depends_list = []
@@ -572,18 +1116,22 @@ def register_search_route(
                 criteria, resource_name, resource_name_plural
             )
 
-            return network_model_cls.ResponsePlural(
-                **{
-                    resource_name_plural: actual_manager.search(
-                        include=include,
-                        fields=fields,
-                        offset=offset,
-                        limit=limit,
-                        sort_by=sort_by,
-                        sort_order=sort_order,
-                        **search_data,
-                    )
-                }
+            return json_response(
+                network_model_cls.ResponsePlural(
+                    **{
+                        resource_name_plural: actual_manager.search(
+                            include=include,
+                            fields=fields,
+                            offset=offset,
+                            limit=limit,
+                            sort_by=sort_by,
+                            sort_order=sort_order,
+                            include_strategies=include_strategies,
+                            **search_data,
+                        )
+                    }
+                ),
+                status.HTTP_200_OK,
             )
         except Exception as err:
             handle_resource_operation_error(err)
@@ -662,8 +1210,11 @@ def register_update_route(
                 body, resource_name, pluralizer.plural(resource_name)
             )
 
-            return network_model_cls.ResponseSingle(
-                **{resource_name: actual_manager.update(id, **update_data)}
+            return json_response(
+                network_model_cls.ResponseSingle(
+                    **{resource_name: actual_manager.update(id, **update_data)}
+                ),
+                status.HTTP_200_OK,
             )
         except Exception as err:
             handle_resource_operation_error(err)
@@ -770,6 +1321,13 @@ def register_batch_update_route(
         Provide a list of resource IDs to update and the fields to change.
         The same field values will be applied to all resources in the batch.
         
+        Updates are committed in chunks of `chunk_size` items. If any item
+        fails, the others are still updated and the response is 207
+        Multi-Status, listing each item's `index`, `id`, `status_code` and
+        either the updated `{resource_name}` or its `error`.
+        With `atomic=true` the whole batch is applied in a
+        single transaction, using one UPDATE statement per chunk where possible.
+        
         Format:
         ```json
         {{
@@ -788,6 +1346,9 @@ def register_batch_update_route(
                 "description": f"{resource_name_plural.title()} successfully updated",
                 "content": {"application/json": batch_update_example},
             },
+            status.HTTP_207_MULTI_STATUS: {
+                "description": "Some items of a non-atomic batch failed; per-item results",
+            },
             status.HTTP_400_BAD_REQUEST: {
                 "description": f"Invalid {resource_name} configuration provided",
             },
@@ -800,6 +1361,12 @@ def register_batch_update_route(
     async def batch_update_resources(
         body: DynamicBatchUpdateModel = Body(...),
         manager=Depends(manager_factory),
+        atomic: bool = Query(
+            False, description="Apply the whole batch in a single transaction"
+        ),
+        chunk_size: Optional[int] = Query(
+            None, ge=1, le=10000, description="Items per transaction or statement"
+        ),
     ):
         """Update multiple resources in a batch."""
         try:
@@ -814,10 +1381,22 @@ def register_batch_update_route(
             items = [{"id": id, "data": update_data} for id in target_ids]
 
             # Perform batch update
-            updated_items = actual_manager.batch_update(items=items)
-
-            return network_model_cls.ResponsePlural(
-                **{resource_name_plural: updated_items}
+            updated_items = actual_manager.batch_update(
+                items=items, atomic=atomic, chunk_size=chunk_size
+            )
+            if not atomic:
+                multi_status = batch_results_response(
+                    updated_items, resource_name, network_model_cls
+                )
+                if multi_status is not None:
+                    return multi_status
+                updated_items = [result.item for result in updated_items]
+
+            return json_response(
+                network_model_cls.ResponsePlural(
+                    **{resource_name_plural: updated_items}
+                ),
+                status.HTTP_200_OK,
             )
         except Exception as err:
             handle_resource_operation_error(err)
@@ -862,6 +1441,13 @@ def register_batch_delete_route(
         Provide a list of resource IDs to delete in the query parameters.
         This operation is permanent and cannot be undone.
         
+        Deletes are committed in chunks of `chunk_size` items. If any item
+        fails, the others are still deleted and the response is 207
+        Multi-Status, listing each item's `index`, `id`, `status_code` and,
+        for failed items, `error`.
+        With `atomic=true` the whole batch is deleted in a
+        single transaction, using one UPDATE statement per chunk where possible.
+        
         Format: `?target_ids=id1,id2,id3`
         """,
         status_code=status.HTTP_204_NO_CONTENT,
@@ -870,6 +1456,9 @@ def register_batch_delete_route(
                 "description": f"{resource_name_plural.title()} successfully deleted",
                 "content": {"application/json": batch_delete_example},
             },
+            status.HTTP_207_MULTI_STATUS: {
+                "description": "Some items of a non-atomic batch failed; per-item results",
+            },
             status.HTTP_400_BAD_REQUEST: {
                 "description": "Invalid request format, missing query parameter(s)",
             },
@@ -885,6 +1474,12 @@ def register_batch_delete_route(
             description=f"Comma-separated list of {resource_name_plural} IDs to delete",
         ),
         manager=Depends(manager_factory),
+        atomic: bool = Query(
+            False, description="Delete the whole batch in a single transaction"
+        ),
+        chunk_size: Optional[int] = Query(
+            None, ge=1, le=10000, description="Items per transaction or statement"
+        ),
     ):
         """Delete multiple resources in a batch."""
         try:
@@ -900,7 +1495,13 @@ def register_batch_delete_route(
                     "No valid IDs provided in target_ids parameter"
                 )
 
-            actual_manager.batch_delete(ids=ids_list)
+            results = actual_manager.batch_delete(
+                ids=ids_list, atomic=atomic, chunk_size=chunk_size
+            )
+            if not atomic:
+                multi_status = batch_results_response(results)
+                if multi_status is not None:
+                    return multi_status
             return Response(status_code=status.HTTP_204_NO_CONTENT)
         except Exception as err:
             handle_resource_operation_error(err)
@@ -991,7 +1592,10 @@ def register_nested_create_route(
             # Create the resource
             result = nested_manager.create(**item_data)
 
-            return network_model_cls.ResponseSingle(**{resource_name: result})
+            return json_response(
+                network_model_cls.ResponseSingle(**{resource_name: result}),
+                status.HTTP_201_CREATED,
+            )
         except Exception as err:
             handle_resource_operation_error(err)
 
@@ -1099,7 +1703,10 @@ def register_nested_list_route(
                 **{parent_param_name: parent_id_value},
             )
 
-            return network_model_cls.ResponsePlural(**{resource_name_plural: results})
+            return json_response(
+                network_model_cls.ResponsePlural(**{resource_name_plural: results}),
+                status.HTTP_200_OK,
+            )
         except Exception as err:
             handle_resource_operation_error(err)
 
@@ -1213,7 +1820,10 @@ def register_nested_search_route(
                 **search_data,
             )
 
-            return network_model_cls.ResponsePlural(**{resource_name_plural: results})
+            return json_response(
+                network_model_cls.ResponsePlural(**{resource_name_plural: results}),
+                status.HTTP_200_OK,
+            )
         except Exception as err:
             handle_resource_operation_error(err)
 
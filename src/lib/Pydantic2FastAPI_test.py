@@ -0,0 +1,148 @@
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import BaseModel, Field
+
+from lib.Pydantic2FastAPI import batch_results_response, json_response, response_adapter
+from logic.AbstractLogicManager import BatchItemResult
+
+
+class ItemModel(BaseModel):
+    id: str
+    name: str
+    description: Optional[str] = None
+    display_name: Optional[str] = Field(None, alias="displayName")
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    tags: List[str] = []
+    score: float = 0.0
+
+
+class ItemResponsePlural(BaseModel):
+    items: List[ItemModel]
+
+
+def _items(count: int) -> ItemResponsePlural:
+    now = datetime(2026, 1, 1, 12, 30, 15, 123456)
+    return ItemResponsePlural(
+        items=[
+            ItemModel(
+                id=f"item-{i}",
+                name=f"Item {i}",
+                description="An item with a reasonably long description " * 2,
+                displayName=f"Item number {i}",
+                created_at=now,
+                updated_at=now,
+                tags=["alpha", "beta"],
+                score=i / 3,
+            )
+            for i in range(count)
+        ]
+    )
+
+
+def _fastapi_body(field, content: BaseModel) -> bytes:
+    """What FastAPI does with a returned model: validate, encode, json.dumps."""
+    encoded = asyncio.run(serialize_response(field=field, response_content=content))
+    return JSONResponse(encoded).body
+
+
+def test_json_response_matches_fastapi_serialization():
+    """The fast path produces the same document as FastAPI's default path."""
+    content = _items(3)
+    field = create_model_field("Response_items", ItemResponsePlural)
+
+    response = json_response(content)
+
+    assert response.status_code == 200
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == json.loads(_fastapi_body(field, content))
+    assert json.loads(response.body)["items"][0]["displayName"] == "Item number 0"
+    assert json.loads(response.body) == jsonable_encoder(content, by_alias=True)
+
+
+def test_json_response_keeps_route_headers():
+    """Headers set on the route's injected Response survive."""
+    injected = Response()
+    del injected.headers["content-length"]
+    injected.headers["ETag"] = 'W/"abc"'
+
+    response = json_response(_items(1), 201, response=injected)
+
+    assert response.status_code == 201
+    assert response.headers["etag"] == 'W/"abc"'
+    assert response.headers["content-length"] == str(len(response.body))
+
+
+def test_response_adapter_is_cached():
+    """One TypeAdapter is built per response model."""
+    assert response_adapter(ItemResponsePlural) is response_adapter(ItemResponsePlural)
+
+
+def test_batch_results_response():
+    """Partial batches answer 207 with each item's outcome; full ones fall through."""
+
+    class ItemNetworkModel:
+        class ResponseSingle(BaseModel):
+            item: ItemModel
+
+    item = _items(1).items[0]
+    created = BatchItemResult(index=0, status_code=201, id=item.id, item=item)
+    failed = BatchItemResult(index=1, status_code=409, error={"message": "Exists"})
+
+    assert batch_results_response([created], "item", ItemNetworkModel) is None
+
+    response = batch_results_response([created, failed], "item", ItemNetworkModel)
+    assert response.status_code == 207
+    body = json.loads(response.body)
+    assert body["results"][0]["item"] == jsonable_encoder(item, by_alias=True)
+    assert body["results"][1] == {
+        "index": 1,
+        "status_code": 409,
+        "error": {"message": "Exists"},
+    }
+
+    deleted = BatchItemResult(index=0, status_code=204, id="a")
+    denied = BatchItemResult(index=1, status_code=403, id="b", error="Denied")
+    assert json.loads(batch_results_response([deleted, denied]).body) == {
+        "results": [
+            {"index": 0, "status_code": 204, "id": "a"},
+            {"index": 1, "status_code": 403, "id": "b", "error": "Denied"},
+        ]
+    }
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run"
+)
+@pytest.mark.parametrize("rows", [1000])
+def test_serialization_benchmark(rows):
+    """Serializing a 1,000-row list response costs less than FastAPI's path."""
+    content = _items(rows)
+    field = create_model_field("Response_items", ItemResponsePlural)
+    iterations = 20
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _fastapi_body(field, content)
+    default_cost = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        json_response(content)
+    fast_cost = (time.perf_counter() - start) / iterations
+
+    assert fast_cost < default_cost, (
+        f"{rows}-row list: validate + jsonable_encoder + json "
+        f"{default_cost * 1000:.2f} ms, json_response {fast_cost * 1000:.2f} ms"
+    )
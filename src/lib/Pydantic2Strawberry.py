@@ -1,33 +1,65 @@
 import asyncio
 import glob
+import hashlib
 import importlib
+import itertools
 import json
 import logging
 import os
 import sys
+import threading
+import time
 from dataclasses import dataclass
 from datetime import date, datetime
-from inspect import Parameter, Signature
+from inspect import Parameter, Signature, isawaitable
 from pathlib import Path
 from typing import (
     Any,
     AsyncGenerator,
     Dict,
+    Generic,
     List,
     Optional,
     Type,
+    TypeVar,
     Union,
     get_args,
     get_origin,
 )
 
 import strawberry
-from broadcaster import Broadcast
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationType,
+    VariableNode,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+    is_list_type,
+    parse,
+)
 from pluralizer import Pluralizer
 from pydantic import BaseModel
+from sqlalchemy import inspect as sa_inspect
+from strawberry.dataloader import DataLoader
+from starlette.requests import HTTPConnection
+from strawberry.extensions import SchemaExtension
+from strawberry.fastapi import GraphQLRouter
 from strawberry.types import Info
+from strawberry.types.nodes import SelectedField
 
+from database.AbstractDatabaseEntity import encode_page_cursor
 from database.Base import get_session
+from database.StaticUnitOfWork import on_commit
+from lib.Broadcast import create_broadcast
+from lib.Cache import CacheHint, TTLCache
 from lib.Environment import env
 from lib.Pydantic import PydanticUtility
 from logic.AbstractLogicManager import AbstractBLLManager
@@ -39,7 +71,9 @@ logging.basicConfig(
 
 # Create global instances
 pydantic_util = PydanticUtility()
-broadcast = Broadcast("memory://")
+broadcast = create_broadcast(
+    env("BROADCAST_URL"), queue_size=int(env("BROADCAST_QUEUE_SIZE"))
+)
 pluralizer = Pluralizer()
 
 
@@ -131,6 +165,30 @@ TYPE_CACHE = {}  # Caches GraphQL types by name
 MODEL_NAME_TO_CLASS = {}  # Maps model names to their classes
 REF_MODEL_FIELDS = {}  # Maps reference models to their fields
 MODELS_BY_NAME = {}  # Maps normalized model names to their classes
+MODEL_MANAGERS = {}  # Maps model and reference model classes to their managers
+MODEL_RELATIONSHIPS = {}  # Maps model classes to their batch-loaded relationships
+TYPE_WEIGHTS = {}  # Maps GraphQL type names to the cost of returning one object
+CACHED_FIELDS = {}  # Maps Query field names of cache hinted types to CachedFields
+SCHEMA_BUILD_TIMINGS = {}  # Seconds spent in each phase of the last schema build
+
+# Bump when the schema plan layout or the discovery rules change
+SCHEMA_PLAN_VERSION = 1
+
+# Most keys a relationship DataLoader sends to the manager in one query
+DATALOADER_MAX_BATCH_SIZE = 500
+
+# Most items a connection page returns, and the default page size
+GRAPHQL_MAX_PAGE_SIZE = 100
+
+# Most items a list field or relationship list returns, and the number a
+# list field returns given no limit
+GRAPHQL_MAX_LIST_SIZE = int(env("GRAPHQL_MAX_LIST_SIZE"))
+
+# Scalar fields one unit of an object's query cost covers
+GRAPHQL_FIELDS_PER_COST_UNIT = 10
+
+# Most items one create_many/update_many/delete_many mutation takes
+GRAPHQL_MAX_BATCH_SIZE = 500
 
 
 @dataclass
@@ -146,6 +204,25 @@ class ModelInfo:
     singular_name: str = ""
 
 
+@dataclass(frozen=True)
+class QueryBudget:
+    """Largest query depth and cost a requester may run; None is unlimited"""
+
+    max_depth: Optional[int]
+    max_cost: Optional[int]
+
+
+@dataclass
+class Relationship:
+    """How a nested model field is loaded from the related model's manager"""
+
+    field_name: str
+    model_class: Type[BaseModel]
+    key_attr: str  # Attribute of the parent object holding the lookup key
+    column: str  # Column of the related entity matched against the keys
+    many: bool = False
+
+
 def import_all_bll_modules():
     """Import all BLL modules from the logic directory and specified extensions."""
     bll_modules = {}
@@ -264,23 +341,35 @@ def discover_model_relationships():
     Discover and map relationships between models from BLL modules.
     Returns a list of model relationship tuples.
     """
-    global MODEL_TO_TYPE, MODEL_FIELDS_MAPPING, MODELS_BY_NAME
+    global MODEL_TO_TYPE, MODEL_FIELDS_MAPPING, MODELS_BY_NAME, MODEL_MANAGERS
 
     # Clear data structures to avoid stale information
     MODEL_TO_TYPE.clear()
     MODEL_FIELDS_MAPPING.clear()
     MODELS_BY_NAME.clear()
+    MODEL_MANAGERS.clear()
 
     try:
-        # Import all BLL modules and discover relationships
-        bll_modules = import_all_bll_modules()
-        model_relationships = pydantic_util.discover_model_relationships(bll_modules)
+        plan_path = env("GRAPHQL_SCHEMA_PLAN_CACHE")
+        plan_key = schema_plan_key() if plan_path else None
+        model_relationships = load_schema_plan(plan_path, plan_key)
+        planned = model_relationships is not None
+
+        if not planned:
+            # Import all BLL modules and discover relationships
+            bll_modules = import_all_bll_modules()
+            model_relationships = pydantic_util.discover_model_relationships(
+                bll_modules
+            )
 
         # Process model fields
         model_fields_mapping = pydantic_util.collect_model_fields(model_relationships)
         MODEL_FIELDS_MAPPING.update(model_fields_mapping)
         pydantic_util.enhance_model_discovery(MODEL_FIELDS_MAPPING)
 
+        if plan_path and not planned:
+            save_schema_plan(plan_path, plan_key, bll_modules, model_relationships)
+
         # Build name-based lookup for models
         for model_class in MODEL_FIELDS_MAPPING:
             normalized_name = model_class.__name__.lower()
@@ -305,15 +394,151 @@ def discover_model_relationships():
         return []
 
 
-def get_model_info():
+def bll_source_files() -> List[Path]:
+    """The files import_all_bll_modules imports models and managers from."""
+    src_dir = Path(__file__).resolve().parent.parent
+    files = sorted((src_dir / "logic").glob("BLL_*.py"))
+
+    extension_list = [
+        ext.strip() for ext in env("APP_EXTENSIONS").split(",") if ext.strip()
+    ]
+    for extension_name in extension_list:
+        ext_dir = src_dir / "extensions" / extension_name
+        files.extend(sorted(ext_dir.glob("BLL_*.py")))
+        if "ext_module" in extension_name:
+            files.extend(sorted(ext_dir.glob("__init__.py")))
+
+    return [path for path in files if not path.name.endswith("_test.py")]
+
+
+def schema_plan_key() -> str:
+    """Hash of the BLL sources and discovery rules a schema plan was made from"""
+    digest = hashlib.sha256(f"schema-plan-{SCHEMA_PLAN_VERSION}".encode())
+    for path in [Path(__file__).resolve().parent / "Pydantic.py", *bll_source_files()]:
+        digest.update(str(path).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _class_path(cls) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _import_class(path: str):
+    module_name, _, qualname = path.partition(":")
+    target = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def save_schema_plan(path: str, key: str, bll_modules, model_relationships) -> None:
+    """
+    Write what discovery found to `path`: the BLL modules imported, each
+    model's classes by import path and the model name registry. Placeholder
+    models that discovery created are stored by name and created again on
+    load.
+    """
+    relationships = []
+    for (
+        model_class,
+        ref_model_class,
+        network_model_class,
+        manager_class,
+    ) in model_relationships:
+        row = [_class_path(model_class)]
+        for cls in (ref_model_class, network_model_class):
+            module = sys.modules.get(cls.__module__)
+            # Placeholders are not attributes of their module
+            placeholder = getattr(module, cls.__name__, None) is not cls
+            row.append(
+                {"placeholder": cls.__name__} if placeholder else _class_path(cls)
+            )
+        row.append(_class_path(manager_class))
+        relationships.append(row)
+
+    registry = {
+        name: _class_path(cls)
+        for name, cls in pydantic_util.get_model_registry().items()
+    }
+    plan = {
+        "key": key,
+        "modules": list(bll_modules),
+        "relationships": relationships,
+        "registry": registry,
+    }
+
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Workers may write at once; each replaces the file whole
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(plan, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logging.warning(f"Could not save GraphQL schema plan to {path}: {e}")
+
+
+def load_schema_plan(path: Optional[str], key: Optional[str]):
+    """
+    Model relationships from the schema plan at `path` if it was made from
+    the same sources (`key`), restoring the model name registry; None if
+    there is no usable plan.
+    """
+    if not path or not os.path.exists(path):
+        return None
+
+    try:
+        with open(path) as f:
+            plan = json.load(f)
+        if plan.get("key") != key:
+            return None
+
+        # Modules without models may still register hooks when imported
+        for module_name in plan["modules"]:
+            importlib.import_module(module_name)
+
+        placeholders = {}
+        model_relationships = []
+        for model_path, ref_path, network_path, manager_path in plan["relationships"]:
+            model_class = _import_class(model_path)
+            related = []
+            for entry in (ref_path, network_path):
+                if isinstance(entry, dict):
+                    cls = pydantic_util.placeholder_model(
+                        entry["placeholder"], model_class
+                    )
+                    placeholders[_class_path(cls)] = cls
+                else:
+                    cls = _import_class(entry)
+                related.append(cls)
+            model_relationships.append(
+                (model_class, *related, _import_class(manager_path))
+            )
+
+        for name, class_path in plan["registry"].items():
+            pydantic_util.register_model(
+                placeholders.get(class_path) or _import_class(class_path), name
+            )
+    except Exception as e:
+        logging.warning(f"Ignoring unusable GraphQL schema plan {path}: {e}")
+        return None
+
+    logging.info(f"Loaded GraphQL schema plan from {path}")
+    return model_relationships
+
+
+def get_model_info(model_relationships=None):
     """
-    Build ModelInfo objects for all discovered models.
+    Build ModelInfo objects for all discovered models, discovering them
+    unless `model_relationships` is given.
     Returns a dict mapping model classes to their ModelInfo.
     """
     model_info_dict = {}
     field_names_used = set()
 
-    model_relationships = discover_model_relationships()
+    if model_relationships is None:
+        model_relationships = discover_model_relationships()
     logging.info(f"Discovered {len(model_relationships)} model relationships")
 
     for (
@@ -324,14 +549,7 @@ def get_model_info():
     ) in model_relationships:
         # Generate field names from model class name
         model_name = model_class.__name__
-        base_name = model_name.replace("Model", "")
-
-        # Convert CamelCase to snake_case
-        singular_name = (
-            "".join(["_" + c.lower() if c.isupper() else c for c in base_name])
-            .lstrip("_")
-            .lower()
-        )
+        singular_name = _model_singular_name(model_class)
         plural_name = pluralizer.plural(singular_name)
 
         # Handle name conflicts
@@ -359,10 +577,24 @@ def get_model_info():
         )
         model_info_dict[model_class] = model_info
         model_info_dict[ref_model_class] = model_info  # Map ref model to the same info
+        MODEL_MANAGERS[model_class] = manager_class
+        MODEL_MANAGERS[ref_model_class] = manager_class
 
     return model_info_dict
 
 
+def _model_singular_name(model_class):
+    """Snake-case name of a model, e.g. UserTeamModel -> user_team"""
+    base_name = model_class.__name__.replace("Model", "")
+
+    # Convert CamelCase to snake_case
+    return (
+        "".join(["_" + c.lower() if c.isupper() else c for c in base_name])
+        .lstrip("_")
+        .lower()
+    )
+
+
 def _get_unique_name(name, used_names):
     """Helper to generate a unique name by adding a numeric suffix"""
     original = name
@@ -373,45 +605,128 @@ def _get_unique_name(name, used_names):
     return name
 
 
+def get_principal(context, session):
+    """
+    Resolve the principal of a GraphQL request from its Authorization
+    header, or None when it has no valid bearer token.
+    """
+    if "request" not in context:
+        return None
+
+    auth_header = context["request"].headers.get("Authorization", "")
+    if not auth_header.startswith("Bearer "):
+        return None
+
+    from database.StaticPermissions import api_key_scopes
+    from logic.BLL_Auth import UserManager
+
+    token = auth_header.replace("Bearer ", "").replace("bearer ", "").strip()
+    try:
+        # Decode once and resolve the principal without a full user load
+        principal = UserManager.verify_token(token, session)
+    except Exception as e:
+        logging.warning(f"Auth verification failed: {str(e)}")
+        return None
+    if principal.scopes is not None:
+        api_key_scopes.set(frozenset(principal.scopes))
+    return principal
+
+
+def get_requester_id(context, session) -> str:
+    """
+    Resolve the requester of a GraphQL request from its Authorization header.
+    Requests without a valid bearer token run as "system".
+    """
+    if context.get("session") is not None:
+        return context["requester_id"]
+    principal = get_principal(context, session)
+    # Default requester ID for test scenarios and user creation
+    return principal.id if principal is not None else "system"
+
+
+async def get_graphql_context(connection: HTTPConnection):
+    """
+    Strawberry context_getter: authenticate once per HTTP request, and share
+    one session and one manager per class between all of its resolvers. The
+    session is closed once the response is sent.
+
+    A websocket can stay open long after its session is revoked or its user
+    deactivated, so its context holds no session: the connection's principal
+    is authenticated with a session closed straight away, and each of its
+    resolver calls and subscription events authenticates again with a
+    short-lived session (see get_context_from_info and verify_connection).
+    """
+    session = get_session()
+    if connection.scope["type"] == "websocket":
+        try:
+            principal = get_principal({"request": connection}, session)
+        finally:
+            session.close()
+        yield {
+            "websocket": True,
+            "requester": principal,
+            "auth_header": connection.headers.get("Authorization", ""),
+        }
+        return
+
+    try:
+        principal = get_principal({"request": connection}, session)
+        yield {
+            "requester_id": principal.id if principal is not None else "system",
+            "requester": principal,
+            "session": session,
+            "auth_header": connection.headers.get("Authorization", ""),
+            "managers": {},
+        }
+    finally:
+        session.close()
+
+
+def verify_connection(context, session) -> Any:
+    """
+    Authenticate a websocket's request again, returning its principal (None
+    for anonymous connections). Raises a GraphQLError once a connection that
+    opened authenticated no longer resolves to the same principal.
+    """
+    principal = get_principal(context, session)
+    opened_as = context.get("requester")
+    if opened_as is not None and (principal is None or principal.id != opened_as.id):
+        raise GraphQLError("Authentication is no longer valid")
+    return principal
+
+
 async def get_context_from_info(info: Info):
     """
     Extract context information from GraphQL Info.
     Returns a dict with session and requester info.
+
+    HTTP requests served through get_graphql_context return their shared
+    context; anything else, including every call over a websocket, gets a
+    session of its own for this call and authenticates again.
     """
+    if info.context.get("session") is not None:
+        return info.context
+
     # Handle case with no request
     if "request" not in info.context:
         session = get_session()
         return {"requester_id": "system", "session": session}
 
     # Process request with auth
-    request = info.context["request"]
-    auth_header = request.headers.get("Authorization", "")
+    auth_header = info.context["request"].headers.get("Authorization", "")
     session = get_session()
 
     try:
-        # Default requester ID for test scenarios and user creation
-        requester_id = "system"
-
-        from logic.BLL_Auth import UserManager
-
-        if auth_header:
-            if auth_header.startswith("Bearer "):
-                token = (
-                    auth_header.replace("Bearer ", "").replace("bearer ", "").strip()
-                )
-                try:
-                    # Verify token and get user
-                    UserManager.verify_token(token, session)
-                    user = UserManager.auth(auth_header)
-                    requester_id = user.id
-                except Exception as e:
-                    logging.warning(f"Auth verification failed: {str(e)}")
-            elif auth_header == "system":
-                # Special case for tests
-                requester_id = "system"
-
+        if info.context.get("websocket"):
+            principal = verify_connection(info.context, session)
+            return {
+                "requester_id": principal.id if principal is not None else "system",
+                "requester": principal,
+                "session": session,
+                "auth_header": auth_header,
+            }
         return {
-            "requester_id": requester_id,
+            "requester_id": get_requester_id(info.context, session),
             "session": session,
             "auth_header": auth_header,
         }
@@ -420,14 +735,216 @@ async def get_context_from_info(info: Info):
         raise
 
 
-def collect_model_fields():
+def close_context(info: Info, context):
+    """
+    End a resolver's use of its context: close a session opened for the
+    call, or roll back a failed transaction on the request's shared session
+    so the next resolver can use it.
     """
-    Collect fields for all models and enhance model discovery.
+    session = context["session"]
+    if context is not info.context:
+        session.close()
+    elif not session.is_active:
+        session.rollback()
+
+
+def get_manager(context, manager_cls, requester_id: Optional[str] = None):
+    """
+    The context's manager of `manager_cls` acting for `requester_id`, the
+    requester by default. Managers are built once per request, from the
+    authenticated principal when there is one instead of a user query.
+    """
+    requester_id = requester_id or context["requester_id"]
+    managers = context.setdefault("managers", {})
+    key = (manager_cls, requester_id)
+    if key not in managers:
+        kwargs = {}
+        if context.get("requester") is not None:
+            if requester_id == context["requester_id"]:
+                kwargs["requester"] = context["requester"]
+        managers[key] = manager_cls(
+            requester_id=requester_id, db=context["session"], **kwargs
+        )
+    return managers[key]
+
+
+def get_relationship_loader(info: Info, manager_cls, column: str, many: bool):
+    """
+    Get the request's DataLoader for `manager_cls` entities matched on `column`,
+    creating it on first use.
+
+    Loaders are cached in the GraphQL context, so every key requested while
+    resolving one level of the query is fetched with a single permission-filtered
+    `manager.list(filters=[column IN (...)])`, and repeated keys are served from
+    the loader's cache until the request ends. A websocket's context outlives
+    its operations, so its loaders only batch and do not cache.
+    """
+    loaders = info.context.setdefault("dataloaders", {})
+    loader_key = (manager_cls, column, many)
+    if loader_key in loaders:
+        return loaders[loader_key]
+
+    async def load(keys):
+        context = await get_context_from_info(info)
+        try:
+            manager = get_manager(context, manager_cls)
+            items = manager.list(
+                filters=[getattr(manager.DBClass, column).in_(list(keys))]
+            )
+        finally:
+            close_context(info, context)
+
+        if many:
+            grouped = {}
+            for item in items:
+                grouped.setdefault(getattr(item, column), []).append(item)
+            return [grouped.get(key, []) for key in keys]
+        by_key = {getattr(item, column): item for item in items}
+        return [by_key.get(key) for key in keys]
+
+    loaders[loader_key] = DataLoader(
+        load_fn=load,
+        max_batch_size=DATALOADER_MAX_BATCH_SIZE,
+        cache=not info.context.get("websocket"),
+    )
+    return loaders[loader_key]
+
+
+def get_relationship(field_name, inner_type, model_class, annotations):
+    """
+    Describe how the nested model field `field_name` of `model_class` is batch
+    loaded, or return None if it can't be.
+
+    A single model `user` is looked up by the parent's `user_id`, and a list of
+    models by the children's `<parent>_id` (e.g. ParentModel.children through
+    ChildModel.parent_id).
+    """
+    related_model = get_model_for_field(field_name, inner_type, model_class)
+    if related_model is None or related_model not in MODEL_FIELDS_MAPPING:
+        return None
+
+    if (
+        get_origin(inner_type) is list
+        or getattr(inner_type, "__origin__", None) is list
+    ):
+        foreign_key = f"{_model_singular_name(model_class)}_id"
+        if foreign_key not in MODEL_FIELDS_MAPPING[related_model]:
+            return None
+        return Relationship(field_name, related_model, "id", foreign_key, many=True)
+
+    foreign_key = f"{field_name}_id"
+    if foreign_key not in annotations:
+        return None
+    return Relationship(field_name, related_model, foreign_key, "id")
+
+
+def create_relationship_resolver(relationship: Relationship):
+    """Create a resolver that loads a relationship through the request's DataLoader"""
+
+    async def resolve_relationship(root, info: Info):
+        # Keep what the manager already included
+        value = getattr(root, relationship.field_name, None)
+        if not value:
+            manager_cls = MODEL_MANAGERS.get(relationship.model_class)
+            key = getattr(root, relationship.key_attr, None)
+            if manager_cls is None or key is None:
+                return value
+
+            loader = get_relationship_loader(
+                info, manager_cls, relationship.column, relationship.many
+            )
+            value = await loader.load(key)
+
+        # Lists are costed as at most GRAPHQL_MAX_LIST_SIZE items
+        if relationship.many:
+            return value[:GRAPHQL_MAX_LIST_SIZE]
+        return value
+
+    resolve_relationship.__name__ = f"resolve_{relationship.field_name}"
+    return resolve_relationship
+
+
+def _collect_selected_names(selections, names):
+    """Add the names of selected fields, looking inside fragments"""
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            names.add(selection.name)
+        else:
+            _collect_selected_names(selection.selections, names)
+
+
+def _find_selections(selections, name):
+    """Sub-selections of the fields called `name` among `selections`"""
+    found = []
+    for selection in selections:
+        if not isinstance(selection, SelectedField):
+            found.extend(_find_selections(selection.selections, name))
+        elif selection.name == name:
+            found.extend(selection.selections)
+    return found
+
+
+def get_selection_projection(
+    info: Info, gql_tp, manager_cls, selections=None
+) -> Dict[str, Any]:
+    """
+    Translate the selection set of the field being resolved (or `selections`,
+    e.g. the nodes of a connection) into manager arguments: the columns to load
+    (`fields`) and the relationships to join (`include`).
+
+    Relationships served by a DataLoader only need their key column. Returns an
+    empty dict, meaning load everything, when the selection can't be mapped
+    onto DBClass (e.g. a computed field is selected).
+    """
+    definition = getattr(gql_tp, "__strawberry_definition__", None)
+    mapper = sa_inspect(getattr(manager_cls, "DBClass", None), raiseerr=False)
+    if definition is None or mapper is None or not info.selected_fields:
+        return {}
+
+    name_converter = info.schema.config.name_converter
+    python_names = {
+        name_converter.get_graphql_name(field): field.python_name
+        for field in definition.fields
+    }
+    if selections is None:
+        selections = info.selected_fields[0].selections
+    selected = set()
+    _collect_selected_names(selections, selected)
+
+    columns = set(mapper.column_attrs.keys())
+    relationships = set(mapper.relationships.keys())
+    batched = MODEL_RELATIONSHIPS.get(getattr(manager_cls, "Model", None), {})
+    fields = {"id"} & columns
+    include = []
+    for graphql_name in selected:
+        if graphql_name.startswith("__"):
+            continue
+        name = python_names.get(graphql_name)
+        if name in batched:
+            fields.add(batched[name].key_attr)
+        elif name in columns:
+            fields.add(name)
+        elif name in relationships:
+            include.append(name)
+        else:
+            return {}
+
+    projection = {"fields": sorted(fields & columns)}
+    if include:
+        projection["include"] = sorted(include)
+    return projection
+
+
+def collect_model_fields(model_info_dict=None):
+    """
+    Collect fields for all models and enhance model discovery, using
+    `model_info_dict` from get_model_info if given.
     Updates the global MODEL_FIELDS_MAPPING and REF_MODEL_FIELDS.
     """
     global MODEL_FIELDS_MAPPING, REF_MODEL_FIELDS
 
-    model_info_dict = get_model_info()
+    if model_info_dict is None:
+        model_info_dict = get_model_info()
 
     # Extract model relationships from model info
     model_relationships = [
@@ -509,6 +1026,7 @@ def create_strawberry_type(
 
     processed_annotations = {}
     scalar_field_descriptions = {}
+    relationships = {}
 
     # Process each field
     for field_name, field_type in annotations.items():
@@ -533,6 +1051,17 @@ def create_strawberry_type(
         # Store the processed type
         if processed_type:
             processed_annotations[field_name] = processed_type
+            if field_name not in scalar_field_descriptions and not is_scalar_type(
+                inner_type
+            ):
+                relationship = get_relationship(
+                    field_name, inner_type, model_class, annotations
+                )
+                if relationship:
+                    relationships[field_name] = relationship
+                    # The related entity may be missing or hidden from the requester
+                    if not relationship.many:
+                        processed_annotations[field_name] = Optional[processed_type]
 
     # Create the class with processed annotations
     cls = type(type_name, (), {"__annotations__": processed_annotations})
@@ -543,6 +1072,13 @@ def create_strawberry_type(
             field = strawberry.field(description=description)
             setattr(cls, field_name, field)
 
+    # Load nested models the manager didn't include in batches
+    if relationships:
+        MODEL_RELATIONSHIPS[model_class] = relationships
+    for field_name, relationship in relationships.items():
+        field = strawberry.field(resolver=create_relationship_resolver(relationship))
+        setattr(cls, field_name, field)
+
     # Register the type
     full_type = strawberry.type(cls)
     model_to_type[model_class] = full_type
@@ -997,6 +1533,51 @@ class UpdateUserInput:
     active: Optional[bool] = None
 
 
+# Connection types for paginated list fields
+NodeT = TypeVar("NodeT")
+
+
+@strawberry.type
+class PageInfo:
+    """Position of a connection page"""
+
+    has_next_page: bool
+    end_cursor: Optional[str] = None
+
+
+@strawberry.type
+class Edge(Generic[NodeT]):
+    """An item of a connection page with its cursor"""
+
+    cursor: str
+    node: NodeT
+
+
+@strawberry.type
+class Connection(Generic[NodeT]):
+    """A page of items; totalCount is only counted when selected"""
+
+    edges: List[Edge[NodeT]]
+    page_info: PageInfo
+    total_count: Optional[int] = None
+
+
+def _page_size(requested: Optional[int]) -> int:
+    """Page size for a connection, capped at GRAPHQL_MAX_PAGE_SIZE"""
+    if not requested or requested < 1:
+        return GRAPHQL_MAX_PAGE_SIZE
+    return min(requested, GRAPHQL_MAX_PAGE_SIZE)
+
+
+def _list_limit(requested: Optional[int]) -> int:
+    """Row limit for a list field, capped at GRAPHQL_MAX_LIST_SIZE"""
+    if requested is None:
+        return GRAPHQL_MAX_LIST_SIZE
+    if requested < 1:
+        raise GraphQLError("limit must be a positive integer")
+    return min(requested, GRAPHQL_MAX_LIST_SIZE)
+
+
 # Input types for filtering
 @strawberry.input
 class StringOperationInput:
@@ -1057,12 +1638,12 @@ def _create_simple_get_resolver(manager_cls, gql_tp):
         """Get an item by ID"""
         context = await get_context_from_info(info)
         try:
-            manager = manager_cls(
-                requester_id=context["requester_id"], db=context["session"]
+            manager = get_manager(context, manager_cls)
+            return manager.get(
+                id=id, **get_selection_projection(info, gql_tp, manager_cls)
             )
-            return manager.get(id=id)
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     return get_method
 
@@ -1116,12 +1697,11 @@ def _create_get_resolver_with_parents(manager_cls, gql_tp, parent_id_fields):
                 query_params[param_name] = kwargs[param_name]
 
         try:
-            manager = manager_cls(
-                requester_id=context["requester_id"], db=context["session"]
-            )
+            manager = get_manager(context, manager_cls)
+            query_params.update(get_selection_projection(info, gql_tp, manager_cls))
             return manager.get(**query_params)
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     # Set function signature and annotations
     get_method_with_parents.__signature__ = sig
@@ -1154,16 +1734,19 @@ def _create_simple_list_resolver(manager_cls, gql_tp):
     """Create a simple list resolver with no parent IDs"""
 
     @strawberry.field
-    async def list_method(self, info: Info) -> List[gql_tp]:
-        """List all items"""
+    async def list_method(
+        self, info: Info, limit: Optional[int] = None
+    ) -> List[gql_tp]:
+        """List all items, or the first `limit` of them"""
         context = await get_context_from_info(info)
         try:
-            manager = manager_cls(
-                requester_id=context["requester_id"], db=context["session"]
+            manager = get_manager(context, manager_cls)
+            return manager.list(
+                limit=_list_limit(limit),
+                **get_selection_projection(info, gql_tp, manager_cls),
             )
-            return manager.list()
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     return list_method
 
@@ -1185,6 +1768,9 @@ def _create_list_resolver_with_parents(manager_cls, gql_tp, parent_id_fields):
         )
         for field_name in parent_id_fields
     }
+    optional_params["limit"] = Parameter(
+        "limit", Parameter.POSITIONAL_OR_KEYWORD, default=None, annotation=Optional[int]
+    )
 
     # Combine parameters
     params = list(required_params.values()) + list(optional_params.values())
@@ -1205,12 +1791,11 @@ def _create_list_resolver_with_parents(manager_cls, gql_tp, parent_id_fields):
         }
 
         try:
-            manager = manager_cls(
-                requester_id=context["requester_id"], db=context["session"]
-            )
-            return manager.list(**query_params)
+            manager = get_manager(context, manager_cls)
+            query_params.update(get_selection_projection(info, gql_tp, manager_cls))
+            return manager.list(limit=_list_limit(kwargs.get("limit")), **query_params)
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     # Set function signature and annotations
     list_method_with_parents.__signature__ = sig
@@ -1224,6 +1809,82 @@ def _create_list_resolver_with_parents(manager_cls, gql_tp, parent_id_fields):
     return strawberry.field(list_method_with_parents)
 
 
+def create_connection_resolver(manager_cls, gql_tp, name, model_cls):
+    """
+    Create a resolver returning one keyset page of items as a connection,
+    filtered by the optional parent ID fields like the list resolver.
+    """
+    parent_id_fields = list(_get_parent_id_fields(model_cls))
+
+    params = [
+        Parameter("self", Parameter.POSITIONAL_OR_KEYWORD),
+        Parameter("info", Parameter.POSITIONAL_OR_KEYWORD, annotation=Info),
+    ] + [
+        Parameter(
+            param_name,
+            Parameter.POSITIONAL_OR_KEYWORD,
+            default=None,
+            annotation=annotation,
+        )
+        for param_name, annotation in [
+            ("first", Optional[int]),
+            ("after", Optional[str]),
+            *((field_name, Optional[str]) for field_name in parent_id_fields),
+        ]
+    ]
+    sig = Signature(parameters=params, return_annotation=Connection[gql_tp])
+
+    async def connection_method(*args, **kwargs):
+        """Page through items with cursors"""
+        info = kwargs.get("info") or args[1]
+        context = await get_context_from_info(info)
+
+        query_params = {
+            param_name: kwargs[param_name]
+            for param_name in parent_id_fields
+            if kwargs.get(param_name) is not None
+        }
+        selections = info.selected_fields[0].selections
+        name_converter = info.schema.config.name_converter
+        selected_names = set()
+        _collect_selected_names(selections, selected_names)
+        node_selections = _find_selections(
+            _find_selections(selections, "edges"), "node"
+        )
+
+        try:
+            manager = get_manager(context, manager_cls)
+            page = manager.list_page(
+                first=_page_size(kwargs.get("first")),
+                after=kwargs.get("after"),
+                **query_params,
+                **get_selection_projection(info, gql_tp, manager_cls, node_selections),
+            )
+            total_count = None
+            if name_converter.apply_naming_config("total_count") in selected_names:
+                total_count = manager.count(**query_params)
+        finally:
+            close_context(info, context)
+
+        return Connection(
+            edges=[
+                Edge(cursor=encode_page_cursor(item.id), node=item)
+                for item in page["items"]
+            ],
+            page_info=PageInfo(
+                has_next_page=page["has_more"], end_cursor=page["cursor"]
+            ),
+            total_count=total_count,
+        )
+
+    connection_method.__signature__ = sig
+    connection_method.__annotations__ = {
+        **{param.name: param.annotation for param in params[1:]},
+        "return": Connection[gql_tp],
+    }
+    return strawberry.field(connection_method)
+
+
 # Mutation resolver builder functions
 def create_create_resolver(manager_cls, gql_tp, input_tp, name, field_name):
     """Create a resolver for creating items."""
@@ -1245,7 +1906,7 @@ def _create_user_creation_resolver(manager_cls, gql_tp, input_tp, field_name):
         context = await get_context_from_info(info)
         try:
             # Use ROOT_ID as requester for user creation
-            manager = manager_cls(requester_id=env("ROOT_ID"), db=context["session"])
+            manager = get_manager(context, manager_cls, env("ROOT_ID"))
 
             # Convert input to dict
             input_dict = {
@@ -1259,11 +1920,11 @@ def _create_user_creation_resolver(manager_cls, gql_tp, input_tp, field_name):
 
             # Publish event
             event_name = "user_created"
-            await broadcast.publish(channel=event_name, message=result)
+            await publish_event(event_name, result)
 
             return result
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     create_user.__name__ = field_name
     create_user.__qualname__ = f"Mutation.{field_name}"
@@ -1278,10 +1939,7 @@ def _create_standard_creation_resolver(manager_cls, gql_tp, input_tp, name, fiel
         """Create a new item"""
         context = await get_context_from_info(info)
         try:
-            manager = manager_cls(
-                requester_id=context["requester_id"],
-                db=context["session"],
-            )
+            manager = get_manager(context, manager_cls)
 
             # Convert input to dict
             input_dict = {
@@ -1295,11 +1953,11 @@ def _create_standard_creation_resolver(manager_cls, gql_tp, input_tp, name, fiel
 
             # Publish event
             event_name = f"{name}_created"
-            await broadcast.publish(channel=event_name, message=result)
+            await publish_event(event_name, result)
 
             return result
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     create_method.__name__ = field_name
     create_method.__qualname__ = f"Mutation.{field_name}"
@@ -1325,10 +1983,7 @@ def _create_user_update_resolver(manager_cls, gql_tp, input_tp, field_name):
         """Update the current user (no id required)"""
         context = await get_context_from_info(info)
         try:
-            manager = manager_cls(
-                requester_id=context["requester_id"],
-                db=context["session"],
-            )
+            manager = get_manager(context, manager_cls)
 
             # Convert input to dict
             input_dict = {
@@ -1342,11 +1997,11 @@ def _create_user_update_resolver(manager_cls, gql_tp, input_tp, field_name):
 
             # Publish event
             event_name = "user_updated"
-            await broadcast.publish(channel=event_name, message=result)
+            await publish_event(event_name, result)
 
             return result
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     update_user.__name__ = field_name
     update_user.__qualname__ = f"Mutation.{field_name}"
@@ -1361,10 +2016,7 @@ def _create_standard_update_resolver(manager_cls, gql_tp, input_tp, name, field_
         """Update an existing item"""
         context = await get_context_from_info(info)
         try:
-            manager = manager_cls(
-                requester_id=context["requester_id"],
-                db=context["session"],
-            )
+            manager = get_manager(context, manager_cls)
 
             # Convert input to dict
             input_dict = {
@@ -1378,11 +2030,11 @@ def _create_standard_update_resolver(manager_cls, gql_tp, input_tp, name, field_
 
             # Publish event
             event_name = f"{name}_updated"
-            await broadcast.publish(channel=event_name, message=result)
+            await publish_event(event_name, result)
 
             return result
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     update_method.__name__ = field_name
     update_method.__qualname__ = f"Mutation.{field_name}"
@@ -1406,9 +2058,7 @@ def _create_user_delete_resolver(manager_cls, name, field_name):
         """Delete the current user or a specified user by ID."""
         context = await get_context_from_info(info)
         try:
-            manager = manager_cls(
-                requester_id=context["requester_id"], db=context["session"]
-            )
+            manager = get_manager(context, manager_cls)
             try:
                 # Use provided ID if available, otherwise use current user ID
                 user_id = id if id is not None else context["requester_id"]
@@ -1419,14 +2069,14 @@ def _create_user_delete_resolver(manager_cls, name, field_name):
 
                 # Publish event
                 event_name = f"{name}_deleted"
-                await broadcast.publish(channel=event_name, message=item)
+                await publish_event(event_name, item)
 
                 return True
             except Exception as e:
                 logging.error(f"Error deleting {name}: {e}")
                 return False
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     delete_user.__name__ = field_name
     delete_user.__qualname__ = f"Mutation.{field_name}"
@@ -1441,9 +2091,7 @@ def _create_standard_delete_resolver(manager_cls, name, field_name):
         """Delete an item"""
         context = await get_context_from_info(info)
         try:
-            manager = manager_cls(
-                requester_id=context["requester_id"], db=context["session"]
-            )
+            manager = get_manager(context, manager_cls)
             try:
                 # Get the item first for the event
                 item = manager.get(id=id)
@@ -1451,21 +2099,171 @@ def _create_standard_delete_resolver(manager_cls, name, field_name):
 
                 # Publish event
                 event_name = f"{name}_deleted"
-                await broadcast.publish(channel=event_name, message=item)
+                await publish_event(event_name, item)
 
                 return True
             except Exception as e:
                 logging.error(f"Error deleting {name}: {e}")
                 return False
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     delete_method.__name__ = field_name
     delete_method.__qualname__ = f"Mutation.{field_name}"
     return delete_method
 
 
+async def publish_event(channel: str, message: Any):
+    """
+    Publish the event of a mutation. The write is committed by then, so a
+    failure to publish is logged rather than failing the mutation.
+    """
+    try:
+        await broadcast.publish(channel=channel, message=message)
+    except Exception as e:
+        logging.error(f"Error publishing {channel} event: {e}")
+
+
+async def publish_batch(channel: str, items: List[Any]):
+    """Publish the items written by one batch mutation as one message"""
+    if items:
+        await publish_event(channel, list(items))
+
+
+def _check_batch_size(items: List[Any]):
+    """Reject batch mutations larger than GRAPHQL_MAX_BATCH_SIZE"""
+    if len(items) > GRAPHQL_MAX_BATCH_SIZE:
+        raise GraphQLError(
+            f"A batch mutation takes at most {GRAPHQL_MAX_BATCH_SIZE} items, "
+            f"got {len(items)}"
+        )
+
+
+def create_batch_update_input_type(input_tp):
+    """Create the input type pairing an id with its update for update_many"""
+    type_name = f"{input_tp.__name__}Item"
+    if type_name not in CREATED_TYPES:
+        cls = type(type_name, (), {"__annotations__": {"id": str, "input": input_tp}})
+        CREATED_TYPES[type_name] = strawberry.input(cls)
+    return CREATED_TYPES[type_name]
+
+
+def create_create_many_resolver(manager_cls, gql_tp, input_tp, name, field_name):
+    """Create a resolver creating several items in one transaction."""
+
+    @strawberry.field
+    async def create_many_method(
+        self, info: Info, inputs: List[input_tp]
+    ) -> List[gql_tp]:
+        """Create several items, all or none of them"""
+        _check_batch_size(inputs)
+        context = await get_context_from_info(info)
+        try:
+            manager = get_manager(context, manager_cls)
+
+            items = [
+                {
+                    k: v
+                    for k, v in vars(input).items()
+                    if not k.startswith("_") and v is not None
+                }
+                for input in inputs
+            ]
+
+            # One transaction, committed before anything is published
+            results = manager.batch_create(items=items, atomic=True)
+
+            await publish_batch(f"{name}_created", results)
+
+            return results
+        finally:
+            close_context(info, context)
+
+    create_many_method.__name__ = field_name
+    create_many_method.__qualname__ = f"Mutation.{field_name}"
+    return create_many_method
+
+
+def create_update_many_resolver(manager_cls, gql_tp, item_tp, name, field_name):
+    """Create a resolver updating several items in one transaction."""
+
+    @strawberry.field
+    async def update_many_method(
+        self, info: Info, items: List[item_tp]
+    ) -> List[gql_tp]:
+        """Update several items, all or none of them"""
+        _check_batch_size(items)
+        context = await get_context_from_info(info)
+        try:
+            manager = get_manager(context, manager_cls)
+
+            updates = [
+                {
+                    "id": item.id,
+                    "data": {
+                        k: v
+                        for k, v in vars(item.input).items()
+                        if not k.startswith("_") and v is not None
+                    },
+                }
+                for item in items
+            ]
+
+            # Items sharing the same data are written with one statement
+            results = manager.batch_update(items=updates, atomic=True)
+
+            await publish_batch(f"{name}_updated", results)
+
+            return results
+        finally:
+            close_context(info, context)
+
+    update_many_method.__name__ = field_name
+    update_many_method.__qualname__ = f"Mutation.{field_name}"
+    return update_many_method
+
+
+def create_delete_many_resolver(manager_cls, name, field_name):
+    """Create a resolver deleting several items in one transaction."""
+
+    @strawberry.field
+    async def delete_many_method(self, info: Info, ids: List[str]) -> bool:
+        """Delete several items, all or none of them"""
+        _check_batch_size(ids)
+        context = await get_context_from_info(info)
+        try:
+            manager = get_manager(context, manager_cls)
+            try:
+                # Get the items first for the event, in one query
+                items = [item for item in manager.get_many(ids=ids) if item]
+                manager.batch_delete(ids=ids, atomic=True)
+
+                await publish_batch(f"{name}_deleted", items)
+
+                return True
+            except Exception as e:
+                logging.error(f"Error deleting {name} batch: {e}")
+                return False
+        finally:
+            close_context(info, context)
+
+    delete_many_method.__name__ = field_name
+    delete_many_method.__qualname__ = f"Mutation.{field_name}"
+    return delete_many_method
+
+
 # Subscription resolver builder functions
+def _verify_subscriber(info: Info) -> None:
+    """Authenticate a websocket subscriber again, with a short-lived session"""
+    if not info.context.get("websocket"):
+        return
+    session = get_session()
+    try:
+        verify_connection(info.context, session)
+    finally:
+        session.close()
+
+
 def create_subscription_resolver(gql_tp, name, field_name, event_type="created"):
     """Create a subscription resolver for model events."""
 
@@ -1473,9 +2271,17 @@ def create_subscription_resolver(gql_tp, name, field_name, event_type="created")
     async def subscription_method(self, info: Info) -> AsyncGenerator[gql_tp, None]:
         """Subscribe to model events"""
         channel = f"{name}_{event_type}"
+        _verify_subscriber(info)
         async with broadcast.subscribe(channel=channel) as subscriber:
             async for message in subscriber:
-                yield message
+                # The stream ends once the subscriber's session is revoked
+                _verify_subscriber(info)
+                # Batch mutations publish all their items as one message
+                if isinstance(message, list):
+                    for item in message:
+                        yield item
+                else:
+                    yield message
 
     # Set the name and qualname properties
     subscription_method.__name__ = field_name
@@ -1508,6 +2314,8 @@ def build_query_class(model_info_dict: Dict[Type, ModelInfo]):
     for model_class, info in model_info_dict.items():
         singular_name = info.singular_name
         plural_name = info.plural_name
+        # Reference models share the info; resolvers return the full model
+        model_class = info.model_class
         manager_class = info.manager_class
 
         # Create type if not already created
@@ -1532,6 +2340,19 @@ def build_query_class(model_info_dict: Dict[Type, ModelInfo]):
             manager_class, gql_type, plural_name, model_class
         )
 
+        # Create connection resolver for paging through them
+        query_fields[f"{plural_name}_connection"] = create_connection_resolver(
+            manager_class, gql_type, plural_name, model_class
+        )
+
+        hint = getattr(manager_class, "cache_hint", None)
+        if hint is not None:
+            for field_name in (singular_name, plural_name):
+                CACHED_FIELDS[field_name] = CachedField(manager_class, gql_type, hint)
+            CACHED_FIELDS[f"{plural_name}_connection"] = CachedField(
+                manager_class, gql_type, hint, connection=True
+            )
+
     return type("Query", (), query_fields)
 
 
@@ -1546,9 +2367,7 @@ def _create_user_resolver():
             from logic.BLL_Auth import UserManager
 
             # Get either the specified user or the current user
-            manager = UserManager(
-                requester_id=context["requester_id"], db=context["session"]
-            )
+            manager = get_manager(context, UserManager)
 
             # If ID is not provided, use the current requester's ID
             user_id = id if id is not None else context["requester_id"]
@@ -1561,7 +2380,7 @@ def _create_user_resolver():
             logging.error(f"Error in user query: {str(e)}")
             raise
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     user.__qualname__ = "Query.user"
     return user
@@ -1580,9 +2399,7 @@ def _create_users_resolver():
             from logic.BLL_Auth import UserManager
 
             # Get the current user
-            manager = UserManager(
-                requester_id=context["requester_id"], db=context["session"]
-            )
+            manager = get_manager(context, UserManager)
 
             current_user = manager.get(id=context["requester_id"])
             user_dict = (
@@ -1602,7 +2419,7 @@ def _create_users_resolver():
             logging.error(f"Error in users query: {str(e)}")
             raise
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     users.__qualname__ = "Query.users"
     return users
@@ -1668,6 +2485,15 @@ def build_mutation_class(model_info_dict: Dict[Type, ModelInfo]):
         create_field = _get_unique_field_name(f"create_{singular_name}", field_names)
         update_field = _get_unique_field_name(f"update_{singular_name}", field_names)
         delete_field = _get_unique_field_name(f"delete_{singular_name}", field_names)
+        create_many_field = _get_unique_field_name(
+            f"create_many_{singular_name}", field_names
+        )
+        update_many_field = _get_unique_field_name(
+            f"update_many_{singular_name}", field_names
+        )
+        delete_many_field = _get_unique_field_name(
+            f"delete_many_{singular_name}", field_names
+        )
 
         # Get Create and Update classes
         create_class = getattr(model_class, "Create", None)
@@ -1679,6 +2505,9 @@ def build_mutation_class(model_info_dict: Dict[Type, ModelInfo]):
             mutation_fields[create_field] = create_create_resolver(
                 manager_class, gql_type, create_input, singular_name, create_field
             )
+            mutation_fields[create_many_field] = create_create_many_resolver(
+                manager_class, gql_type, create_input, singular_name, create_many_field
+            )
 
         # Add update mutation
         if update_class:
@@ -1686,11 +2515,21 @@ def build_mutation_class(model_info_dict: Dict[Type, ModelInfo]):
             mutation_fields[update_field] = create_update_resolver(
                 manager_class, gql_type, update_input, singular_name, update_field
             )
+            mutation_fields[update_many_field] = create_update_many_resolver(
+                manager_class,
+                gql_type,
+                create_batch_update_input_type(update_input),
+                singular_name,
+                update_many_field,
+            )
 
         # Add delete mutation
         mutation_fields[delete_field] = create_delete_resolver(
             manager_class, singular_name, delete_field
         )
+        mutation_fields[delete_many_field] = create_delete_many_resolver(
+            manager_class, singular_name, delete_many_field
+        )
 
     return type("Mutation", (), mutation_fields)
 
@@ -1717,7 +2556,7 @@ def _create_user_creation_mutation():
             from logic.BLL_Auth import UserManager
 
             # Use ROOT_ID as requester for user creation
-            manager = UserManager(requester_id=env("ROOT_ID"), db=context["session"])
+            manager = get_manager(context, UserManager, env("ROOT_ID"))
 
             # Convert input to dict
             input_dict = {
@@ -1736,7 +2575,7 @@ def _create_user_creation_mutation():
             logging.error(f"Error creating user: {str(e)}")
             raise
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     create_user.__qualname__ = "Mutation.createUser"
     return create_user
@@ -1753,9 +2592,7 @@ def _create_user_update_mutation():
             from logic.BLL_Auth import UserManager
 
             # Use the current user's context
-            manager = UserManager(
-                requester_id=context["requester_id"], db=context["session"]
-            )
+            manager = get_manager(context, UserManager)
 
             # Convert input to dict
             input_dict = {
@@ -1774,7 +2611,7 @@ def _create_user_update_mutation():
             logging.error(f"Error updating user: {str(e)}")
             raise
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     update_user.__qualname__ = "Mutation.updateUser"
     return update_user
@@ -1798,7 +2635,7 @@ def _create_user_delete_mutation():
 
             # Use appropriate requester ID based on environment
             requester_id = env("ROOT_ID") if in_test_mode else context["requester_id"]
-            manager = UserManager(requester_id=requester_id, db=context["session"])
+            manager = get_manager(context, UserManager, requester_id)
 
             try:
                 # Use provided ID if available, otherwise use current user's ID
@@ -1809,7 +2646,7 @@ def _create_user_delete_mutation():
                 logging.error(f"Error deleting user: {e}")
                 return False
         finally:
-            context["session"].close()
+            close_context(info, context)
 
     delete_user.__qualname__ = "Mutation.deleteUser"
     return delete_user
@@ -1858,6 +2695,619 @@ def build_subscription_class(model_info_dict: Dict[Type, ModelInfo]):
     return type("Subscription", (), subscription_fields)
 
 
+# Query budgets by user ID or role name; everyone else gets default_query_budget()
+QUERY_BUDGETS: Dict[str, QueryBudget] = {
+    env("ROOT_ID"): QueryBudget(max_depth=None, max_cost=None),
+    env("SYSTEM_ID"): QueryBudget(max_depth=None, max_cost=None),
+}
+
+# Per-process cache of requester id -> QueryBudget
+query_budget_cache = TTLCache(
+    maxsize=4096, ttl=float(env("PRINCIPAL_CACHE_SECONDS") or 30)
+)
+
+
+def default_query_budget() -> QueryBudget:
+    """Budget of requesters without an entry in QUERY_BUDGETS"""
+    return QueryBudget(
+        max_depth=int(env("GRAPHQL_MAX_QUERY_DEPTH")),
+        max_cost=int(env("GRAPHQL_MAX_QUERY_COST")),
+    )
+
+
+def get_role_names(requester_id: str, db) -> List[str]:
+    """Names of the roles the requester currently holds in any team"""
+    from sqlalchemy import or_
+
+    from database.DB_Auth import Role, UserTeam
+
+    rows = (
+        db.query(Role.name)
+        .join(UserTeam, UserTeam.role_id == Role.id)
+        .filter(
+            UserTeam.user_id == requester_id,
+            UserTeam.enabled == True,
+            or_(UserTeam.expires_at == None, UserTeam.expires_at > datetime.now()),
+        )
+        .distinct()
+        .all()
+    )
+    return [row.name for row in rows]
+
+
+def get_query_budget(requester_id: str, db) -> QueryBudget:
+    """
+    Budget of a requester: their own QUERY_BUDGETS entry, else the entry of
+    their highest role that has one, else the default budget.
+    """
+    if requester_id in QUERY_BUDGETS:
+        return QUERY_BUDGETS[requester_id]
+
+    budget = query_budget_cache.get(requester_id)
+    if budget is not None:
+        return budget
+
+    budget = default_query_budget()
+    from database.StaticPermissions import _get_role_hierarchy_map
+
+    role_levels = _get_role_hierarchy_map(db)
+    if any(name in role_levels for name in QUERY_BUDGETS):
+        roles = [
+            name for name in get_role_names(requester_id, db) if name in QUERY_BUDGETS
+        ]
+        if roles:
+            budget = QUERY_BUDGETS[max(roles, key=lambda name: role_levels[name])]
+
+    query_budget_cache.set(requester_id, budget)
+    return budget
+
+
+def type_weight(gql_type, manager_class=None) -> int:
+    """
+    Query cost of returning one object of `gql_type`: its manager's
+    query_weight if it declares one, otherwise one unit per
+    GRAPHQL_FIELDS_PER_COST_UNIT scalar fields, at least 1. Object fields are
+    not counted, since selecting them is costed as objects of their own.
+    """
+    declared = getattr(manager_class, "query_weight", None)
+    if declared is not None:
+        return declared
+
+    scalar_fields = 0
+    for field in gql_type.__strawberry_definition__.fields:
+        field_type = field.type
+        while hasattr(field_type, "of_type"):
+            field_type = field_type.of_type
+        if not hasattr(field_type, "__strawberry_definition__"):
+            scalar_fields += 1
+    return max(1, -(-scalar_fields // GRAPHQL_FIELDS_PER_COST_UNIT))
+
+
+def _argument_size(node: FieldNode, variables: Dict[str, Any]) -> Optional[int]:
+    """Value of a field's `first` or `limit` argument, if it is an int"""
+    for argument in node.arguments:
+        if argument.name.value not in ("first", "limit"):
+            continue
+        value = argument.value
+        if isinstance(value, IntValueNode):
+            return int(value.value)
+        if isinstance(value, VariableNode):
+            size = variables.get(value.name.value)
+            return size if isinstance(size, int) else None
+    return None
+
+
+def measure_selections(
+    schema, selection_set, parent_type, fragments, variables, page_size=None
+):
+    """
+    Static (cost, depth) of a selection set.
+
+    Each object a field can return costs its type's TYPE_WEIGHTS entry, times
+    the most items its list can hold: for list fields, their `limit` argument
+    capped at GRAPHQL_MAX_LIST_SIZE, which is also what they return given
+    none. Relationship lists are capped at GRAPHQL_MAX_LIST_SIZE too, and
+    count as that many. A connection passes its `first` argument, capped at
+    GRAPHQL_MAX_PAGE_SIZE, to its list children (the edges). Unknown fields
+    are left to validation; a non-positive `limit` raises GraphQLError.
+    """
+    cost = depth = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            field = getattr(parent_type, "fields", {}).get(selection.name.value)
+            if field is None:
+                continue
+            paged = "first" in field.args
+            size = _argument_size(selection, variables)
+            count = 1
+            many = is_list_type(get_nullable_type(field.type))
+            if many and "limit" in field.args:
+                try:
+                    count = _list_limit(size)
+                except GraphQLError as error:
+                    raise GraphQLError(error.message, selection) from error
+            elif many:
+                count = page_size or GRAPHQL_MAX_LIST_SIZE
+            field_type = get_named_type(field.type)
+            child_cost = child_depth = 0
+            if selection.selection_set:
+                child_cost, child_depth = measure_selections(
+                    schema,
+                    selection.selection_set,
+                    field_type,
+                    fragments,
+                    variables,
+                    _page_size(size) if paged and not many else None,
+                )
+            cost += count * (TYPE_WEIGHTS.get(field_type.name, 0) + child_cost)
+            depth = max(depth, 1 + child_depth)
+            continue
+
+        if isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.pop(selection.name.value, None)
+            if fragment is None:
+                continue
+        else:
+            fragment = selection
+        fragment_type = parent_type
+        if fragment.type_condition:
+            fragment_type = schema.get_type(fragment.type_condition.name.value)
+        fragment_cost, fragment_depth = measure_selections(
+            schema,
+            fragment.selection_set,
+            fragment_type,
+            fragments,
+            variables,
+            page_size,
+        )
+        if isinstance(selection, FragmentSpreadNode):
+            fragments[selection.name.value] = fragment
+        cost += fragment_cost
+        depth = max(depth, fragment_depth)
+    return cost, depth
+
+
+class QueryCostLimiter(SchemaExtension):
+    """
+    Rejects operations that exceed the requester's QueryBudget once they
+    are validated, before any resolver runs, and reports their cost in the
+    response's `extensions.cost`.
+    """
+
+    def __init__(self, *, execution_context=None):
+        self.cost = None
+        self.depth = None
+        self.budget = None
+
+    def get_budget(self) -> QueryBudget:
+        """Budget of the requester of this operation"""
+        if self.budget is None:
+            context = self.execution_context.context or {}
+            if context.get("session") is not None:
+                # The request's context has already authenticated it
+                self.budget = get_query_budget(
+                    context["requester_id"], context["session"]
+                )
+                return self.budget
+            session = get_session()
+            try:
+                requester_id = get_requester_id(context, session)
+                self.budget = get_query_budget(requester_id, session)
+            finally:
+                session.close()
+        return self.budget
+
+    def check_budget(self) -> List[GraphQLError]:
+        """Measure the operation and return the budget it exceeds, as errors"""
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+        operation = get_operation_ast(document, execution_context.operation_name)
+        if operation is None:
+            return []
+
+        fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        schema = execution_context.schema._schema
+        try:
+            self.cost, self.depth = measure_selections(
+                schema,
+                operation.selection_set,
+                schema.get_root_type(operation.operation),
+                fragments,
+                execution_context.variables or {},
+            )
+        except GraphQLError as error:
+            return [error]
+
+        budget = self.get_budget()
+        errors = []
+        if budget.max_depth is not None and self.depth > budget.max_depth:
+            errors.append(
+                GraphQLError(
+                    f"Query depth {self.depth} exceeds the maximum "
+                    f"of {budget.max_depth}",
+                    operation,
+                )
+            )
+        if budget.max_cost is not None and self.cost > budget.max_cost:
+            errors.append(
+                GraphQLError(
+                    f"Query cost {self.cost} exceeds the maximum of {budget.max_cost}",
+                    operation,
+                )
+            )
+        return errors
+
+    def on_execute(self):
+        errors = self.check_budget()
+        if errors:
+            # A result set before execution is returned instead of executing
+            self.execution_context.result = ExecutionResult(data=None, errors=errors)
+        yield
+
+    def get_results(self):
+        if self.cost is None:
+            return {}
+        return {
+            "cost": {
+                "requested": self.cost,
+                "depth": self.depth,
+                "maximum": self.budget.max_cost,
+                "maximum_depth": self.budget.max_depth,
+            }
+        }
+
+
+@dataclass
+class CachedDocument:
+    """A parsed query, and its validation errors once validated"""
+
+    query: str
+    document: DocumentNode
+    # (validation rules, errors) of the last validation
+    validation: Optional[tuple] = None
+
+
+# Per-process LRU of query hash -> CachedDocument; also the APQ store
+document_cache = TTLCache(maxsize=int(env("GRAPHQL_DOCUMENT_CACHE_SIZE")), ttl=None)
+
+
+def load_query_allowlist(path: Optional[str]) -> Optional[Dict[str, str]]:
+    """
+    Load a persisted query manifest: a JSON object mapping each query's
+    sha256 hash to its text. Returns None when no path is configured.
+    """
+    if not path:
+        return None
+    with open(path) as manifest:
+        queries = json.load(manifest)
+    for query_hash, query in queries.items():
+        if hash_query(query) != query_hash:
+            raise ValueError(f"Hash {query_hash} in {path} does not match its query")
+    return queries
+
+
+def hash_query(query: str) -> str:
+    """Hex sha256 of a query's text, as sent by Automatic Persisted Query clients"""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+async def get_persisted_query_hash(context) -> Optional[str]:
+    """
+    Hash of the `persistedQuery` extension of an HTTP request:
+    `{"extensions": {"persistedQuery": {"version": 1, "sha256Hash": ...}}}`
+    in the JSON body, or the same object in the `extensions` parameter of a GET.
+    """
+    request = context.get("request") if isinstance(context, dict) else None
+    if request is None or not hasattr(request, "method"):
+        return None
+    try:
+        if request.method == "GET":
+            extensions = json.loads(request.query_params.get("extensions") or "{}")
+        else:
+            extensions = (await request.json()).get("extensions") or {}
+        persisted_query = extensions.get("persistedQuery") or {}
+    except (ValueError, AttributeError):
+        return None
+    if persisted_query.get("version") != 1:
+        return None
+    return persisted_query.get("sha256Hash")
+
+
+# Queries allowed when GRAPHQL_QUERY_ALLOWLIST names a manifest; None allows any
+PERSISTED_QUERY_ALLOWLIST = load_query_allowlist(env("GRAPHQL_QUERY_ALLOWLIST"))
+
+
+class PersistedQueries(SchemaExtension):
+    """
+    Parses and validates each distinct query once, and lets clients send
+    its sha256 hash instead of its text (Automatic Persisted Queries).
+
+    Documents are kept in `document_cache` by query hash, with the result
+    of their last validation. Any query the server has seen can then be
+    sent as a hash alone; an unknown hash answers `PersistedQueryNotFound`
+    and the client retries with the text. With PERSISTED_QUERY_ALLOWLIST
+    set, only the manifest's queries run, by hash or by text.
+    """
+
+    def __init__(self, *, execution_context=None):
+        self.query_hash = None
+        self.cached = None
+
+    async def on_operation(self):
+        execution_context = self.execution_context
+        allowlist = PERSISTED_QUERY_ALLOWLIST
+        if execution_context.query:
+            self.query_hash = hash_query(execution_context.query)
+            if allowlist is not None and self.query_hash not in allowlist:
+                raise GraphQLError(
+                    "PersistedQueryNotAllowed",
+                    extensions={"code": "PERSISTED_QUERY_NOT_ALLOWED"},
+                )
+        else:
+            self.query_hash = await get_persisted_query_hash(execution_context.context)
+            if self.query_hash:
+                if allowlist is not None:
+                    query = allowlist.get(self.query_hash)
+                else:
+                    cached = document_cache.get(self.query_hash)
+                    query = cached.query if cached else None
+                if query is None:
+                    raise GraphQLError(
+                        "PersistedQueryNotFound",
+                        extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+                    )
+                execution_context.query = query
+        yield
+
+    def on_parse(self):
+        execution_context = self.execution_context
+        if self.query_hash and not execution_context.graphql_document:
+            cached = document_cache.get(self.query_hash)
+            if cached is None:
+                try:
+                    document = parse(
+                        execution_context.query, **execution_context.parse_options
+                    )
+                except GraphQLError:
+                    # Let the default parser report the syntax error
+                    yield
+                    return
+                cached = CachedDocument(execution_context.query, document)
+                document_cache.set(self.query_hash, cached)
+            self.cached = cached
+            execution_context.graphql_document = cached.document
+        yield
+
+    def on_validate(self):
+        execution_context = self.execution_context
+        cached = self.cached
+        rules = execution_context.validation_rules
+        if cached is None or execution_context.errors is not None:
+            yield
+            return
+
+        validation = cached.validation
+        if validation is not None and validation[0] == rules:
+            # Set errors skip the default validation step
+            execution_context.errors = list(validation[1])
+            yield
+            return
+
+        yield
+        cached.validation = (rules, list(execution_context.errors or []))
+
+
+@dataclass
+class CachedField:
+    """A Query field whose results ResponseCache may serve"""
+
+    manager_class: Any
+    gql_type: Any
+    hint: CacheHint
+    # Connections project the selections of their nodes
+    connection: bool = False
+
+
+# Per-process LRU of Query field results, each kept for its hint's max_age
+response_cache = TTLCache(maxsize=int(env("GRAPHQL_RESPONSE_CACHE_SIZE")), ttl=None)
+# Per-field counts of response_cache hits, misses and invalidated entries
+response_cache_counters: Dict[str, Dict[str, int]] = {}
+# Latest committed write seen per DB class, stamped by the hooks
+# watch_for_writes adds
+write_generations: Dict[type, int] = {}
+_write_counter = itertools.count(1)
+_watch_lock = threading.Lock()
+
+
+def _stamp_write(db_class):
+    def stamp():
+        write_generations[db_class] = next(_write_counter)
+
+    def stamp_write(entity, *args):
+        # Inside a unit of work the write is only visible once it commits;
+        # the session is the hooks' last argument
+        on_commit(args[-1], stamp)
+
+    return stamp_write
+
+
+def watch_for_writes(db_class) -> None:
+    """
+    Add after create/update/delete hooks to `db_class` that invalidate the
+    cached results read from it once the write commits, once per class.
+    """
+    if db_class in write_generations:
+        return
+    with _watch_lock:
+        if db_class in write_generations:
+            return
+        hook = _stamp_write(db_class)
+        for hook_type in ("create", "update", "delete"):
+            db_class.hooks[hook_type]["after"].append(hook)
+        write_generations[db_class] = 0
+
+
+def cache_dependencies(manager_class, projection: Dict[str, Any]) -> List[type]:
+    """
+    The DB classes a cached result of `manager_class` was read from: its
+    DBClass and the relationships the projection joins (all of them when it
+    loads everything).
+    """
+    db_class = manager_class.DBClass
+    relationships = sa_inspect(db_class).relationships
+    if projection:
+        names = projection.get("include", [])
+    else:
+        names = relationships.keys()
+    return [db_class, *(relationships[name].mapper.class_ for name in names)]
+
+
+def _operation_acl_fingerprint(context: Dict[str, Any]) -> Optional[tuple]:
+    """acl_fingerprint of the operation's session, queried once per operation"""
+    from database.StaticPermissions import acl_fingerprint
+
+    if "acl_fingerprint" not in context:
+        context["acl_fingerprint"] = acl_fingerprint(context["session"])
+    return context["acl_fingerprint"]
+
+
+def response_cache_stats() -> Dict[str, Any]:
+    """Size of response_cache, and hit rates per cached Query field"""
+    fields = {}
+    for field_name, counters in response_cache_counters.items():
+        total = sum(counters.values())
+        fields[field_name] = {
+            **counters,
+            "hit_rate": counters["hits"] / total if total else 0.0,
+        }
+    return {
+        "size": len(response_cache),
+        "maxsize": response_cache.maxsize,
+        "fields": fields,
+    }
+
+
+class ResponseCache(SchemaExtension):
+    """
+    Serves the Query fields of types whose manager has a cache_hint from
+    response_cache, and reports the operation's hits and misses in the
+    response's `extensions.cache`.
+
+    Results are cached per field, arguments, projected columns, requester
+    and API key scopes. Each entry records the acl_fingerprint of the
+    permission tables, read from the database so grants and revocations made
+    by any worker invalidate it, and the committed writes this process has
+    seen to the tables it was read from. Writes to those tables by other
+    processes are not seen; their entries expire after the hint's max_age.
+    Nothing is cached while the latest permission change is unsettled.
+    """
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        if (
+            info.path.prev is not None
+            or info.operation.operation != OperationType.QUERY
+        ):
+            return _next(root, info, *args, **kwargs)
+        field = info.parent_type.fields[info.field_name].extensions.get(
+            "strawberry-definition"
+        )
+        cached_field = CACHED_FIELDS.get(getattr(field, "python_name", None))
+        context = info.context
+        # Only a request's shared context has authenticated its requester
+        if cached_field is None or context.get("session") is None:
+            return _next(root, info, *args, **kwargs)
+
+        strawberry_info = Info(_raw_info=info, _field=field)
+        arguments = sorted(kwargs.items())
+        selections = None
+        if cached_field.connection:
+            selections = strawberry_info.selected_fields[0].selections
+            selected_names = set()
+            _collect_selected_names(selections, selected_names)
+            name_converter = strawberry_info.schema.config.name_converter
+            # total_count is only counted when selected
+            arguments.append(
+                name_converter.apply_naming_config("total_count") in selected_names
+            )
+            selections = _find_selections(_find_selections(selections, "edges"), "node")
+        projection = get_selection_projection(
+            strawberry_info,
+            cached_field.gql_type,
+            cached_field.manager_class,
+            selections,
+        )
+
+        dependencies = cache_dependencies(cached_field.manager_class, projection)
+        for db_class in dependencies:
+            watch_for_writes(db_class)
+        validator = (
+            _operation_acl_fingerprint(context),
+            tuple(write_generations[db_class] for db_class in dependencies),
+        )
+
+        scopes = getattr(context.get("requester"), "scopes", None)
+        key = repr(
+            (
+                field.python_name,
+                arguments,
+                projection,
+                context["requester_id"],
+                sorted(scopes) if scopes is not None else None,
+            )
+        )
+        counters = response_cache_counters.setdefault(
+            field.python_name, {"hits": 0, "misses": 0, "invalidated": 0}
+        )
+        # Strawberry resolves through its first instance for every operation,
+        # so the operation's own counts are kept in its context
+        operation_counters = context.setdefault(
+            "response_cache", {"hits": 0, "misses": 0}
+        )
+        if validator[0] is None:
+            counters["misses"] += 1
+            operation_counters["misses"] += 1
+            return _next(root, info, *args, **kwargs)
+
+        entry = response_cache.get(key)
+        if entry is not None and entry[0] == validator:
+            counters["hits"] += 1
+            operation_counters["hits"] += 1
+            return entry[1]
+
+        counters["misses" if entry is None else "invalidated"] += 1
+        operation_counters["misses"] += 1
+        result = _next(root, info, *args, **kwargs)
+        if isawaitable(result):
+            return self._store(key, validator, cached_field.hint, result)
+        response_cache.set(key, (validator, result), ttl=cached_field.hint.max_age)
+        return result
+
+    async def _store(self, key, validator, hint: CacheHint, awaitable):
+        result = await awaitable
+        # Validator from before the read: a write meanwhile invalidates it
+        response_cache.set(key, (validator, result), ttl=hint.max_age)
+        return result
+
+    def get_results(self):
+        context = self.execution_context.context
+        if not isinstance(context, dict) or "response_cache" not in context:
+            return {}
+        return {"cache": dict(context["response_cache"])}
+
+
+class PersistedQueryRouter(GraphQLRouter):
+    """GraphQL router that runs GET persisted queries instead of showing GraphiQL"""
+
+    def should_render_graphql_ide(self, request) -> bool:
+        return super().should_render_graphql_ide(request) and (
+            "extensions" not in request.query_params
+        )
+
+
 def build_dynamic_strawberry_types(max_recursion_depth=3, strawberry_config=None):
     """
     Build Strawberry GraphQL types dynamically from Pydantic models.
@@ -1870,6 +3320,10 @@ def build_dynamic_strawberry_types(max_recursion_depth=3, strawberry_config=None
     CREATED_TYPES.clear()
     TYPE_CACHE.clear()
     MODEL_FIELDS_MAPPING.clear()
+    MODEL_RELATIONSHIPS.clear()
+    TYPE_WEIGHTS.clear()
+    CACHED_FIELDS.clear()
+    SCHEMA_BUILD_TIMINGS.clear()
     pydantic_util.clear_caches()
 
     # Track generated type names to avoid duplicates
@@ -1886,13 +3340,13 @@ def build_dynamic_strawberry_types(max_recursion_depth=3, strawberry_config=None
     )
 
     try:
-        # Discover model relationships and collect fields
-        discover_model_relationships()
-        collect_model_fields()
-
-        # Get model info
+        # Discover model relationships once and collect their fields
+        started = time.perf_counter()
         model_info_dict = get_model_info()
+        collect_model_fields(model_info_dict)
+        SCHEMA_BUILD_TIMINGS["discovery"] = time.perf_counter() - started
         logging.info(f"Found {len(model_info_dict)} models to process")
+        started = time.perf_counter()
 
         # First pass: create types for reference models
         _create_reference_types(model_info_dict, max_recursion_depth)
@@ -1905,7 +3359,22 @@ def build_dynamic_strawberry_types(max_recursion_depth=3, strawberry_config=None
             if model_class in MODEL_TO_TYPE:
                 info.gql_type = MODEL_TO_TYPE[model_class]
 
+        # Price every object backed by a manager for the query cost limiter
+        from logic.BLL_Auth import UserManager
+
+        TYPE_WEIGHTS[UserType.__strawberry_definition__.name] = type_weight(
+            UserType, UserManager
+        )
+        for model_class, gql_type in MODEL_TO_TYPE.items():
+            definition = getattr(gql_type, "__strawberry_definition__", None)
+            if definition is not None:
+                TYPE_WEIGHTS[definition.name] = type_weight(
+                    gql_type, MODEL_MANAGERS.get(model_class)
+                )
+
         logging.info(f"Created {len(MODEL_TO_TYPE)} GraphQL types")
+        SCHEMA_BUILD_TIMINGS["types"] = time.perf_counter() - started
+        started = time.perf_counter()
 
         # Create schema classes
         logging.info("Building query class...")
@@ -1921,6 +3390,7 @@ def build_dynamic_strawberry_types(max_recursion_depth=3, strawberry_config=None
         strawberry_query = strawberry.type(Query)
         strawberry_mutation = strawberry.type(Mutation)
         strawberry_subscription = strawberry.type(Subscription)
+        SCHEMA_BUILD_TIMINGS["root_types"] = time.perf_counter() - started
 
         logging.info("Successfully built GraphQL schema types")
         return strawberry_query, strawberry_mutation, strawberry_subscription
@@ -1994,9 +3464,6 @@ async def shutdown():
     await broadcast.disconnect()
 
 
-# Build the dynamic Strawberry types
-Query, Mutation, Subscription = build_dynamic_strawberry_types(max_recursion_depth=3)
-
 # Check for duplicate types
 type_registry = {}
 duplicate_types_found = False
@@ -2027,13 +3494,66 @@ def monitor_schema_types(cls):
     return cls
 
 
-# Check schema types
-monitor_schema_types(Query)
-monitor_schema_types(Mutation)
-monitor_schema_types(Subscription)
+_schema_lock = threading.Lock()
+
+
+def get_schema() -> strawberry.Schema:
+    """
+    Build the GraphQL schema on first use and return it.
+
+    Building imports every BLL module and generates all types, so it is
+    left to the process that serves GraphQL rather than done at import.
+    `schema`, `Query`, `Mutation` and `Subscription` are also available as
+    module attributes, which build the schema when first read.
+    """
+    global Query, Mutation, Subscription, schema
+
+    with _schema_lock:
+        if "schema" in globals():
+            return schema
+
+        started = time.perf_counter()
+        # Build the dynamic Strawberry types
+        query, mutation, subscription = build_dynamic_strawberry_types(
+            max_recursion_depth=3
+        )
+
+        # Check schema types
+        monitor_schema_types(query)
+        monitor_schema_types(mutation)
+        monitor_schema_types(subscription)
+
+        if duplicate_types_found:
+            logging.warning("Duplicate type names were found. Check logs for details.")
+
+        # Create the schema
+        schema_started = time.perf_counter()
+        built = strawberry.Schema(
+            query=query,
+            mutation=mutation,
+            subscription=subscription,
+            extensions=[PersistedQueries, QueryCostLimiter]
+            # Only schemas with cache hints pay for wrapping every resolver
+            + ([ResponseCache] if CACHED_FIELDS else []),
+        )
+        SCHEMA_BUILD_TIMINGS["schema"] = time.perf_counter() - schema_started
+        SCHEMA_BUILD_TIMINGS["total"] = time.perf_counter() - started
+
+        logging.info(
+            "Built GraphQL schema in "
+            + ", ".join(
+                f"{phase} {seconds:.3f}s"
+                for phase, seconds in SCHEMA_BUILD_TIMINGS.items()
+            )
+        )
+
+        Query, Mutation, Subscription = query, mutation, subscription
+        schema = built
+        return schema
 
-if duplicate_types_found:
-    logging.warning("Duplicate type names were found. Check logs for details.")
 
-# Create the schema
-schema = strawberry.Schema(query=Query, mutation=Mutation, subscription=Subscription)
+def __getattr__(name):
+    if name in ("schema", "Query", "Mutation", "Subscription"):
+        get_schema()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
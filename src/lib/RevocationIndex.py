@@ -0,0 +1,184 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+
+def _as_utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalise a datetime to naive UTC so database and local values compare."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class BloomFilter:
+    """
+    Fixed-size bloom filter over string keys.
+
+    Membership tests never return false negatives, so a miss is a definitive
+    answer and only hits need to be confirmed against an exact structure.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        capacity = max(int(capacity), 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+# A loader receives the high-water mark of the previous refresh (None on the
+# first load) and yields (key, expires_at, changed_at) for every key revoked
+# since then.
+RevocationLoader = Callable[
+    [Optional[datetime]], Iterable[Tuple[str, datetime, Optional[datetime]]]
+]
+
+
+class RevocationIndex:
+    """
+    In-process index of revoked keys (e.g. JWT session keys).
+
+    Lookups are served from memory: a bloom filter rejects the common case of a
+    key that was never revoked, and an exact map of key -> expiry confirms
+    hits. The index is kept in sync with the source of truth by polling
+    `loader` at most every `refresh_interval` seconds, so revocations made by
+    other workers become visible within that window while local revocations
+    are visible immediately.
+
+    Each poll reaches `overlap` seconds behind the newest change seen, so a
+    revocation stamped with its transaction's start time but committed after
+    a newer one was loaded is still picked up.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[RevocationLoader] = None,
+        refresh_interval: float = 5.0,
+        overlap: float = 0.0,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+    ):
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self.overlap = overlap
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._revoked: Dict[str, datetime] = {}
+        self._watermark: Optional[datetime] = None
+        self._next_refresh = 0.0
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def revoke(self, key: str, expires_at: datetime) -> None:
+        """Record a revoked key locally until it expires."""
+        if not key:
+            return
+        with self._lock:
+            self._add(key, _as_utc_naive(expires_at))
+
+    def is_revoked(self, key: Optional[str]) -> bool:
+        """Return True if `key` is revoked and has not yet expired."""
+        if not key:
+            return False
+        self.refresh()
+        if key not in self._bloom:
+            return False
+        expires_at = self._revoked.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= _as_utc_naive(datetime.now(timezone.utc)):
+            with self._lock:
+                self._revoked.pop(key, None)
+            return False
+        return True
+
+    def refresh(self, force: bool = False) -> None:
+        """Pull revocations recorded since the last refresh, if one is due."""
+        if self.loader is None:
+            return
+        now = time.monotonic()
+        if not force and now < self._next_refresh:
+            return
+        if not self._lock.acquire(blocking=force):
+            # Another thread is already refreshing; serve from the current index
+            return
+        try:
+            if not force and now < self._next_refresh:
+                return
+            self._next_refresh = now + self.refresh_interval
+            try:
+                since = self._watermark
+                if since is not None and self.overlap:
+                    since -= timedelta(seconds=self.overlap)
+                rows = list(self.loader(since))
+            except Exception as e:
+                logging.warning(f"Failed to refresh revocation index: {e}")
+                return
+
+            for key, expires_at, changed_at in rows:
+                self._add(key, _as_utc_naive(expires_at))
+                changed_at = _as_utc_naive(changed_at)
+                if changed_at is not None and (
+                    self._watermark is None or changed_at > self._watermark
+                ):
+                    self._watermark = changed_at
+
+            self._prune()
+        finally:
+            self._lock.release()
+
+    def clear(self) -> None:
+        """Drop all state and force a full reload on the next lookup."""
+        with self._lock:
+            self._bloom = BloomFilter(self.capacity, self.error_rate)
+            self._revoked = {}
+            self._watermark = None
+            self._next_refresh = 0.0
+
+    def _add(self, key: str, expires_at: Optional[datetime]) -> None:
+        if expires_at is None:
+            expires_at = datetime.max
+        current = self._revoked.get(key)
+        if current is None or expires_at > current:
+            self._revoked[key] = expires_at
+        self._bloom.add(key)
+
+    def _prune(self) -> None:
+        """Drop expired keys and rebuild the bloom filter once it is saturated."""
+        now = _as_utc_naive(datetime.now(timezone.utc))
+        expired = [
+            key for key, expires_at in self._revoked.items() if expires_at <= now
+        ]
+        for key in expired:
+            del self._revoked[key]
+
+        if expired or len(self._revoked) > self.capacity:
+            self.capacity = max(self.capacity, len(self._revoked) * 2)
+            self._bloom = BloomFilter(self.capacity, self.error_rate)
+            for key in self._revoked:
+                self._bloom.add(key)
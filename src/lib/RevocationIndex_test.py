@@ -0,0 +1,113 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+# Add parent directory to sys.path to import RevocationIndex
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib.RevocationIndex import BloomFilter, RevocationIndex
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Test suite for the BloomFilter used by the revocation index."""
+
+    def test_no_false_negatives(self):
+        """Every added key must be reported as present."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f"session-{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        self.assertTrue(all(key in bloom for key in keys))
+
+    def test_false_positive_rate(self):
+        """Unseen keys should rarely be reported as present."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"session-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+class TestRevocationIndex(unittest.TestCase):
+    """Test suite for RevocationIndex."""
+
+    def setUp(self):
+        self.future = datetime.now(timezone.utc) + timedelta(hours=1)
+        self.past = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    def test_local_revoke(self):
+        """Locally revoked keys are visible immediately."""
+        index = RevocationIndex()
+        index.revoke("abc", self.future)
+
+        self.assertTrue(index.is_revoked("abc"))
+        self.assertFalse(index.is_revoked("def"))
+        self.assertFalse(index.is_revoked(None))
+
+    def test_expired_keys_are_not_revoked(self):
+        """Keys past their expiry are dropped from the index."""
+        index = RevocationIndex()
+        index.revoke("abc", self.past)
+
+        self.assertFalse(index.is_revoked("abc"))
+        self.assertEqual(len(index), 0)
+
+    def test_refresh_uses_watermark(self):
+        """The loader is polled with the newest change timestamp seen so far."""
+        changed_at = datetime(2025, 1, 1, 12, 0, 0)
+        loader = MagicMock(return_value=[("abc", self.future, changed_at)])
+        index = RevocationIndex(loader=loader, refresh_interval=0)
+
+        self.assertTrue(index.is_revoked("abc"))
+        loader.assert_called_with(None)
+
+        loader.return_value = [("def", self.future, changed_at + timedelta(seconds=1))]
+        self.assertTrue(index.is_revoked("def"))
+        loader.assert_called_with(changed_at)
+
+    def test_refresh_overlaps_watermark(self):
+        """Polls reach back `overlap` seconds to catch late commits."""
+        changed_at = datetime(2030, 1, 1, 12, 0, 0)
+        loader = MagicMock(return_value=[("abc", self.future, changed_at)])
+        index = RevocationIndex(loader=loader, refresh_interval=0, overlap=30)
+
+        index.is_revoked("abc")
+        # Committed late, stamped before the newest change already loaded
+        loader.return_value = [("late", self.future, changed_at - timedelta(seconds=5))]
+        index.is_revoked("abc")
+
+        loader.assert_called_with(changed_at - timedelta(seconds=30))
+        self.assertTrue(index.is_revoked("late"))
+
+    def test_refresh_is_throttled(self):
+        """Lookups within the refresh interval do not hit the loader."""
+        loader = MagicMock(return_value=[])
+        index = RevocationIndex(loader=loader, refresh_interval=60)
+
+        for _ in range(10):
+            index.is_revoked("abc")
+
+        self.assertEqual(loader.call_count, 1)
+
+    def test_loader_failure_keeps_index(self):
+        """A failing loader leaves previously known revocations in place."""
+        loader = MagicMock(side_effect=Exception("database unavailable"))
+        index = RevocationIndex(loader=loader, refresh_interval=0)
+        index.revoke("abc", self.future)
+
+        self.assertTrue(index.is_revoked("abc"))
+
+    def test_clear(self):
+        """Clearing the index forgets all revocations."""
+        index = RevocationIndex()
+        index.revoke("abc", self.future)
+        index.clear()
+
+        self.assertFalse(index.is_revoked("abc"))
+
+
+if __name__ == "__main__":
+    unittest.main()
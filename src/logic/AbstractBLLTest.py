@@ -341,8 +341,14 @@ class AbstractBLLTest(AbstractTest):
                     }
                 )
 
-            # Batch update entities
-            self.tracked_entities["batch_update_result"] = manager.batch_update(items)
+            # Batch update entities; each item reports its own outcome
+            results = manager.batch_update(items)
+            assert all(
+                result.ok for result in results
+            ), f"Batch update failed: {[result.error for result in results]}"
+            self.tracked_entities["batch_update_result"] = [
+                result.item for result in results
+            ]
 
     @pytest.mark.depends(on=["test_create"])
     def test_batch_update(self, admin_a, team_a):
@@ -1,15 +1,37 @@
 import inspect
 import logging
+import threading
 from datetime import date, datetime, time, timedelta
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from functools import cached_property
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from fastapi import HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy import and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import DateTime, and_
+from sqlalchemy.orm import (
+    RelationshipProperty,
+    Session,
+    joinedload,
+    selectinload,
+    subqueryload,
+)
 
 from database.Base import get_session
 from database.DB_Auth import Team, User
+from database.StaticSearchIndex import search_index_filter
+from database.StaticUnitOfWork import UnitOfWork
+from lib.Cache import CacheHint, TTLCache
 
 
 class HookDict(dict):
@@ -293,6 +315,121 @@ class IDModel(BaseMixinModel):
     id: str
 
 
+def _search_on_day(field, on):
+    """Match a whole day for datetime columns, or the exact value otherwise."""
+    if isinstance(getattr(field, "type", None), DateTime) and isinstance(on, date):
+        start_of_day = datetime.combine(on, time.min)
+        # Use start of the *next* day for the upper bound (exclusive)
+        start_of_next_day = datetime.combine(on + timedelta(days=1), time.min)
+        return and_(field >= start_of_day, field < start_of_next_day)
+    return field == on
+
+
+# Operator builders for search payloads, keyed by the operator names used by
+# StringSearchModel, NumericalSearchModel, DateSearchModel and is_true for booleans
+STRING_SEARCH_OPERATORS: Dict[str, Callable] = {
+    "inc": lambda field, value: field.ilike(f"%{value}%"),
+    "sw": lambda field, value: field.ilike(f"{value}%"),
+    "ew": lambda field, value: field.ilike(f"%{value}"),
+}
+# Same operators for columns declared in the entity's search_index
+INDEXED_STRING_SEARCH_OPERATORS: Dict[str, Callable] = {
+    "inc": lambda field, value: search_index_filter(field, f"%{value}%"),
+    "sw": lambda field, value: search_index_filter(field, f"{value}%"),
+    "ew": lambda field, value: search_index_filter(field, f"%{value}"),
+}
+NUMERIC_SEARCH_OPERATORS: Dict[str, Callable] = {
+    "eq": lambda field, value: field == value,
+    "neq": lambda field, value: field != value,
+    "lt": lambda field, value: field < value,
+    "gt": lambda field, value: field > value,
+    "lteq": lambda field, value: field <= value,
+    "gteq": lambda field, value: field >= value,
+}
+DATE_SEARCH_OPERATORS: Dict[str, Callable] = {
+    "before": lambda field, value: field < value,
+    "after": lambda field, value: field > value,
+    "on": _search_on_day,
+}
+BOOLEAN_SEARCH_OPERATORS: Dict[str, Callable] = {
+    "is_true": lambda field, value: field == value,
+}
+
+
+# Loader options available to the include planner, by override name
+INCLUDE_LOADERS: Dict[str, Callable] = {
+    "joined": joinedload,
+    "selectin": selectinload,
+    "subquery": subqueryload,
+}
+
+
+def _chunked(items: List[Any], size: int):
+    """Yield successive slices of `items` of at most `size` elements."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _batch_item_error(error: Exception) -> Dict[str, Any]:
+    """Describe the failure of a single batch item."""
+    if isinstance(error, HTTPException):
+        return {"error": error.detail, "status_code": error.status_code}
+    return {"error": str(error), "status_code": 400}
+
+
+class BatchItemResult(BaseModel):
+    """
+    Outcome of one item of a non-atomic batch: the entity written, or the
+    error that left it unwritten while the rest of the batch went ahead.
+    """
+
+    index: int
+    status_code: int
+    id: Optional[str] = None
+    item: Optional[Any] = None
+    error: Optional[Any] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _atomic_batch_error(
+    operation: str, error: Exception, item: Optional[Dict[str, Any]] = None
+) -> HTTPException:
+    """
+    Build the error for an atomic batch that was rolled back, naming the
+    items responsible when they are known.
+    """
+    status_code = error.status_code if isinstance(error, HTTPException) else 400
+    detail = error.detail if isinstance(error, HTTPException) else None
+
+    if isinstance(detail, dict) and "missing_ids" in detail:
+        errors = [
+            {"id": id, "error": "Not found or not permitted", "status_code": 404}
+            for id in detail["missing_ids"]
+        ]
+    elif isinstance(detail, dict) and "denied_ids" in detail:
+        errors = [
+            {"id": id, "error": detail["message"], "status_code": 403}
+            for id in detail["denied_ids"]
+        ]
+    else:
+        errors = [{**(item or {}), **_batch_item_error(error)}]
+
+    return HTTPException(
+        status_code=status_code,
+        detail={
+            "message": f"Batch {operation} failed; no changes were applied",
+            "errors": errors,
+        },
+    )
+
+
+# Guards one-time per-class preparation of manager classes
+_class_prepare_lock = threading.RLock()
+
+
 def gen_not_found_msg(classname):
     return f"Request searched {classname} and could not find the required record."
 
@@ -306,39 +443,79 @@ class AbstractBLLManager:
     # Class-level hooks property
     hooks = HooksDescriptor()
 
-    # Search transformer functions
-    search_transformers: Dict[str, Callable] = {}
+    # Loader strategy overrides for include paths, e.g. {"user_teams": "joined"}
+    include_strategies: Dict[str, str] = {}
+    # Maximum number of relationship hops in a single include path
+    max_include_depth: int = 3
+    # Items per transaction for non-atomic batches, and per statement for atomic ones
+    batch_chunk_size: int = 500
+    # Largest page list_page returns, whatever the caller asks for
+    max_page_size: int = 100
+    # Lets GraphQL cache get/list results of this manager's type; None disables it
+    cache_hint: Optional[CacheHint] = None
+    # GraphQL query cost of one object of this type; None derives it from its fields
+    query_weight: Optional[int] = None
+
+    # Search transformer functions registered per class by _register_search_transformers
+    _search_transformer_registry: Dict[str, Tuple[Callable, bool]] = {}
 
     def __init__(
         self,
-        requester_id: str,
+        requester_id: Optional[str] = None,
         target_user_id: Optional[str] = None,
         target_team_id: Optional[str] = None,
         db: Optional[Session] = None,
+        requester: Optional[Any] = None,
     ):
-        self._db: Optional[Session] = db or get_session()
-        self.requester = self.db.query(User).filter(User.id == requester_id).first()
-        if self.requester is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Requesting user with id {requester_id} not found.",
-            )
-        self.target_user_id: str = target_user_id or requester_id
+        """
+        Args:
+            requester_id: ID of the requesting user, loaded from the database
+                unless `requester` is provided
+            target_user_id: User to act on, defaults to the requester
+            target_team_id: Team to act on
+            db: Shared session; a session is only opened on first use if omitted,
+                and only sessions opened by this manager are closed by it
+            requester: Already-authenticated requester (a User or Principal),
+                which avoids a query during construction
+        """
+        self._db: Optional[Session] = db
+        self._close_db_on_exit = db is None
+        if requester is None:
+            requester = self.db.query(User).filter(User.id == requester_id).first()
+            if requester is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Requesting user with id {requester_id} not found.",
+                )
+        self.requester = requester
+        self.target_user_id: str = target_user_id or requester.id
         self.target_team_id: str = target_team_id
 
         self._target_user = None
         self._target_team = None
 
-        # Initialize any search transformers
-        self._register_search_transformers()
-
-        # Discover and register hooks
-        discover_hooks(self.__class__)
+        # Hook discovery and search transformer registration happen once per class
+        if not self.__class__.__dict__.get("_class_prepared", False):
+            self._prepare_class()
+
+    def _prepare_class(self):
+        """Discover hooks, register search transformers and compile the search plan."""
+        cls = self.__class__
+        with _class_prepare_lock:
+            if cls.__dict__.get("_class_prepared", False):
+                return
+            cls._search_transformer_registry = {}
+            self._register_search_transformers()
+            cls._search_plan = self._compile_search_plan()
+            cls._search_plan_cache = TTLCache(maxsize=256, ttl=None)
+            discover_hooks(cls)
+            cls._class_prepared = True
 
     def _register_search_transformers(self):
         """
         Register custom search transformers for this manager.
         Override this method to register specific search transformers.
+        It is called once per class, on first construction.
 
         Example:
             self.register_search_transformer('overdue', self._transform_overdue_search)
@@ -353,20 +530,43 @@ class AbstractBLLManager:
             field_name: The name of the field or concept to transform
             transformer: A function that takes a value and returns a list of filter conditions
         """
-        self.search_transformers[field_name] = transformer
+        # Methods of this manager are stored unbound and re-bound per instance
+        if inspect.ismethod(transformer) and transformer.__self__ is self:
+            entry = (transformer.__func__, True)
+        else:
+            entry = (transformer, False)
+        self.__class__._search_transformer_registry[field_name] = entry
+        if "search_transformers" in self.__dict__:
+            self.search_transformers[field_name] = transformer
+
+    @cached_property
+    def search_transformers(self) -> Dict[str, Callable]:
+        """Search transformers registered for this class, bound to this manager."""
+        return {
+            field_name: (
+                transformer.__get__(self, self.__class__) if bind else transformer
+            )
+            for field_name, (
+                transformer,
+                bind,
+            ) in self._search_transformer_registry.items()
+        }
 
-    def __del__(self):
-        if hasattr(self, "_db") and self._db is not None:
+    def _close_db(self):
+        if getattr(self, "_db", None) is not None and getattr(
+            self, "_close_db_on_exit", True
+        ):
             self._db.close()
-            self._db = None
+        self._db = None
+
+    def __del__(self):
+        self._close_db()
 
     def __enter__(self) -> "AbstractBLLManager":
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        if hasattr(self, "_db") and self._db is not None:
-            self._db.close()
-            self._db = None
+        self._close_db()
 
     def get_field_types(self):
         """Analyzes the Model class to categorize fields by type."""
@@ -375,11 +575,20 @@ class AbstractBLLManager:
         date_fields = []
         boolean_fields = []
 
-        # Get all annotations from the model
-        for field_name, field_info in self.Model.__annotations__.items():
+        # Pydantic models expose inherited fields too; fall back to annotations
+        model_fields = getattr(self.Model, "model_fields", None)
+        if model_fields:
+            field_types = {
+                name: field.annotation for name, field in model_fields.items()
+            }
+        else:
+            field_types = self.Model.__annotations__
+
+        for field_name, field_info in field_types.items():
             # Handle Optional types
-            if getattr(field_info, "__origin__", None) == Optional:
-                actual_type = field_info.__args__[0]
+            args = [arg for arg in get_args(field_info) if arg is not type(None)]
+            if get_origin(field_info) is Union and len(args) == 1:
+                actual_type = args[0]
             else:
                 actual_type = field_info
 
@@ -395,15 +604,59 @@ class AbstractBLLManager:
 
         return string_fields, numeric_fields, date_fields, boolean_fields
 
+    def _compile_search_plan(self) -> Dict[str, Dict[str, Callable]]:
+        """Map each searchable column to the operator builders valid for its type."""
+        string_fields, numeric_fields, date_fields, boolean_fields = (
+            self.get_field_types()
+        )
+        plan = {}
+        for field_names, operators in (
+            (string_fields, STRING_SEARCH_OPERATORS),
+            (numeric_fields, NUMERIC_SEARCH_OPERATORS),
+            (date_fields, DATE_SEARCH_OPERATORS),
+            (boolean_fields, BOOLEAN_SEARCH_OPERATORS),
+        ):
+            for field_name in field_names:
+                if hasattr(self.DBClass, field_name):
+                    plan[field_name] = operators
+
+        # Route substring search on indexed columns through the search index
+        for field_name in getattr(self.DBClass, "search_index", ()):
+            if plan.get(field_name) is STRING_SEARCH_OPERATORS:
+                plan[field_name] = INDEXED_STRING_SEARCH_OPERATORS
+        return plan
+
+    def _plan_search(self, shape: Tuple) -> List[Tuple[str, Optional[List]]]:
+        """Resolve a search payload shape into (field, builders) steps."""
+        steps = []
+        for field_name, operations in shape:
+            # If not a custom field, check if field exists in the model
+            if not hasattr(self.DBClass, field_name):
+                continue
+
+            # Plain values are exact matches
+            if operations is None:
+                steps.append((field_name, None))
+                continue
+
+            # Dictionaries only apply the operators valid for the field's type
+            operators = self._search_plan.get(field_name, {})
+            builders = [
+                (operation, operators[operation])
+                for operation in operations
+                if operation in operators
+            ]
+            if builders:
+                steps.append((field_name, builders))
+        return steps
+
     def build_search_filters(
         self,
         search_params: Dict[str, Any],
     ) -> List:
         """Build SQLAlchemy filters from search parameters."""
         filters = []
-        string_fields, numeric_fields, date_fields, boolean_fields = (
-            self.get_field_types()
-        )
+        shape = []
 
         for field_name, value in search_params.items():
             # Skip processing None values
@@ -421,139 +674,156 @@ class AbstractBLLManager:
                         filters.append(custom_filters)
                 continue
 
-            # If not a custom field, check if field exists in the model
-            if not hasattr(self.DBClass, field_name):
-                continue
+            if isinstance(value, dict):
+                operations = tuple(op for op, arg in value.items() if arg is not None)
+                shape.append((field_name, operations))
+            else:
+                shape.append((field_name, None))
 
-            field = getattr(self.DBClass, field_name)
+        # Repeated payload shapes reuse the analysis from the plan cache
+        shape = tuple(shape)
+        steps = self._search_plan_cache.get(shape)
+        if steps is None:
+            steps = self._plan_search(shape)
+            self._search_plan_cache.set(shape, steps)
 
-            # Handle string pattern matching operations
-            if field_name in string_fields and isinstance(value, dict):
-                string_pattern_applied = False
-
-                # Process string pattern operations
-                if "inc" in value and value["inc"] is not None:
-                    filters.append(field.ilike(f"%{value['inc']}%"))
-                    string_pattern_applied = True
-
-                if "sw" in value and value["sw"] is not None:
-                    filters.append(field.ilike(f"{value['sw']}%"))
-                    string_pattern_applied = True
-
-                if "ew" in value and value["ew"] is not None:
-                    filters.append(field.ilike(f"%{value['ew']}"))
-                    string_pattern_applied = True
-
-                # Skip to next field if any string pattern was applied
-                if string_pattern_applied:
-                    continue
-
-            # Handle numeric comparison operators
-            elif field_name in numeric_fields and isinstance(value, dict):
-                conditions = []
-
-                if "eq" in value and value["eq"] is not None:
-                    conditions.append(field == value["eq"])
-                if "neq" in value and value["neq"] is not None:
-                    conditions.append(field != value["neq"])
-                if "lt" in value and value["lt"] is not None:
-                    conditions.append(field < value["lt"])
-                if "gt" in value and value["gt"] is not None:
-                    conditions.append(field > value["gt"])
-                if "lteq" in value and value["lteq"] is not None:
-                    conditions.append(field <= value["lteq"])
-                if "gteq" in value and value["gteq"] is not None:
-                    conditions.append(field >= value["gteq"])
-
-                if conditions:
-                    filters.append(and_(*conditions))
-                    continue
-
-            # Handle date field operations
-            elif field_name in date_fields and isinstance(value, dict):
-                conditions = []
-
-                if "before" in value and value["before"] is not None:
-                    conditions.append(field < value["before"])
-                if "after" in value and value["after"] is not None:
-                    conditions.append(field > value["after"])
-                if "on" in value and value["on"] is not None:
-                    # For date equality, typically check for the entire day
-                    # Use the full datetime module path now
-                    if isinstance(field.type, (date, datetime)):
-                        on_date = value["on"]  # This is expected to be a date object
-                        # Create datetime objects for start and end of the day using the datetime module
-                        start_of_day = datetime.combine(on_date, time.min)
-                        # Use start of the *next* day for the upper bound (exclusive)
-                        start_of_next_day = datetime.combine(
-                            on_date + timedelta(days=1), time.min
-                        )
-                        conditions.append(
-                            and_(field >= start_of_day, field < start_of_next_day)
-                        )
+        for field_name, builders in steps:
+            field = getattr(self.DBClass, field_name)
+            value = search_params[field_name]
+            if builders is None:
+                filters.append(field == value)
+            else:
+                for operation, builder in builders:
+                    filters.append(builder(field, value[operation]))
 
-                    else:
-                        # Fallback for unexpected field types
-                        conditions.append(field == value["on"])
+        return filters
 
-                if conditions:
-                    filters.append(and_(*conditions))
-                    continue
+    @staticmethod
+    def generate_joins(
+        model_class,
+        include_fields,
+        strategies: Optional[Dict[str, str]] = None,
+        max_depth: Optional[int] = None,
+    ):
+        """
+        Generate loader options for the specified include fields.
 
-            # Handle boolean field operations
-            elif field_name in boolean_fields and isinstance(value, dict):
-                if "is_true" in value and value["is_true"] is not None:
-                    filters.append(field == value["is_true"])
-                    continue
+        Collection relationships (one-to-many, many-to-many) are loaded with
+        selectinload so the parent rows are not multiplied by the join, and
+        scalar relationships (many-to-one, one-to-one) with joinedload. Nested
+        includes such as 'user_teams.role' chain a loader per hop.
 
-            # For dictionaries that weren't handled by specific patterns,
-            # extract the actual values rather than passing the dict directly
-            if isinstance(value, dict):
-                # Skip dictionaries that don't match our expected patterns
-                continue
+        Args:
+            model_class: SQLAlchemy model the query selects from
+            include_fields: Relationship paths to load, dot-separated for nesting
+            strategies: Loader overrides by path ("joined", "selectin" or "subquery")
+            max_depth: Maximum number of hops in a path, unlimited if None
+        """
+        strategies = strategies or {}
+        joins = []
 
-            # Handle regular exact match (for non-dict values)
-            filters.append(field == value)
+        for field in include_fields:
+            parts = field.split(".")
+            if max_depth is not None and len(parts) > max_depth:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Include '{field}' exceeds the maximum depth of {max_depth}.",
+                )
 
-        return filters
+            current_class = model_class
+            loader = None
+            for depth, part in enumerate(parts, start=1):
+                attr = getattr(current_class, part, None)
+                prop = getattr(attr, "property", None)
+                if not isinstance(prop, RelationshipProperty):
+                    logging.debug(
+                        f"Ignoring include '{field}': {current_class.__name__}.{part} is not a relationship"
+                    )
+                    loader = None
+                    break
 
-    @staticmethod
-    def generate_joins(model_class, include_fields):
-        """Generate join loads based on specified include fields."""
-        joins = []
+                path = ".".join(parts[:depth])
+                strategy = strategies.get(path) or (
+                    "selectin" if prop.uselist else "joined"
+                )
+                if strategy not in INCLUDE_LOADERS:
+                    raise ValueError(
+                        f"Unknown loader strategy '{strategy}' for include '{path}'"
+                    )
 
-        for field in include_fields:
-            if hasattr(model_class, field):
-                # Handle nested includes (e.g., 'user.roles')
-                if "." in field:
-                    parts = field.split(".")
-                    current_attr = getattr(model_class, parts[0])
-                    joins.append(joinedload(current_attr))
-
-                    # Build nested joinloads for deeper relationships
-                    current_join = joins[-1]
-                    for part in parts[1:]:
-                        if hasattr(current_attr.property.mapper.class_, part):
-                            nested_attr = getattr(
-                                current_attr.property.mapper.class_, part
-                            )
-                            current_join = current_join.joinedload(nested_attr)
+                if loader is None:
+                    loader = INCLUDE_LOADERS[strategy](attr)
                 else:
-                    joins.append(joinedload(getattr(model_class, field)))
+                    loader = getattr(loader, f"{strategy}load")(attr)
+                current_class = prop.mapper.class_
+
+            if loader is not None:
+                joins.append(loader)
 
         return joins
 
+    def include_options(
+        self,
+        include: List[str],
+        include_strategies: Optional[Dict[str, str]] = None,
+    ) -> List[Any]:
+        """Loader options for `include`, applying class and per-call strategy overrides."""
+        strategies = self.include_strategies
+        if include_strategies:
+            strategies = {**strategies, **include_strategies}
+        return self.generate_joins(
+            self.DBClass,
+            include,
+            strategies=strategies,
+            max_depth=self.max_include_depth,
+        )
+
+    def projection_options(self, fields: Optional[List[str]]) -> List[Any]:
+        """
+        Loader options that load only the `fields` columns of DBClass. Names
+        that aren't columns (relationships, computed fields) are ignored, and
+        the primary key is always loaded.
+
+        Entities loaded this way convert to partial DTOs holding only these
+        fields.
+        """
+        columns = [
+            getattr(self.DBClass, field)
+            for field in fields or []
+            if hasattr(self.DBClass, field)
+        ]
+        if not columns:
+            return []
+        from sqlalchemy.orm import load_only
+
+        return [load_only(*columns)]
+
     @property
     def db(self) -> Session:
         """Property that returns an active database session, creating a new one if needed."""
         if self._db is None or not self._db.is_active:
             self._db = get_session()
+            self._close_db_on_exit = True
         return self._db
 
+    def unit_of_work(self) -> UnitOfWork:
+        """
+        Group the writes made through this manager's session, including those
+        of sub-managers sharing it, into a single commit.
+
+        Usage:
+            with manager.unit_of_work():
+                team = manager.create(name="Team")
+                manager.team_metadata.create(team_id=team.id, key="k", value="v")
+        """
+        return UnitOfWork(self.db)
+
     @property
     def target_user(self) -> User:
         if self._target_user is None:
-            if self.target_user_id == self.requester.id:
+            if self.target_user_id == self.requester.id and isinstance(
+                self.requester, User
+            ):
                 return self.requester
             else:
                 self._target_user = (
@@ -587,6 +857,63 @@ class AbstractBLLManager:
         else:
             return self._create_single_entity(**kwargs)
 
+    def batch_create(
+        self,
+        items: List[Dict[str, Any]],
+        atomic: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> Union[List[Any], List[BatchItemResult]]:
+        """Create multiple entities in a batch.
+
+        Args:
+            items: List of dictionaries of properties for each entity to create
+            atomic: Create every entity in one transaction or none of them
+            chunk_size: Items per transaction when not atomic, defaults to
+                batch_chunk_size
+
+        Returns:
+            Atomic: list of created entities, in the order of `items`.
+            Otherwise: one BatchItemResult per item, in the order of `items`;
+            items that failed are reported instead of failing the batch,
+            since the other chunks are already committed.
+        """
+        if atomic:
+            current = None
+            try:
+                with self.unit_of_work():
+                    results = []
+                    for index, item in enumerate(items):
+                        current = {"index": index}
+                        results.append(self.create(**item))
+            except Exception as e:
+                raise _atomic_batch_error("create", e, current)
+            return results
+
+        results = []
+
+        # Each chunk commits once; each item gets a savepoint so failures are isolated
+        size = chunk_size or self.batch_chunk_size
+        for offset in range(0, len(items), size):
+            with self.unit_of_work():
+                for index, item in enumerate(items[offset : offset + size], offset):
+                    try:
+                        with self.unit_of_work():
+                            created = self.create(**item)
+                        results.append(
+                            BatchItemResult(
+                                index=index,
+                                status_code=201,
+                                id=getattr(created, "id", None),
+                                item=created,
+                            )
+                        )
+                    except Exception as e:
+                        results.append(
+                            BatchItemResult(index=index, **_batch_item_error(e))
+                        )
+
+        return results
+
     def _create_single_entity(self, **kwargs) -> Any:
         """Create a single entity."""
         args = self.Model.Create(**kwargs)
@@ -627,15 +954,15 @@ class AbstractBLLManager:
         self,
         include: Optional[List[str]] = None,
         fields: Optional[List[str]] = None,
+        include_strategies: Optional[Dict[str, str]] = None,
         **kwargs,
     ) -> Any:
         """Get an entity with optional included relationships."""
         options = []
 
         if include:
-            options = self.generate_joins(self.DBClass, include)
-        if fields:
-            from sqlalchemy.orm import load_only
+            options = self.include_options(include, include_strategies)
+        options.extend(self.projection_options(fields))
 
         return self.DBClass.get(
             requester_id=self.requester.id,
@@ -646,6 +973,133 @@ class AbstractBLLManager:
             **kwargs,
         )
 
+    def get_many(
+        self,
+        ids: List[str],
+        include: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        include_strategies: Optional[Dict[str, str]] = None,
+    ) -> List[Optional[Any]]:
+        """
+        Get the entities in `ids` with one permission-filtered query.
+
+        Returns a list aligned with `ids`, holding None for ids that are
+        missing or not visible to the requester.
+        """
+        options = []
+        if include:
+            options = self.include_options(include, include_strategies)
+        options.extend(self.projection_options(fields))
+
+        return self.DBClass.get_many(
+            requester_id=self.requester.id,
+            db=self.db,
+            ids=ids,
+            return_type="dto",
+            override_dto=self.Model,
+            options=options,
+        )
+
+    def fingerprint(self, id: Optional[str] = None) -> Optional[str]:
+        """
+        Cheap fingerprint of what `get(id=id)` (or `list()` without an id)
+        would return to the requester, for conditional requests. It covers
+        the visible entities and the requester, and for lists the permission
+        state, but not related entities. A single entity's fingerprint is its
+        `(id, updated_at)`, the same as `entity_fingerprint` of the loaded
+        entity.
+
+        Managers whose get/list read other state should override this and
+        `entity_fingerprint`, or return None to opt out of conditional
+        requests.
+
+        Returns:
+            An opaque string, or None if there is no stable fingerprint (the
+            entity does not exist or changed too recently)
+        """
+        from database.StaticPermissions import acl_fingerprint
+
+        filters = [self.DBClass.id == id] if id is not None else []
+        count, latest, settled = self.DBClass.fingerprint(
+            requester_id=self.requester.id, db=self.db, filters=filters
+        )
+        if not settled or (id is not None and count == 0):
+            return None
+        if id is not None:
+            # Visibility is checked by get, so one row's state is its stamp
+            return self._fingerprint_of(id, latest.isoformat() if latest else None)
+        acl = acl_fingerprint(self.db)
+        if acl is None:
+            return None
+        return self._fingerprint_of(count, latest.isoformat() if latest else None, acl)
+
+    def entity_fingerprint(self, entity: Any) -> Optional[str]:
+        """
+        Fingerprint of an entity `get` has already loaded, equal to
+        `fingerprint(id=entity.id)` but without a query.
+
+        Returns:
+            An opaque string, or None if the entity's stamp was not loaded
+            or is too recent to tell apart from a later write
+        """
+        from database.StaticChangeFeed import is_settled
+
+        stamp_name = (
+            "updated_at" if hasattr(self.DBClass, "updated_at") else "created_at"
+        )
+        stamp = getattr(entity, stamp_name, None)
+        if stamp is None or not is_settled(stamp):
+            return None
+        return self._fingerprint_of(entity.id, stamp.isoformat())
+
+    def _fingerprint_of(self, *state: Any) -> str:
+        """Fingerprint of `state` as seen by this requester and API key."""
+        from database.StaticPermissions import api_key_scopes
+
+        scopes = api_key_scopes.get()
+        return repr(
+            (
+                self.requester.id,
+                sorted(scopes) if scopes is not None else None,
+                *state,
+            )
+        )
+
+    def changes(
+        self,
+        since: Optional[str] = None,
+        limit: Optional[int] = None,
+        include: Optional[List[str]] = None,
+        include_strategies: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the entities created, updated or deleted after the cursor `since`.
+
+        Returns:
+            A dict with the changed entities (`changed`), the ids of deleted
+            ones (`deleted_ids`), the cursor of the next page (`cursor`) and
+            whether more changes are waiting (`has_more`)
+        """
+        if not hasattr(self.DBClass, "list_changes"):
+            raise HTTPException(
+                status_code=404,
+                detail=f"{self.DBClass.__name__} does not support change tracking",
+            )
+        options = []
+        if include:
+            options = self.include_options(include, include_strategies)
+
+        kwargs = {"limit": limit} if limit else {}
+        return self.DBClass.list_changes(
+            requester_id=self.requester.id,
+            db=self.db,
+            since=since,
+            return_type="dto",
+            override_dto=self.Model,
+            options=options,
+            **kwargs,
+        )
+
     def list(
         self,
         include: Optional[List[str]] = None,
@@ -655,17 +1109,15 @@ class AbstractBLLManager:
         filters: Optional[List[Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        include_strategies: Optional[Dict[str, str]] = None,
         **kwargs,
     ) -> List[Any]:
         """List entities with optional included relationships."""
         options = []
         order_by = None
         if include:
-            options = self.generate_joins(self.DBClass, include)
-        if fields:
-            from sqlalchemy.orm import load_only
-
-            options.append(load_only(*fields))
+            options = self.include_options(include, include_strategies)
+        options.extend(self.projection_options(fields))
         if sort_by:
             from sqlalchemy import asc, desc
 
@@ -689,6 +1141,53 @@ class AbstractBLLManager:
             **kwargs,
         )
 
+    def list_page(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        include: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None,
+        include_strategies: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        List one keyset page of entities, in id order.
+
+        Args:
+            first: Page size, capped at max_page_size (the default)
+            after: Cursor of the previous page's last entity
+
+        Returns:
+            A dict with the entities (`items`), the cursor to pass as `after`
+            for the next page (`cursor`) and whether there is one (`has_more`)
+        """
+        options = []
+        if include:
+            options = self.include_options(include, include_strategies)
+        options.extend(self.projection_options(fields))
+
+        return self.DBClass.list_page(
+            requester_id=self.requester.id,
+            db=self.db,
+            first=max(1, min(first or self.max_page_size, self.max_page_size)),
+            after=after,
+            return_type="dto",
+            override_dto=self.Model,
+            options=options,
+            filters=filters or [],
+            **kwargs,
+        )
+
+    def count(self, filters: Optional[List[Any]] = None, **kwargs) -> int:
+        """Count the entities list would return, without loading them."""
+        return self.DBClass.count(
+            requester_id=self.requester.id,
+            db=self.db,
+            filters=list(filters or []),
+            **kwargs,
+        )
+
     def search(
         self,
         include: Optional[List[str]] = None,
@@ -698,6 +1197,7 @@ class AbstractBLLManager:
         filters: Optional[List[Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        include_strategies: Optional[Dict[str, str]] = None,
         **search_params,
     ) -> List[Any]:
         """Search entities with optional included relationships."""
@@ -712,15 +1212,12 @@ class AbstractBLLManager:
             else:
                 simple_kwargs[key] = value
 
-        # Convert include to SQLAlchemy joinedload options
+        # Convert include to SQLAlchemy loader options
         if include:
-            options = self.generate_joins(self.DBClass, include)
+            options = self.include_options(include, include_strategies)
 
         # Convert fields to SQLAlchemy load_only option
-        if fields:
-            from sqlalchemy.orm import load_only
-
-            options.append(load_only(*fields))
+        options.extend(self.projection_options(fields))
 
         # Convert sort_by and sort_order to SQLAlchemy order_by expression
         if sort_by:
@@ -768,8 +1265,8 @@ class AbstractBLLManager:
         for hook in hooks["update"]["before"]:
             hook(self, id, update_args)
 
-        # Get the entity before update (for after hooks)
-        entity_before = self.get(id=id)
+        # Snapshot the entity before update only if an after hook will see it
+        entity_before = self.get(id=id) if hooks["update"]["after"] else None
 
         # Update the entity
         updated_entity = self.DBClass.update(
@@ -787,53 +1284,147 @@ class AbstractBLLManager:
 
         return updated_entity
 
-    def batch_update(self, items: List[Dict[str, Any]]) -> List[Any]:
+    def batch_update(
+        self,
+        items: List[Dict[str, Any]],
+        atomic: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> Union[List[Any], List[BatchItemResult]]:
         """Update multiple entities in a batch.
 
         Args:
             items: List of dictionaries containing 'id' and 'data' for each entity to update
+            atomic: Apply every update in one transaction or none of them; items
+                sharing the same data are written with one UPDATE statement
+            chunk_size: Items per transaction (non-atomic) or statement (atomic),
+                defaults to batch_chunk_size
 
         Returns:
-            List of updated entities
+            Atomic: list of updated entities, in the order of `items`.
+            Otherwise: one BatchItemResult per item, in the order of `items`.
         """
+        size = chunk_size or self.batch_chunk_size
+        if atomic:
+            return self._batch_update_atomic(items, size)
+
         results = []
-        errors = []
 
-        # Process each update
-        for item in items:
-            try:
-                entity_id = item.get("id")
-                if not entity_id:
-                    raise ValueError("Missing required 'id' field in batch update item")
+        # Each chunk commits once; each item gets a savepoint so failures are isolated
+        for offset in range(0, len(items), size):
+            with self.unit_of_work():
+                for index, item in enumerate(items[offset : offset + size], offset):
+                    entity_id = item.get("id")
+                    try:
+                        if not entity_id:
+                            raise ValueError(
+                                "Missing required 'id' field in batch update item"
+                            )
 
-                update_data = item.get("data", {})
-                updated_entity = self.update(id=entity_id, **update_data)
-                results.append(updated_entity)
-            except Exception as e:
-                # Collect errors but continue processing other items
-                errors.append({"id": item.get("id", "unknown"), "error": str(e)})
+                        update_data = item.get("data", {})
+                        with self.unit_of_work():
+                            updated = self.update(id=entity_id, **update_data)
+                        results.append(
+                            BatchItemResult(
+                                index=index, status_code=200, id=entity_id, item=updated
+                            )
+                        )
+                    except Exception as e:
+                        # Report the item and continue with the others
+                        results.append(
+                            BatchItemResult(
+                                index=index, id=entity_id, **_batch_item_error(e)
+                            )
+                        )
+
+        return results
+
+    def _batch_is_set_based(self, operation: str) -> bool:
+        """
+        Whether a batch `operation` can bypass per-item calls: neither the
+        manager nor its DB class override it and no BLL hooks are registered
+        for it.
+        """
+        from database.AbstractDatabaseEntity import UpdateMixin
+
+        hooks = self.__class__.hooks[operation]
+        db_method = getattr(self.DBClass, operation, None)
+        return (
+            getattr(type(self), operation) is getattr(AbstractBLLManager, operation)
+            and getattr(db_method, "__func__", None)
+            is getattr(UpdateMixin, operation).__func__
+            and not hooks["before"]
+            and not hooks["after"]
+        )
 
-        # If any errors occurred, raise an HTTPException with details
-        if errors:
+    def _batch_update_atomic(self, items: List[Dict[str, Any]], size: int) -> List[Any]:
+        """Apply all updates in one transaction, grouping identical data into one statement."""
+        ids = [item.get("id") for item in items]
+        if not all(ids):
             raise HTTPException(
                 status_code=400,
-                detail={
-                    "message": "One or more batch update operations failed",
-                    "errors": errors,
-                    "successful_updates": len(results),
-                    "failed_updates": len(errors),
-                },
+                detail="Missing required 'id' field in batch update item",
             )
 
-        return results
+        results = {}
+        current = None
+        try:
+            with self.unit_of_work():
+                if self._batch_is_set_based("update"):
+                    groups: Dict[str, Tuple[Dict[str, Any], List[str]]] = {}
+                    for item in items:
+                        current = {"id": item["id"]}
+                        args = self.Model.Update(**item.get("data", {}))
+                        update_args = {
+                            k: v
+                            for k, v in args.model_dump(exclude_unset=True).items()
+                            if v is not None
+                        }
+                        key = repr(sorted(update_args.items()))
+                        groups.setdefault(key, (update_args, []))[1].append(item["id"])
+                    current = None
+
+                    columns = self.DBClass.__mapper__.column_attrs.keys()
+                    for update_args, group_ids in groups.values():
+                        if not set(update_args) <= set(columns):
+                            # Non-column properties need the per-entity setattr path
+                            for id in group_ids:
+                                current = {"id": id}
+                                results[id] = self.update(id=id, **update_args)
+                            current = None
+                            continue
+                        for chunk in _chunked(group_ids, size):
+                            for entity in self.DBClass.update_many(
+                                requester_id=self.requester.id,
+                                db=self.db,
+                                ids=chunk,
+                                new_properties=update_args,
+                                return_type="dto",
+                                override_dto=self.Model,
+                            ):
+                                results[entity.id] = entity
+                else:
+                    for item in items:
+                        current = {"id": item["id"]}
+                        results[item["id"]] = self.update(
+                            id=item["id"], **item.get("data", {})
+                        )
+                    current = None
+        except Exception as e:
+            raise _atomic_batch_error("update", e, current)
+
+        return [results[id] for id in ids]
 
     def delete(self, id: str):
         """Delete an entity by ID."""
         # Call before hooks
         hooks = self.__class__.hooks
 
-        # Get the entity before delete (for after hooks)
-        entity_before = self.get(id=id)
+        # Snapshot the entity before delete only if a hook will see it
+        entity_before = (
+            self.get(id=id)
+            if hooks["delete"]["before"] or hooks["delete"]["after"]
+            else None
+        )
 
         for hook in hooks["delete"]["before"]:
             hook(self, id, entity_before)
@@ -849,38 +1440,68 @@ class AbstractBLLManager:
         for hook in hooks["delete"]["after"]:
             hook(self, id, entity_before)
 
-    def batch_delete(self, ids: List[str]):
+    def batch_delete(
+        self,
+        ids: List[str],
+        atomic: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> Optional[List[BatchItemResult]]:
         """Delete multiple entities in a batch.
 
         Args:
             ids: List of entity IDs to delete
+            atomic: Delete every entity in one transaction or none of them,
+                using one UPDATE statement per chunk of ids
+            chunk_size: Items per transaction (non-atomic) or statement (atomic),
+                defaults to batch_chunk_size
 
         Returns:
-            None
+            Atomic: None.
+            Otherwise: one BatchItemResult per id, in the order of `ids`.
         """
-        errors = []
-        successful_deletes = 0
+        size = chunk_size or self.batch_chunk_size
+        if atomic:
+            return self._batch_delete_atomic(ids, size)
 
-        # Process each delete operation
-        for entity_id in ids:
-            try:
-                self.delete(id=entity_id)
-                successful_deletes += 1
-            except Exception as e:
-                # Collect errors but continue processing other items
-                errors.append({"id": entity_id, "error": str(e)})
+        results = []
 
-        # If any errors occurred, raise an HTTPException with details
-        if errors:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": "One or more batch delete operations failed",
-                    "errors": errors,
-                    "successful_deletes": successful_deletes,
-                    "failed_deletes": len(errors),
-                },
-            )
+        # Each chunk commits once; each item gets a savepoint so failures are isolated
+        for offset in range(0, len(ids), size):
+            with self.unit_of_work():
+                for index, entity_id in enumerate(ids[offset : offset + size], offset):
+                    try:
+                        with self.unit_of_work():
+                            self.delete(id=entity_id)
+                        results.append(
+                            BatchItemResult(index=index, status_code=204, id=entity_id)
+                        )
+                    except Exception as e:
+                        # Report the item and continue with the others
+                        results.append(
+                            BatchItemResult(
+                                index=index, id=entity_id, **_batch_item_error(e)
+                            )
+                        )
+
+        return results
+
+    def _batch_delete_atomic(self, ids: List[str], size: int) -> None:
+        """Delete all entities in one transaction, one statement per chunk."""
+        current = None
+        try:
+            with self.unit_of_work():
+                if self._batch_is_set_based("delete"):
+                    for chunk in _chunked(ids, size):
+                        self.DBClass.delete_many(
+                            requester_id=self.requester.id, db=self.db, ids=chunk
+                        )
+                else:
+                    for entity_id in ids:
+                        current = {"id": entity_id}
+                        self.delete(id=entity_id)
+                    current = None
+        except Exception as e:
+            raise _atomic_batch_error("delete", e, current)
 
 
 class BaseCreateModel(NameMixinModel):
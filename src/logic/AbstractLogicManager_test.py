@@ -1,10 +1,12 @@
 import unittest
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from unittest.mock import MagicMock, patch
 
 from AbstractLogicManager import (
+    DATE_SEARCH_OPERATORS,
+    STRING_SEARCH_OPERATORS,
     AbstractBLLManager,
     BaseMixinModel,
     HookDict,
@@ -12,8 +14,43 @@ from AbstractLogicManager import (
     get_hooks_for_manager,
     hook_types,
 )
+from fastapi import HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy.orm import Session, declarative_base, relationship
+
+# Mapped models for include planning
+IncludeBase = declarative_base()
+
+
+class IncludeOwner(IncludeBase):
+    __tablename__ = "include_owners"
+    id = Column(Integer, primary_key=True)
+
+
+class IncludeGroup(IncludeBase):
+    __tablename__ = "include_groups"
+    id = Column(Integer, primary_key=True)
+    members = relationship("IncludeMember", back_populates="group")
+
+
+class IncludeMember(IncludeBase):
+    __tablename__ = "include_members"
+    id = Column(Integer, primary_key=True)
+    group_id = Column(ForeignKey("include_groups.id"))
+    owner_id = Column(ForeignKey("include_owners.id"))
+    group = relationship("IncludeGroup", back_populates="members")
+    owner = relationship("IncludeOwner")
+
+
+def loader_strategies(options):
+    """Map each loaded relationship path to its lazy strategy."""
+    strategies = {}
+    for option in options:
+        for load in option.context:
+            key = ".".join(str(prop.key) for prop in load.path[1::2])
+            strategies[key] = dict(load.strategy)["lazy"]
+    return strategies
 
 
 # Mock Database Models
@@ -392,6 +429,15 @@ class TestAbstractLogicManager(unittest.TestCase):
         hooks["delete"]["before"].remove(before_delete_hook)
         hooks["delete"]["after"].remove(after_delete_hook)
 
+    def test_write_without_hooks_skips_snapshot(self):
+        """Update and delete only read the previous state when a hook needs it."""
+        with patch.object(self.manager, "get") as mock_get:
+            self.manager.update(
+                id=str(uuid.uuid4()), name="Updated Name", description="Updated"
+            )
+            self.manager.delete(id=str(uuid.uuid4()))
+            mock_get.assert_not_called()
+
     def test_search_operation(self):
         """Test searching entities with various filters."""
         # Simple search
@@ -466,6 +512,156 @@ class TestAbstractLogicManager(unittest.TestCase):
                     # Cleanup
                     del self.manager.search_transformers["custom_search"]
 
+    def test_search_plan_compilation(self):
+        """The search plan covers inherited and Optional model fields."""
+        plan = ManagerForTest._search_plan
+
+        self.assertIs(plan["name"], STRING_SEARCH_OPERATORS)
+        self.assertIs(plan["description"], STRING_SEARCH_OPERATORS)
+        self.assertIs(plan["created_at"], DATE_SEARCH_OPERATORS)
+        self.assertIs(plan["updated_at"], DATE_SEARCH_OPERATORS)
+
+    def test_search_plan_cache(self):
+        """Searches with the same payload shape reuse the cached plan."""
+        ManagerForTest._search_plan_cache.clear()
+        with patch.object(
+            self.manager, "_plan_search", wraps=self.manager._plan_search
+        ) as plan_spy:
+            self.manager.build_search_filters({"name": {"inc": "a", "sw": None}})
+            filters = self.manager.build_search_filters(
+                {"name": {"inc": "b", "sw": None}}
+            )
+            self.manager.build_search_filters({"name": {"sw": "c"}})
+
+        self.assertEqual(len(filters), 1)
+        self.assertEqual(plan_spy.call_count, 2)
+
+    def test_search_on_day(self):
+        """The 'on' operator matches the whole day for datetime columns."""
+        from sqlalchemy import Column, Date, DateTime
+
+        day = datetime(2025, 1, 1).date()
+        datetime_filter = DATE_SEARCH_OPERATORS["on"](Column("at", DateTime), day)
+        date_filter = DATE_SEARCH_OPERATORS["on"](Column("on", Date), day)
+
+        self.assertEqual(len(datetime_filter.clauses), 2)
+        self.assertEqual(date_filter.right.value, day)
+
+    def test_get_many_operation(self):
+        """Multi-get delegates to one DB call with the requested ids."""
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+        with patch.object(
+            MockDBModel, "get_many", return_value=[None] * 3, create=True
+        ) as mock_get_many:
+            results = self.manager.get_many(ids)
+
+        self.assertEqual(results, [None] * 3)
+        mock_get_many.assert_called_once()
+        kwargs = mock_get_many.call_args.kwargs
+        self.assertEqual(kwargs["ids"], ids)
+        self.assertEqual(kwargs["requester_id"], "user1")
+        self.assertEqual(kwargs["return_type"], "dto")
+
+    def test_projection_options(self):
+        """Requested fields become one load_only option over DBClass columns."""
+        self.assertEqual(self.manager.projection_options(None), [])
+        self.assertEqual(self.manager.projection_options(["team"]), [])
+
+        with patch("sqlalchemy.orm.load_only") as mock_load_only, patch.object(
+            MockDBModel, "list", return_value=[], create=True
+        ) as mock_list:
+            self.manager.list(fields=["name", "team", "description"])
+
+        mock_load_only.assert_called_once_with(
+            MockDBModel.name, MockDBModel.description
+        )
+        self.assertEqual(
+            mock_list.call_args.kwargs["options"], [mock_load_only.return_value]
+        )
+
+    def test_list_page_operation(self):
+        """Keyset pages are capped at max_page_size and count skips loading."""
+        page = {"items": [], "cursor": None, "has_more": False}
+        with patch.object(
+            MockDBModel, "list_page", return_value=page, create=True
+        ) as mock_list_page:
+            self.assertEqual(self.manager.list_page(after="c0"), page)
+            self.manager.list_page(first=10)
+            self.manager.list_page(first=10**6)
+
+        firsts = [call.kwargs["first"] for call in mock_list_page.call_args_list]
+        max_page_size = self.manager.max_page_size
+        self.assertEqual(firsts, [max_page_size, 10, max_page_size])
+        self.assertEqual(mock_list_page.call_args_list[0].kwargs["after"], "c0")
+
+        with patch.object(
+            MockDBModel, "count", return_value=4, create=True
+        ) as mock_count:
+            self.assertEqual(self.manager.count(name="Test Item 1"), 4)
+        kwargs = mock_count.call_args.kwargs
+        self.assertEqual(kwargs["name"], "Test Item 1")
+        self.assertEqual(kwargs["requester_id"], "user1")
+
+    def test_changes_operation(self):
+        """The change feed delegates to the DB class with the cursor."""
+        page = {"changed": [], "deleted_ids": [], "cursor": "c1", "has_more": False}
+        with patch.object(
+            MockDBModel, "list_changes", return_value=page, create=True
+        ) as mock_list_changes:
+            result = self.manager.changes(since="c0", limit=10)
+
+        self.assertEqual(result, page)
+        kwargs = mock_list_changes.call_args.kwargs
+        self.assertEqual(kwargs["since"], "c0")
+        self.assertEqual(kwargs["limit"], 10)
+        self.assertEqual(kwargs["requester_id"], "user1")
+
+    def test_fingerprint_operation(self):
+        """Fingerprints change with the data and vanish while unsettled."""
+        latest = datetime(2020, 1, 1)
+        with patch(
+            "database.StaticPermissions.acl_fingerprint", return_value=(1,)
+        ), patch.object(
+            MockDBModel, "fingerprint", return_value=(2, latest, True), create=True
+        ) as mock_fingerprint:
+            first = self.manager.fingerprint()
+            self.assertIsInstance(first, str)
+            self.assertEqual(mock_fingerprint.call_args.kwargs["filters"], [])
+
+            mock_fingerprint.return_value = (3, latest, True)
+            self.assertNotEqual(self.manager.fingerprint(), first)
+
+            mock_fingerprint.return_value = (3, latest, False)
+            self.assertIsNone(self.manager.fingerprint())
+
+            # A missing entity has no fingerprint, so get can raise its 404
+            mock_fingerprint.return_value = (0, None, True)
+            self.assertIsNone(self.manager.fingerprint(id="missing"))
+
+    def test_entity_fingerprint_operation(self):
+        """A loaded entity's fingerprint matches the pre-read one, query-free."""
+        latest = datetime(2020, 1, 1)
+        entity = MagicMock(id="item1", updated_at=latest)
+        with patch("database.StaticPermissions.acl_fingerprint") as mock_acl, patch(
+            "database.StaticChangeFeed.DATABASE_TYPE", "sqlite"
+        ), patch.object(
+            MockDBModel, "fingerprint", return_value=(1, latest, True), create=True
+        ) as mock_fingerprint:
+            self.assertEqual(
+                self.manager.entity_fingerprint(entity),
+                self.manager.fingerprint(id="item1"),
+            )
+            # Only fingerprint(id=...) queried, and never the permission tables
+            mock_fingerprint.assert_called_once()
+            mock_acl.assert_not_called()
+
+            # Too recent to tell apart from a later write in the same second
+            entity.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+            self.assertIsNone(self.manager.entity_fingerprint(entity))
+
+            entity.updated_at = None
+            self.assertIsNone(self.manager.entity_fingerprint(entity))
+
     def test_batch_update_operation(self):
         """Test batch updating entities."""
         items = [
@@ -482,8 +678,11 @@ class TestAbstractLogicManager(unittest.TestCase):
         results = self.manager.batch_update(items)
 
         self.assertEqual(len(results), 2)
-        self.assertEqual(results[0].name, "Updated 1")
-        self.assertEqual(results[1].name, "Updated 2")
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual([result.index for result in results], [0, 1])
+        self.assertEqual([result.status_code for result in results], [200, 200])
+        self.assertEqual(results[0].item.name, "Updated 1")
+        self.assertEqual(results[1].item.name, "Updated 2")
 
     def test_batch_delete_operation(self):
         """Test batch deleting entities."""
@@ -511,6 +710,106 @@ class TestAbstractLogicManager(unittest.TestCase):
         # Restore original method
         self.manager.delete = original_delete
 
+    def test_batch_update_atomic_set_based(self):
+        """Atomic batches write items sharing the same data with one statement per chunk."""
+        ids = [str(uuid.uuid4()) for _ in range(5)]
+        items = [
+            {"id": id, "data": {"name": "Same", "description": "Batch"}}
+            for id in ids[:4]
+        ]
+        items.append({"id": ids[4], "data": {"name": "Other", "description": "Batch"}})
+
+        def update_many(requester_id, db, ids, new_properties, **kwargs):
+            return [
+                self.manager.DBClass.update(
+                    requester_id, db, "dto", self.manager.Model, new_properties, id
+                )
+                for id in ids
+            ]
+
+        mapper = MagicMock()
+        mapper.column_attrs.keys.return_value = ["name", "description"]
+        with patch.object(
+            self.manager, "_batch_is_set_based", return_value=True
+        ), patch.object(MockDBModel, "__mapper__", mapper, create=True), patch.object(
+            MockDBModel, "update_many", side_effect=update_many, create=True
+        ) as mock_update_many:
+            results = self.manager.batch_update(items, atomic=True, chunk_size=3)
+
+        self.assertEqual([result.id for result in results], ids)
+        self.assertEqual(results[4].name, "Other")
+        self.assertEqual(
+            [len(call.kwargs["ids"]) for call in mock_update_many.call_args_list],
+            [3, 1, 1],
+        )
+
+    def test_batch_update_atomic_failure(self):
+        """A failing atomic batch reports the failed item and applies nothing."""
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+        items = [{"id": id, "data": {"name": "Updated"}} for id in ids]
+
+        def update(id, **kwargs):
+            if id == ids[1]:
+                raise HTTPException(status_code=404, detail="Not found")
+            return MagicMock(id=id)
+
+        with patch.object(self.manager, "update", side_effect=update), patch(
+            "AbstractLogicManager.UnitOfWork"
+        ) as mock_unit_of_work:
+            with self.assertRaises(HTTPException) as context:
+                self.manager.batch_update(items, atomic=True)
+
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertEqual(
+            context.exception.detail["errors"],
+            [{"id": ids[1], "error": "Not found", "status_code": 404}],
+        )
+        exit_args = mock_unit_of_work.return_value.__exit__.call_args.args
+        self.assertIs(exit_args[0], HTTPException)
+
+    def test_batch_delete_chunked_partial_failure(self):
+        """Non-atomic batches commit per chunk and report each item's outcome."""
+        ids = [str(uuid.uuid4()) for _ in range(5)]
+
+        def delete(id):
+            if id == ids[3]:
+                raise HTTPException(status_code=403, detail="Denied")
+
+        with patch.object(self.manager, "delete", side_effect=delete), patch(
+            "AbstractLogicManager.UnitOfWork"
+        ) as mock_unit_of_work:
+            results = self.manager.batch_delete(ids, chunk_size=2)
+
+        self.assertEqual([result.id for result in results], ids)
+        self.assertEqual(
+            [result.status_code for result in results], [204, 204, 204, 403, 204]
+        )
+        self.assertEqual(results[3].error, "Denied")
+        self.assertFalse(results[3].ok)
+        # Three chunks, each wrapping one unit of work per item
+        self.assertEqual(mock_unit_of_work.call_count, 3 + 5)
+
+    def test_batch_create_partial_failure(self):
+        """Items created before and after a failed one are returned with it."""
+
+        def create(**kwargs):
+            if kwargs["name"] == "bad":
+                raise HTTPException(status_code=409, detail="Exists")
+            return MagicMock(id=f"id-{kwargs['name']}", name=kwargs["name"])
+
+        with patch.object(self.manager, "create", side_effect=create), patch(
+            "AbstractLogicManager.UnitOfWork"
+        ):
+            results = self.manager.batch_create(
+                [{"name": "a"}, {"name": "bad"}, {"name": "c"}], chunk_size=2
+            )
+
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual([result.status_code for result in results], [201, 409, 201])
+        self.assertEqual([result.id for result in results], ["id-a", None, "id-c"])
+        self.assertEqual(results[2].item.id, "id-c")
+        self.assertEqual(results[1].error, "Exists")
+
     def test_hook_dict_access(self):
         """Test HookDict attribute access."""
         hook_dict = HookDict({"test": {"nested": "value"}})
@@ -526,6 +825,111 @@ class TestAbstractLogicManager(unittest.TestCase):
         with self.assertRaises(AttributeError):
             _ = hook_dict.nonexistent
 
+    def test_construction_with_requester_issues_no_queries(self):
+        """A preloaded requester and shared session make construction query-free."""
+        mock_db = MagicMock(spec=Session)
+        requester = MockUser(id="user1")
+
+        manager = ManagerForTest(requester=requester, db=mock_db)
+
+        mock_db.query.assert_not_called()
+        self.assertIs(manager.requester, requester)
+        self.assertEqual(manager.target_user_id, "user1")
+
+    def test_shared_session_is_not_closed(self):
+        """Only sessions opened by the manager are closed by it."""
+        mock_db = MagicMock(spec=Session)
+        with ManagerForTest(requester=MockUser(id="user1"), db=mock_db):
+            pass
+
+        mock_db.close.assert_not_called()
+
+    def test_class_prepared_once(self):
+        """Hooks are discovered and transformers registered once per class."""
+        with patch("AbstractLogicManager.discover_hooks") as mock_discover:
+            ManagerForTest(requester=MockUser(id="user1"), db=self.mock_db)
+            ManagerForTest(requester=MockUser(id="user2"), db=self.mock_db)
+            mock_discover.assert_not_called()
+
+        other = ManagerForTest(requester=MockUser(id="user2"), db=self.mock_db)
+        transformer = other.search_transformers["custom_search"]
+        self.assertIs(transformer.__self__, other)
+        self.assertNotIn(
+            "custom_search", AbstractBLLManager._search_transformer_registry
+        )
+
+    def test_construction_benchmark(self):
+        """Constructing a manager with a preloaded requester takes microseconds."""
+        import time
+
+        requester = MockUser(id="user1")
+        iterations = 1000
+        start = time.perf_counter()
+        for _ in range(iterations):
+            ManagerForTest(requester=requester, db=self.mock_db)
+        per_manager = (time.perf_counter() - start) / iterations
+
+        self.mock_db.query.assert_called_once()  # Only the setUp manager queried
+        self.assertLess(per_manager, 0.0005)
+
+    def test_include_strategy_by_cardinality(self):
+        """Collections use selectinload, scalar relationships joinedload."""
+        options = AbstractBLLManager.generate_joins(
+            IncludeGroup, ["members.owner", "members.group"]
+        )
+        self.assertEqual(
+            loader_strategies(options),
+            {
+                "members": "selectin",
+                "members.owner": "joined",
+                "members.group": "joined",
+            },
+        )
+
+        options = AbstractBLLManager.generate_joins(IncludeMember, ["group.members"])
+        self.assertEqual(
+            loader_strategies(options), {"group": "joined", "group.members": "selectin"}
+        )
+
+    def test_include_ignores_non_relationships(self):
+        """Unknown names and plain columns are skipped."""
+        options = AbstractBLLManager.generate_joins(
+            IncludeGroup, ["id", "missing", "members.missing"]
+        )
+        self.assertEqual(options, [])
+
+    def test_include_strategy_overrides(self):
+        """Per-call overrides take precedence over class-level ones."""
+        self.manager.DBClass = IncludeGroup
+        self.manager.include_strategies = {"members": "subquery"}
+
+        options = self.manager.include_options(["members.owner"])
+        self.assertEqual(
+            loader_strategies(options),
+            {"members": "subquery", "members.owner": "joined"},
+        )
+
+        options = self.manager.include_options(
+            ["members.owner"], {"members": "joined", "members.owner": "selectin"}
+        )
+        self.assertEqual(
+            loader_strategies(options),
+            {"members": "joined", "members.owner": "selectin"},
+        )
+
+        with self.assertRaises(ValueError):
+            self.manager.include_options(["members"], {"members": "eager"})
+
+    def test_include_depth_cap(self):
+        """Include paths deeper than max_include_depth are rejected."""
+        self.manager.DBClass = IncludeGroup
+        self.manager.max_include_depth = 2
+        self.manager.include_options(["members.group"])
+
+        with self.assertRaises(HTTPException) as context:
+            self.manager.include_options(["members.group.members"])
+        self.assertEqual(context.exception.status_code, 400)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 import logging
 import secrets
 import string
@@ -5,13 +7,16 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 import bcrypt
-from fastapi import Header, HTTPException, Request
+from fastapi import Header, HTTPException, Request, Security
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import APIKeyHeader
 from pydantic import BaseModel, Field, model_validator
-from sqlalchemy import or_
+from sqlalchemy import func, or_, update
 from sqlalchemy.orm import Session
 
 from database.Base import get_session
 from database.DB_Auth import (
+    ApiKey,
     AuthSession,
     FailedLoginAttempt,
     Invitation,
@@ -26,8 +31,11 @@ from database.DB_Auth import (
     UserRecoveryQuestion,
     UserTeam,
 )
+from database.StaticPermissions import api_key_scopes
+from lib.Cache import CacheHint, ChangeWatcher, TTLCache
 from lib.Environment import env
 from lib.Import import jwt
+from lib.RevocationIndex import RevocationIndex
 from logic.AbstractLogicManager import (
     AbstractBLLManager,
     BaseMixinModel,
@@ -40,6 +48,66 @@ from logic.AbstractLogicManager import (
     UpdateMixinModel,
 )
 
+# How far behind the newest revocation seen each poll reaches, to catch
+# revocations committed after a newer one was loaded
+SESSION_REVOCATION_OVERLAP_SECONDS = 60
+
+
+def _load_revoked_sessions(since: Optional[datetime]):
+    """Load revoked, unexpired sessions changed since the given high-water mark."""
+    with get_session() as db:
+        query = db.query(
+            AuthSession.session_key, AuthSession.expires_at, AuthSession.updated_at
+        ).filter(
+            AuthSession.revoked == True,
+            AuthSession.expires_at > datetime.now(timezone.utc),
+        )
+        if since is not None:
+            query = query.filter(AuthSession.updated_at >= since)
+        return query.all()
+
+
+# Request state key under which an authenticated user is handed to in-process
+# sub-requests, so they are not authenticated again (see endpoints/EP_Batch.py)
+AUTHENTICATED_USER_STATE = "authenticated_user"
+
+# Per-process index of revoked session keys, checked against the JWT jti claim
+session_revocations = RevocationIndex(
+    loader=_load_revoked_sessions,
+    refresh_interval=float(env("SESSION_REVOCATION_REFRESH_SECONDS") or 5),
+    # updated_at is the revoking transaction's start time on Postgres
+    overlap=SESSION_REVOCATION_OVERLAP_SECONDS,
+)
+
+
+class Principal(BaseModel):
+    """Compact authenticated identity resolved from a token or API key."""
+
+    id: str = Field(..., description="ID of the authenticated user")
+    email: Optional[str] = Field(None, description="Email of the authenticated user")
+    active: bool = Field(True, description="Whether the user is active")
+    scopes: Optional[List[str]] = Field(
+        None, description="API key scopes; None when the principal is unrestricted"
+    )
+    api_key_id: Optional[str] = Field(
+        None, description="ID of the API key used to authenticate, if any"
+    )
+
+
+# Per-process cache of user id -> Principal for token verification
+principal_cache = TTLCache(
+    maxsize=4096, ttl=float(env("PRINCIPAL_CACHE_SECONDS") or 30)
+)
+
+
+def _evict_principal(entity, *args):
+    """Drop a changed or deleted user from the principal cache."""
+    principal_cache.invalidate(entity.id)
+
+
+User.hooks["update"]["after"].append(_evict_principal)
+User.hooks["delete"]["after"].append(_evict_principal)
+
 
 class UserModel(
     BaseMixinModel.Optional, UpdateMixinModel.Optional, ImageMixinModel.Optional
@@ -158,16 +226,18 @@ class UserManager(AbstractBLLManager):
 
     def __init__(
         self,
-        requester_id: str,
+        requester_id: Optional[str] = None,
         target_user_id: Optional[str] = None,
         target_team_id: Optional[str] = None,
         db: Optional[Session] = None,
+        requester: Optional[Any] = None,
     ):
         super().__init__(
             requester_id=requester_id,
             target_user_id=target_user_id,
             target_team_id=target_team_id,
             db=db,
+            requester=requester,
         )
         self._credentials = None
         self._metadata = None
@@ -197,7 +267,7 @@ class UserManager(AbstractBLLManager):
     def credentials(self):
         if self._credentials is None:
             self._credentials = UserCredentialManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 db=self.db,
             )
@@ -207,7 +277,7 @@ class UserManager(AbstractBLLManager):
     def metadata(self):
         if self._metadata is None:
             self._metadata = UserMetadataManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 db=self.db,
             )
@@ -217,7 +287,7 @@ class UserManager(AbstractBLLManager):
     def failed_logins(self):
         if self._failed_logins is None:
             self._failed_logins = FailedLoginAttemptManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 db=self.db,
             )
@@ -227,7 +297,7 @@ class UserManager(AbstractBLLManager):
     def user_teams(self):
         if self._user_teams is None:
             self._user_teams = UserTeamManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 db=self.db,
             )
@@ -237,7 +307,7 @@ class UserManager(AbstractBLLManager):
     def sessions(self):
         if self._sessions is None:
             self._sessions = UserSessionManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 db=self.db,
             )
@@ -292,7 +362,7 @@ class UserManager(AbstractBLLManager):
 
         # Create credentials for the user without changing the requester_id
         credentials_manager = UserCredentialManager(
-            requester_id=self.requester.id,
+            requester=self.requester,
             target_user_id=user.id,
             target_team_id=self.target_team_id,
             db=self.db,
@@ -340,7 +410,12 @@ class UserManager(AbstractBLLManager):
         return user
 
     @staticmethod
-    def generate_jwt_token(user_id: str, email: str, expiration_hours: int = 24) -> str:
+    def generate_jwt_token(
+        user_id: str,
+        email: str,
+        expiration_hours: int = 24,
+        session_key: Optional[str] = None,
+    ) -> str:
         """Generate a JWT token for authentication"""
         expiration = datetime.now(timezone.utc) + timedelta(hours=expiration_hours)
         payload = {
@@ -349,52 +424,80 @@ class UserManager(AbstractBLLManager):
             "exp": expiration,
             "iat": datetime.now(timezone.utc),
         }
+        if session_key:
+            payload["jti"] = session_key
         return jwt.encode(payload, env("JWT_SECRET"), algorithm="HS256")
 
     @staticmethod
-    def verify_token(token: str, db: Optional[Session] = None) -> Dict[str, Any]:
-        """Verify a JWT token and return user information"""
+    def _load_principal(
+        user_id: str, db: Optional[Session] = None
+    ) -> Optional[Principal]:
+        """Single primary-key lookup of the columns needed to authorize a request."""
+        close_session = db is None
+        db = db or get_session()
         try:
-            close_session = False
-            if db is None:
-                db = get_session()
-                close_session = True
-
-            try:
-                payload = jwt.decode(token, env("JWT_SECRET"), algorithms=["HS256"])
+            row = (
+                db.query(User.id, User.email, User.active)
+                .filter(User.id == user_id, User.deleted_at == None)
+                .first()
+            )
+            return Principal(**row._mapping) if row else None
+        finally:
+            if close_session:
+                db.close()
 
-                user = User.get(
-                    requester_id=env("ROOT_ID"),
-                    db=db,
-                    id=payload["sub"],
-                    return_type="dto",
-                    override_dto=UserModel,
-                )
+    @staticmethod
+    def verify_token(token: str, db: Optional[Session] = None) -> Principal:
+        """
+        Verify a JWT token or API key and return the authenticated principal.
 
-                if not user.active:
-                    raise HTTPException(status_code=401, detail="Inactive user")
+        This is the lightweight path used by the /v1 verification route and
+        GraphQL context construction: the token is decoded once and the user is
+        resolved from the principal cache or a single primary-key lookup, without
+        permission filtering or DTO conversion.
+        """
+        if not token:
+            raise HTTPException(status_code=401, detail="Token is missing")
 
-                return True
-            except Exception as e:
-                raise HTTPException(
-                    status_code=401, detail=f"Token verification failed: {str(e)}"
-                )
-            finally:
-                if close_session:
-                    db.close()
+        if ApiKeyManager.is_root_key(token) or ApiKeyManager.parse_key(token):
+            return ApiKeyManager.authenticate(token, db)
 
+        try:
+            payload = jwt.decode(jwt=token, key=env("JWT_SECRET"), algorithms=["HS256"])
         except jwt.ExpiredSignatureError:
             raise HTTPException(status_code=401, detail="Token has expired")
         except jwt.InvalidTokenError:
             raise HTTPException(status_code=401, detail="Invalid token")
-        except Exception as e:
-            raise HTTPException(
-                status_code=401, detail=f"Token verification failed: {str(e)}"
-            )
+
+        if session_revocations.is_revoked(payload.get("jti")):
+            raise HTTPException(status_code=401, detail="Session has been revoked")
+
+        user_id = payload.get("sub")
+        if not user_id:
+            raise HTTPException(status_code=401, detail="Invalid token")
+
+        credential_changes.poll()
+        principal = principal_cache.get(user_id)
+        if principal is None:
+            principal = UserManager._load_principal(user_id, db)
+            if principal is None:
+                raise HTTPException(status_code=401, detail="User not found")
+            principal_cache.set(user_id, principal)
+
+        if not principal.active:
+            raise HTTPException(status_code=401, detail="Inactive user")
+
+        return principal
 
     @staticmethod
     def auth(authorization: str = Header(None), request: Request = None) -> UserModel:
         """Authenticate a user from Authorization header"""
+        if request is not None:
+            # Sub-requests of a batch reuse the user the batch authenticated
+            user = request.scope.get("state", {}).get(AUTHENTICATED_USER_STATE)
+            if user is not None:
+                return user
+
         if not authorization:
             raise HTTPException(
                 status_code=401, detail="Authorization header is missing!"
@@ -422,7 +525,7 @@ class UserManager(AbstractBLLManager):
                     authorization.replace("Bearer ", "").replace("bearer ", "").strip()
                 )
 
-                if token == env("ROOT_API_KEY"):
+                if ApiKeyManager.is_root_key(token):
                     return db.query(User).filter(User.id == env("ROOT_ID")).first()
 
                 try:
@@ -436,6 +539,11 @@ class UserManager(AbstractBLLManager):
                         s=server,
                     )
 
+                    if session_revocations.is_revoked(payload.get("jti")):
+                        raise HTTPException(
+                            status_code=401, detail="Session has been revoked"
+                        )
+
                     user = db.query(User).filter(User.id == payload["sub"]).first()
                     if not user:
                         raise HTTPException(status_code=404, detail="User not found")
@@ -737,13 +845,13 @@ class UserManager(AbstractBLLManager):
                 status_code=400, detail="Either password or token is required"
             )
 
-        # Login successful - generate JWT token
+        # Login successful - generate JWT token bound to a new session
+        session_key = secrets.token_hex(16)
         token = UserManager.generate_jwt_token(
-            user_id=str(user["id"]), email=user["email"]
+            user_id=str(user["id"]), email=user["email"], session_key=session_key
         )
 
         # Create session
-        session_key = secrets.token_hex(16)
         AuthSession.create(
             requester_id=root_id,
             db=db,
@@ -809,14 +917,14 @@ class UserManager(AbstractBLLManager):
         self,
         include: Optional[List[str]] = None,
         fields: Optional[List[str]] = [],
+        include_strategies: Optional[Dict[str, str]] = None,
         **kwargs,
     ) -> Any:
         """Get a user with optional included relationships."""
         options = []
 
-        # TODO Move generate_joins to AbstractDatabaseEntity.py
         if include:
-            options = self.generate_joins(self.DBClass, include)
+            options = self.include_options(include, include_strategies)
 
         return self.DBClass.get(
             requester_id=self.requester.id,
@@ -1254,16 +1362,18 @@ class TeamManager(AbstractBLLManager):
 
     def __init__(
         self,
-        requester_id: str,
+        requester_id: Optional[str] = None,
         target_user_id: Optional[str] = None,
         target_team_id: Optional[str] = None,
         db: Optional[Session] = None,
+        requester: Optional[Any] = None,
     ):
         super().__init__(
             requester_id=requester_id,
             target_user_id=target_user_id,
             target_team_id=target_team_id,
             db=db,
+            requester=requester,
         )
         self._team_metadata = None
         self._user_teams = None
@@ -1274,7 +1384,7 @@ class TeamManager(AbstractBLLManager):
         """Get the team metadata manager"""
         if self._team_metadata is None:
             self._team_metadata = TeamMetadataManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_team_id=self.target_team_id,
                 db=self.db,
             )
@@ -1285,7 +1395,7 @@ class TeamManager(AbstractBLLManager):
         """Get the user team manager"""
         if self._user_teams is None:
             self._user_teams = UserTeamManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_team_id=self.target_team_id,
                 db=self.db,
             )
@@ -1296,7 +1406,7 @@ class TeamManager(AbstractBLLManager):
         """Get the role manager"""
         if self._roles is None:
             self._roles = RoleManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_team_id=self.target_team_id,
                 db=self.db,
             )
@@ -1336,26 +1446,29 @@ class TeamManager(AbstractBLLManager):
         if "encryption_key" not in model_fields:
             model_fields["encryption_key"] = secrets.token_hex(32)
 
-        # Create the team first
-        team = super().create(**model_fields)
-
-        # Only proceed with metadata and associations if team creation succeeded
-        if team:
-            # Create metadata if provided
-            if metadata_fields:
-                for key, value in metadata_fields.items():
-                    self.team_metadata.create(
-                        team_id=team.id,
-                        key=key,
-                        value=str(value),
-                    )
+        # The team, its metadata and the creator's membership commit together
+        with self.unit_of_work():
+            team = super().create(**model_fields)
+
+            # Only proceed with metadata and associations if team creation succeeded
+            if team:
+                # Create metadata if provided
+                if metadata_fields:
+                    for key, value in metadata_fields.items():
+                        self.team_metadata.create(
+                            team_id=team.id,
+                            key=key,
+                            value=str(value),
+                        )
 
-            # Add the creator as an admin of the team
-            UserTeamManager(
-                requester_id=env("ROOT_ID")
-            ).create(  # Must create with Root ID or can't see Team (yet).
-                team_id=team.id, user_id=self.requester.id, role_id=env("ADMIN_ROLE_ID")
-            )
+                # Add the creator as an admin of the team
+                UserTeamManager(
+                    requester_id=env("ROOT_ID"), db=self.db
+                ).create(  # Must create with Root ID or can't see Team (yet).
+                    team_id=team.id,
+                    user_id=self.requester.id,
+                    role_id=env("ADMIN_ROLE_ID"),
+                )
 
         return team
 
@@ -1570,6 +1683,8 @@ class RoleManager(AbstractBLLManager):
     ReferenceModel = RoleReferenceModel
     NetworkModel = RoleNetworkModel
     DBClass = Role
+    # Catalog data: served from the GraphQL response cache
+    cache_hint = CacheHint(max_age=300)
 
     # TODO if a role is deleted, all users with that role should fall back to the role from which it inherits.
     def _register_search_transformers(self):
@@ -2051,16 +2166,18 @@ class InvitationManager(AbstractBLLManager):
 
     def __init__(
         self,
-        requester_id: str,
+        requester_id: Optional[str] = None,
         target_user_id: Optional[str] = None,
         target_team_id: Optional[str] = None,
         db: Optional[Session] = None,
+        requester: Optional[Any] = None,
     ):
         super().__init__(
             requester_id=requester_id,
             target_user_id=target_user_id,
             target_team_id=target_team_id,
             db=db,
+            requester=requester,
         )
         self._invitation_invitee_manager = None
 
@@ -2069,7 +2186,7 @@ class InvitationManager(AbstractBLLManager):
         """Get the invitation invitee manager"""
         if self._invitation_invitee_manager is None:
             self._invitation_invitee_manager = InvitationInviteeManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_team_id=self.target_team_id,
                 db=self.db,
             )
@@ -2285,60 +2402,62 @@ class InvitationInviteeManager(AbstractBLLManager):
             email=user.email,
         )
 
-        # For invitation codes that don't have specific invitees, create an invitee record
-        if not invitees:
-            if not invitation.code:
-                # This is a direct invitation without a code, we should have found a matching invitee
-                raise HTTPException(
-                    status_code=403, detail="Your email is not invited to this team"
-                )
+        # The invitee record and the team membership commit together
+        with self.unit_of_work():
+            # For invitation codes that don't have specific invitees, create an invitee record
+            if not invitees:
+                if not invitation.code:
+                    # This is a direct invitation without a code, we should have found a matching invitee
+                    raise HTTPException(
+                        status_code=403, detail="Your email is not invited to this team"
+                    )
+                else:
+                    # For invitation codes, create an invitee record
+                    invitee = self.create(
+                        invitation_id=invitation.id,
+                        email=user.email,
+                        is_accepted=True,
+                        accepted_at=datetime.now(timezone.utc),
+                        user_id=user_id,
+                    )
             else:
-                # For invitation codes, create an invitee record
-                invitee = self.create(
-                    invitation_id=invitation.id,
-                    email=user.email,
+                # Use existing invitee record
+                invitee = invitees[0]
+                self.update(
+                    id=invitee.id,
                     is_accepted=True,
                     accepted_at=datetime.now(timezone.utc),
                     user_id=user_id,
                 )
-        else:
-            # Use existing invitee record
-            invitee = invitees[0]
-            self.update(
-                id=invitee.id,
-                is_accepted=True,
-                accepted_at=datetime.now(timezone.utc),
-                user_id=user_id,
-            )
-
-        # Add user to team or update existing membership
-        user_team_manager = UserTeamManager(
-            requester_id=self.requester.id, target_user_id=user_id, db=self.db
-        )
-
-        existing_team_membership = UserTeam.list(
-            requester_id=self.requester.id,
-            db=self.db,
-            user_id=user_id,
-            team_id=invitation.team_id,
-        )
 
-        if existing_team_membership:
-            # Update existing team membership
-            user_team = user_team_manager.update(
-                id=existing_team_membership[0].id,
-                role_id=invitation.role_id,
-                enabled=True,
+            # Add user to team or update existing membership
+            user_team_manager = UserTeamManager(
+                requester=self.requester, target_user_id=user_id, db=self.db
             )
-        else:
-            # Create new team membership
-            user_team = user_team_manager.create(
+
+            existing_team_membership = UserTeam.list(
+                requester_id=self.requester.id,
+                db=self.db,
                 user_id=user_id,
                 team_id=invitation.team_id,
-                role_id=invitation.role_id,
-                enabled=True,
             )
 
+            if existing_team_membership:
+                # Update existing team membership
+                user_team = user_team_manager.update(
+                    id=existing_team_membership[0].id,
+                    role_id=invitation.role_id,
+                    enabled=True,
+                )
+            else:
+                # Create new team membership
+                user_team = user_team_manager.create(
+                    user_id=user_id,
+                    team_id=invitation.team_id,
+                    role_id=invitation.role_id,
+                    enabled=True,
+                )
+
         return {
             "success": True,
             "team_id": invitation.team_id,
@@ -2465,16 +2584,18 @@ class UserSessionManager(AbstractBLLManager):
 
     def __init__(
         self,
-        requester_id: str,
+        requester_id: Optional[str] = None,
         target_user_id: Optional[str] = None,
         target_team_id: Optional[str] = None,
         db: Optional[Session] = None,
+        requester: Optional[Any] = None,
     ):
         super().__init__(
             requester_id=requester_id,
             target_user_id=target_user_id,
             target_team_id=target_team_id,
             db=db,
+            requester=requester,
         )
         self._users = None
 
@@ -2483,7 +2604,7 @@ class UserSessionManager(AbstractBLLManager):
         """Get the user manager"""
         if self._users is None:
             self._users = UserManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 target_team_id=self.target_team_id,
                 db=self.db,
@@ -2517,6 +2638,7 @@ class UserSessionManager(AbstractBLLManager):
             id=session_id,
             new_properties={"revoked": True, "is_active": False},
         )
+        session_revocations.revoke(session["session_key"], session["expires_at"])
 
         return {"message": "Session revoked successfully"}
 
@@ -2541,23 +2663,340 @@ class UserSessionManager(AbstractBLLManager):
         return {"message": "Session activity updated successfully"}
 
     def revoke_sessions(self, user_id: str) -> int:
-        """Revoke all sessions for a user"""
-        sessions = AuthSession.list(
+        """Revoke all sessions for a user in a single UPDATE"""
+        from database.StaticPermissions import (
+            PermissionType,
+            generate_permission_filter,
+        )
+
+        sessions = (
+            self.db.query(
+                AuthSession.id, AuthSession.session_key, AuthSession.expires_at
+            )
+            .filter(
+                AuthSession.user_id == user_id,
+                AuthSession.is_active == True,
+                AuthSession.revoked == False,
+                generate_permission_filter(
+                    self.requester.id, AuthSession, self.db, PermissionType.EDIT
+                ),
+            )
+            .all()
+        )
+
+        if not sessions:
+            return 0
+
+        self.db.execute(
+            update(AuthSession)
+            .where(AuthSession.id.in_([session.id for session in sessions]))
+            .values(
+                is_active=False,
+                revoked=True,
+                updated_at=func.now(),
+                updated_by_user_id=self.requester.id,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+
+        for session in sessions:
+            session_revocations.revoke(session.session_key, session.expires_at)
+
+        return len(sessions)
+
+
+class ApiKeyModel(
+    BaseMixinModel.Optional, UpdateMixinModel.Optional, UserReferenceModel.Optional
+):
+    name: Optional[str] = Field(None, description="Human-readable name of the key")
+    prefix: Optional[str] = Field(
+        None, description="Public identifier embedded in the key"
+    )
+    scopes: Optional[str] = Field(
+        None, description="Space-separated scopes, e.g. 'providers:view teams:*'"
+    )
+    team_id: Optional[str] = Field(None, description="Team the key belongs to")
+    expires_at: Optional[datetime] = Field(None, description="When the key expires")
+    revoked: Optional[bool] = Field(
+        None, description="Whether the key has been revoked"
+    )
+    key: Optional[str] = Field(
+        None, description="The full API key, only returned when the key is created"
+    )
+
+    class ReferenceID:
+        api_key_id: str = Field(..., description="The ID of the related API key")
+
+        class Optional:
+            api_key_id: Optional[str] = None
+
+        class Search:
+            api_key_id: Optional[StringSearchModel] = None
+
+    class Create(BaseModel):
+        name: str = Field(..., description="Human-readable name of the key")
+        scopes: Optional[str] = Field(
+            None, description="Space-separated scopes; omit for the owner's full access"
+        )
+        team_id: Optional[str] = Field(None, description="Team the key belongs to")
+        expires_at: Optional[datetime] = Field(None, description="When the key expires")
+
+    class Update(BaseModel):
+        name: Optional[str] = Field(None, description="Human-readable name of the key")
+        scopes: Optional[str] = Field(None, description="Space-separated scopes")
+        expires_at: Optional[datetime] = Field(None, description="When the key expires")
+        revoked: Optional[bool] = Field(
+            None, description="Whether the key has been revoked"
+        )
+
+    class Search(BaseMixinModel.Search, UserModel.ReferenceID.Search):
+        name: Optional[StringSearchModel] = None
+        prefix: Optional[StringSearchModel] = None
+        revoked: Optional[bool] = None
+        expires_at: Optional[DateSearchModel] = None
+
+
+class ApiKeyReferenceModel(ApiKeyModel.ReferenceID):
+    api_key: Optional[ApiKeyModel] = None
+
+    class Optional(ApiKeyModel.ReferenceID.Optional):
+        api_key: Optional[ApiKeyModel] = None
+
+
+class ApiKeyNetworkModel:
+    class POST(BaseModel):
+        api_key: ApiKeyModel.Create
+
+    class PUT(BaseModel):
+        api_key: ApiKeyModel.Update
+
+    class SEARCH(BaseModel):
+        api_key: ApiKeyModel.Search
+
+    class ResponseSingle(BaseModel):
+        api_key: ApiKeyModel
+
+    class ResponsePlural(BaseModel):
+        api_keys: List[ApiKeyModel]
+
+
+# Per-process cache of live API key lookups keyed by public prefix
+api_key_cache = TTLCache(maxsize=4096, ttl=float(env("API_KEY_CACHE_SECONDS") or 60))
+
+
+def _evict_api_key(entity, *args):
+    """Drop a changed or deleted key from the local cache."""
+    api_key_cache.invalidate(entity.prefix)
+
+
+ApiKey.hooks["update"]["after"].append(_evict_api_key)
+ApiKey.hooks["delete"]["after"].append(_evict_api_key)
+
+
+def _load_credential_changes(since: datetime):
+    """
+    Users and API keys changed or deleted since `since`, as ("user", id) and
+    ("api_key", prefix) keys. A changed user also changes the keys they own.
+    """
+    with get_session() as db:
+        users = (
+            db.query(User.id, User.updated_at)
+            .filter(or_(User.updated_at >= since, User.deleted_at >= since))
+            .all()
+        )
+        user_ids = [user.id for user in users]
+        keys = (
+            db.query(ApiKey.prefix, ApiKey.updated_at)
+            .filter(
+                or_(
+                    ApiKey.updated_at >= since,
+                    ApiKey.deleted_at >= since,
+                    ApiKey.user_id.in_(user_ids),
+                )
+            )
+            .all()
+        )
+    return [(("user", user.id), user.updated_at) for user in users] + [
+        (("api_key", key.prefix), key.updated_at) for key in keys
+    ]
+
+
+def _evict_credential(key):
+    kind, value = key
+    if kind == "user":
+        principal_cache.invalidate(value)
+    else:
+        api_key_cache.invalidate(value)
+
+
+# Evicts users and keys other workers changed, e.g. deactivated or revoked,
+# from principal_cache and api_key_cache
+credential_changes = ChangeWatcher(
+    loader=_load_credential_changes,
+    evict=_evict_credential,
+    refresh_interval=float(env("SESSION_REVOCATION_REFRESH_SECONDS") or 5),
+    overlap=SESSION_REVOCATION_OVERLAP_SECONDS,
+)
+
+
+class ApiKeyManager(AbstractBLLManager):
+    Model = ApiKeyModel
+    ReferenceModel = ApiKeyReferenceModel
+    NetworkModel = ApiKeyNetworkModel
+    DBClass = ApiKey
+
+    KEY_PREFIX = "sk"
+
+    @staticmethod
+    def hash_secret(secret: str) -> str:
+        """Keyed hash of the secret part of a key (HMAC-SHA256, not bcrypt)."""
+        pepper = env("API_KEY_SECRET") or env("JWT_SECRET") or ""
+        return hmac.new(pepper.encode(), secret.encode(), hashlib.sha256).hexdigest()
+
+    @classmethod
+    def parse_key(cls, api_key: str) -> Optional[tuple]:
+        """Split a key of the form sk_<prefix>_<secret> into (prefix, secret)."""
+        parts = api_key.strip().split("_", 2)
+        if len(parts) != 3 or parts[0] != cls.KEY_PREFIX or not all(parts[1:]):
+            return None
+        return parts[1], parts[2]
+
+    @staticmethod
+    def is_root_key(api_key: Optional[str]) -> bool:
+        """Constant-time comparison against ROOT_API_KEY."""
+        root_key = env("ROOT_API_KEY")
+        if not api_key or not root_key:
+            return False
+        return hmac.compare_digest(api_key.encode(), root_key.encode())
+
+    def _create_single_entity(self, **kwargs):
+        """Create a key; the full key is only ever returned by this call."""
+        args = self.Model.Create(**kwargs)
+        self.createValidation(args)
+
+        create_args = {
+            k: v
+            for k, v in args.model_dump(exclude_unset=True).items()
+            if v is not None
+        }
+        create_args["user_id"] = self.target_user_id
+
+        hooks = self.__class__.hooks
+        for hook in hooks["create"]["before"]:
+            hook(self, create_args)
+
+        prefix = secrets.token_hex(6)
+        secret = secrets.token_urlsafe(32)
+        entity = self.DBClass.create(
             requester_id=self.requester.id,
             db=self.db,
-            user_id=user_id,
-            is_active=True,
-            revoked=False,
+            return_type="dto",
+            override_dto=self.Model,
+            prefix=prefix,
+            key_hash=self.hash_secret(secret),
+            **create_args,
         )
+        entity.key = f"{self.KEY_PREFIX}_{prefix}_{secret}"
 
-        revoked_count = 0
-        for session in sessions:
-            AuthSession.update(
-                requester_id=self.requester.id,
-                db=self.db,
-                id=session.id,
-                new_properties={"is_active": False, "revoked": True},
+        for hook in hooks["create"]["after"]:
+            hook(self, entity, create_args)
+
+        return entity
+
+    def revoke(self, id: str) -> Dict[str, str]:
+        """Revoke an API key"""
+        self.update(id=id, revoked=True)
+        return {"message": "API key revoked successfully"}
+
+    @staticmethod
+    def _load_key(
+        prefix: str, db: Optional[Session] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Single indexed lookup of a live key and its owner by prefix."""
+        close_session = db is None
+        db = db or get_session()
+        try:
+            row = (
+                db.query(
+                    ApiKey.id,
+                    ApiKey.user_id,
+                    ApiKey.key_hash,
+                    ApiKey.scopes,
+                    ApiKey.expires_at,
+                    User.email,
+                    User.active,
+                )
+                .join(User, User.id == ApiKey.user_id)
+                .filter(
+                    ApiKey.prefix == prefix,
+                    ApiKey.revoked != True,
+                    ApiKey.deleted_at == None,
+                )
+                .first()
             )
-            revoked_count += 1
+            return dict(row._mapping) if row else None
+        finally:
+            if close_session:
+                db.close()
+
+    @classmethod
+    def authenticate(cls, api_key: str, db: Optional[Session] = None) -> Principal:
+        """Resolve an API key to a principal, using the in-memory cache when possible."""
+        if not api_key:
+            raise HTTPException(status_code=401, detail="API key is missing")
+
+        if cls.is_root_key(api_key):
+            return Principal(id=env("ROOT_ID"))
+
+        parsed = cls.parse_key(api_key)
+        if parsed is None:
+            raise HTTPException(status_code=401, detail="Invalid API key")
+        prefix, secret = parsed
+
+        credential_changes.poll()
+        entry = api_key_cache.get(prefix)
+        if entry is None:
+            entry = cls._load_key(prefix, db)
+            # Unknown prefixes are not cached, so they cannot evict live keys
+            if entry is not None:
+                api_key_cache.set(prefix, entry)
+
+        if entry is None or not hmac.compare_digest(
+            entry["key_hash"], cls.hash_secret(secret)
+        ):
+            raise HTTPException(status_code=401, detail="Invalid API key")
+
+        expires_at = entry["expires_at"]
+        if expires_at is not None:
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            if expires_at <= datetime.now(timezone.utc):
+                raise HTTPException(status_code=401, detail="API key has expired")
+
+        if not entry["active"]:
+            raise HTTPException(status_code=403, detail="User account is disabled")
 
-        return revoked_count
+        return Principal(
+            id=entry["user_id"],
+            email=entry["email"],
+            active=entry["active"],
+            scopes=entry["scopes"].split() if entry["scopes"] else None,
+            api_key_id=entry["id"],
+        )
+
+    @staticmethod
+    async def auth(
+        x_api_key: str = Security(APIKeyHeader(name="X-API-Key", auto_error=False)),
+    ) -> Principal:
+        """Authenticate a request from the X-API-Key header and apply its scopes."""
+        if not x_api_key:
+            raise HTTPException(status_code=401, detail="X-API-Key header is missing!")
+
+        principal = await run_in_threadpool(ApiKeyManager.authenticate, x_api_key)
+
+        # Scopes are enforced by generate_permission_filter for this request
+        api_key_scopes.set(
+            frozenset(principal.scopes) if principal.scopes is not None else None
+        )
+        return principal
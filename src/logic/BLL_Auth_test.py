@@ -1,10 +1,13 @@
 import pytest
 from faker import Faker
+from fastapi import HTTPException
 
 from AbstractTest import SkipReason, TestToSkip
+from database.DB_Auth import User
 from lib.Environment import env
 from logic.AbstractBLLTest import AbstractBLLTest, TestCategory, TestClassConfig
 from logic.BLL_Auth import (
+    ApiKeyManager,
     InvitationManager,
     PermissionManager,
     RoleManager,
@@ -75,6 +78,30 @@ class TestUserManager(AbstractBLLTest):
             self.tracked_entities["delete"].id, self.tracked_entities["delete"].id
         )
 
+    def test_verify_token(self, admin_a):
+        """Token verification resolves a principal and reflects deactivation."""
+        token = UserManager.generate_jwt_token(admin_a.id, admin_a.email)
+
+        principal = UserManager.verify_token(token)
+        assert principal.id == admin_a.id
+        assert principal.active
+
+        User.update(
+            requester_id=env("ROOT_ID"), id=admin_a.id, new_properties={"active": False}
+        )
+        try:
+            with pytest.raises(HTTPException):
+                UserManager.verify_token(token)
+        finally:
+            User.update(
+                requester_id=env("ROOT_ID"),
+                id=admin_a.id,
+                new_properties={"active": True},
+            )
+
+        with pytest.raises(HTTPException):
+            UserManager.verify_token(token + "x")
+
 
 class TestTeamManager(AbstractBLLTest):
     class_under_test = TeamManager
@@ -225,3 +252,32 @@ class TestInvitationManager(AbstractBLLTest):
         # Team ID is required for invitations
         if hasattr(self, "team_a") and self.team_a:
             self.create_fields["team_id"] = self.team_a.id
+
+
+class TestApiKeyManager(AbstractBLLTest):
+    class_under_test = ApiKeyManager
+    create_fields = {
+        "name": f"Test Key {faker.word()}",
+        "scopes": "providers:view",
+    }
+    update_fields = {
+        "name": f"Updated Key {faker.word()}",
+        "scopes": "providers:*",
+    }
+    unique_field = "name"
+
+    def test_authenticate_created_key(self):
+        """The plaintext key returned on creation authenticates as its owner."""
+        manager = self.class_under_test(requester_id=self.admin_a.id)
+        api_key = manager.create(**self.create_fields)
+
+        principal = ApiKeyManager.authenticate(api_key.key)
+        assert principal.id == self.admin_a.id
+        assert principal.scopes == ["providers:view"]
+
+        with pytest.raises(Exception):
+            ApiKeyManager.authenticate(api_key.key + "x")
+
+        manager.update(id=api_key.id, revoked=True)
+        with pytest.raises(Exception):
+            ApiKeyManager.authenticate(api_key.key)
@@ -3,6 +3,7 @@ from typing import Any, List, Optional
 from pydantic import BaseModel, Field
 
 from database.DB_Extensions import Ability, Extension
+from lib.Cache import CacheHint
 from logic.AbstractLogicManager import (
     AbstractBLLManager,
     BaseMixinModel,
@@ -67,6 +68,8 @@ class ExtensionManager(AbstractBLLManager):
     ReferenceModel = ExtensionReferenceModel
     NetworkModel = ExtensionNetworkModel
     DBClass = Extension
+    # Catalog data: served from the GraphQL response cache
+    cache_hint = CacheHint(max_age=300)
 
     def __init__(self, **kwargs: Any) -> None:
         # Accept all parameters as kwargs to change signature
@@ -74,6 +77,7 @@ class ExtensionManager(AbstractBLLManager):
         target_user_id = kwargs.get("target_user_id")
         target_team_id = kwargs.get("target_team_id")
         db = kwargs.get("db")
+        requester = kwargs.get("requester")
 
         # Initialize parent with the extracted parameters
         super().__init__(
@@ -81,6 +85,7 @@ class ExtensionManager(AbstractBLLManager):
             target_user_id=target_user_id,
             target_team_id=target_team_id,
             db=db,
+            requester=requester,
         )
         # Initialize ability manager to None
         self._abilities = None
@@ -89,7 +94,7 @@ class ExtensionManager(AbstractBLLManager):
     def abilities(self):
         if self._abilities is None:
             self._abilities = AbilityManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 target_team_id=self.target_team_id,
                 db=self.db,
@@ -195,6 +200,8 @@ class AbilityManager(AbstractBLLManager):
     ReferenceModel = AbilityReferenceModel
     NetworkModel = AbilityNetworkModel
     DBClass = Ability
+    # Catalog data: served from the GraphQL response cache
+    cache_hint = CacheHint(max_age=300)
 
     def __init__(self, **kwargs: Any) -> None:
         # Extract parameters from kwargs
@@ -202,6 +209,7 @@ class AbilityManager(AbstractBLLManager):
         target_user_id = kwargs.get("target_user_id")
         target_team_id = kwargs.get("target_team_id")
         db = kwargs.get("db")
+        requester = kwargs.get("requester")
 
         # Call parent constructor
         super().__init__(
@@ -209,4 +217,5 @@ class AbilityManager(AbstractBLLManager):
             target_user_id=target_user_id,
             target_team_id=target_team_id,
             db=db,
+            requester=requester,
         )
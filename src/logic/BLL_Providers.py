@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from fastapi import HTTPException
 from pydantic import BaseModel, Field, model_validator
@@ -15,6 +15,7 @@ from database.DB_Providers import (
     Rotation,
     RotationProviderInstance,
 )
+from lib.Cache import CacheHint
 from logic.AbstractLogicManager import (
     AbstractBLLManager,
     BaseMixinModel,
@@ -90,19 +91,23 @@ class ProviderManager(AbstractBLLManager):
     ReferenceModel = ProviderReferenceModel
     NetworkModel = ProviderNetworkModel
     DBClass = Provider
+    # Catalog data: served from the GraphQL response cache
+    cache_hint = CacheHint(max_age=300)
 
     def __init__(
         self,
-        requester_id: str,
+        requester_id: Optional[str] = None,
         target_user_id: Optional[str] = None,
         target_team_id: Optional[str] = None,
         db: Optional[Session] = None,
+        requester: Optional[Any] = None,
     ):
         super().__init__(
             requester_id=requester_id,
             target_user_id=target_user_id,
             target_team_id=target_team_id,
             db=db,
+            requester=requester,
         )
         self._extensions = None
         self._instances = None
@@ -113,7 +118,7 @@ class ProviderManager(AbstractBLLManager):
         if self._extensions is None:
             # Import locally to avoid circular imports
             self._extensions = ProviderExtensionManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 target_team_id=self.target_team_id,
                 db=self.db,
@@ -125,7 +130,7 @@ class ProviderManager(AbstractBLLManager):
         if self._instances is None:
             # Import locally to avoid circular imports
             self._instances = ProviderInstanceManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 target_team_id=self.target_team_id,
                 db=self.db,
@@ -137,7 +142,7 @@ class ProviderManager(AbstractBLLManager):
         if self._rotations is None:
             # Import locally to avoid circular imports
             self._rotations = RotationManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 target_team_id=self.target_team_id,
                 db=self.db,
@@ -217,19 +222,23 @@ class ProviderExtensionManager(AbstractBLLManager):
     ReferenceModel = ProviderExtensionReferenceModel
     NetworkModel = ProviderExtensionNetworkModel
     DBClass = ProviderExtension
+    # Catalog data: served from the GraphQL response cache
+    cache_hint = CacheHint(max_age=300)
 
     def __init__(
         self,
-        requester_id: str,
+        requester_id: Optional[str] = None,
         target_user_id: Optional[str] = None,
         target_team_id: Optional[str] = None,
         db: Optional[Session] = None,
+        requester: Optional[Any] = None,
     ):
         super().__init__(
             requester_id=requester_id,
             target_user_id=target_user_id,
             target_team_id=target_team_id,
             db=db,
+            requester=requester,
         )
         self._ability = None
 
@@ -238,7 +247,7 @@ class ProviderExtensionManager(AbstractBLLManager):
         if self._ability is None:
             # Import locally to avoid circular imports
             self._ability = ProviderExtensionAbilityManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 target_team_id=self.target_team_id,
                 db=self.db,
@@ -303,6 +312,8 @@ class ProviderExtensionAbilityManager(AbstractBLLManager):
     ReferenceModel = ProviderExtensionAbilityReferenceModel
     NetworkModel = ProviderExtensionAbilityNetworkModel
     DBClass = ProviderExtensionAbility
+    # Catalog data: served from the GraphQL response cache
+    cache_hint = CacheHint(max_age=300)
 
 
 class ProviderInstanceModel(
@@ -395,16 +406,18 @@ class ProviderInstanceManager(AbstractBLLManager):
 
     def __init__(
         self,
-        requester_id: str,
+        requester_id: Optional[str] = None,
         target_user_id: Optional[str] = None,
         target_team_id: Optional[str] = None,
         db: Optional[Session] = None,
+        requester: Optional[Any] = None,
     ):
         super().__init__(
             requester_id=requester_id,
             target_user_id=target_user_id,
             target_team_id=target_team_id,
             db=db,
+            requester=requester,
         )
         self._usage = None
         self._setting = None
@@ -415,7 +428,7 @@ class ProviderInstanceManager(AbstractBLLManager):
         if self._usage is None:
             # Import locally to avoid circular imports
             self._usage = ProviderInstanceUsageManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 target_team_id=self.target_team_id,
                 db=self.db,
@@ -427,7 +440,7 @@ class ProviderInstanceManager(AbstractBLLManager):
         if self._setting is None:
             # Import locally to avoid circular imports
             self._setting = ProviderInstanceSettingManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 target_team_id=self.target_team_id,
                 db=self.db,
@@ -439,7 +452,7 @@ class ProviderInstanceManager(AbstractBLLManager):
         if self._ability is None:
             # Import locally to avoid circular imports
             self._ability = ProviderInstanceExtensionAbilityManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 target_team_id=self.target_team_id,
                 db=self.db,
@@ -768,16 +781,18 @@ class RotationManager(AbstractBLLManager):
 
     def __init__(
         self,
-        requester_id: str,
+        requester_id: Optional[str] = None,
         target_user_id: Optional[str] = None,
         target_team_id: Optional[str] = None,
         db: Optional[Session] = None,
+        requester: Optional[Any] = None,
     ):
         super().__init__(
             requester_id=requester_id,
             target_user_id=target_user_id,
             target_team_id=target_team_id,
             db=db,
+            requester=requester,
         )
         self._provider_instances = None
 
@@ -786,7 +801,7 @@ class RotationManager(AbstractBLLManager):
         if self._provider_instances is None:
             # Import locally to avoid circular imports
             self._provider_instances = RotationProviderInstanceManager(
-                requester_id=self.requester.id,
+                requester=self.requester,
                 target_user_id=self.target_user_id,
                 target_team_id=self.target_team_id,
                 db=self.db,
@@ -1,5 +1,5 @@
 import base64
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from .AbstractSDKHandler import AbstractSDKHandler, AuthenticationError
 
@@ -152,6 +152,17 @@ class AuthSDK(AbstractSDKHandler):
         """
         return self.get(f"/v1/user/{user_id}", resource_name="user")
 
+    def get_users(self, user_ids: List[str]) -> Dict[str, Any]:
+        """Get many users by ID with a single request.
+
+        Args:
+            user_ids: User IDs
+
+        Returns:
+            Users that were found, in request order
+        """
+        return self.post("/v1/user/lookup", {"ids": user_ids}, resource_name="users")
+
     def list_users(
         self,
         offset: int = 0,
@@ -245,6 +256,17 @@ class AuthSDK(AbstractSDKHandler):
         """
         return self.get(f"/v1/team/{team_id}", resource_name="team")
 
+    def get_teams(self, team_ids: List[str]) -> Dict[str, Any]:
+        """Get many teams by ID with a single request.
+
+        Args:
+            team_ids: Team IDs
+
+        Returns:
+            Teams that were found, in request order
+        """
+        return self.post("/v1/team/lookup", {"ids": team_ids}, resource_name="teams")
+
     def update_team(self, team_id: str, **team_data) -> Dict[str, Any]:
         """Update a team.
 
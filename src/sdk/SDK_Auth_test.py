@@ -1,6 +1,8 @@
 import json
 import unittest
 
+import pytest
+
 from .AbstractSDKTest import AbstractSDKTest
 from .SDK_Auth import AuthSDK
 
@@ -369,5 +371,57 @@ class TestAuthSDK(AbstractSDKTest):
         self.assertEqual(result, sessions_response)
 
 
+class TestAuthLookup:
+    """Tests for the AuthSDK multi-get methods.
+
+    Plain pytest tests backed by the ``mock_request`` fixture.
+    """
+
+    base_url = "https://api.example.com"
+
+    @pytest.fixture
+    def auth_sdk(self):
+        return AuthSDK(base_url=self.base_url, token="test_token")
+
+    def test_get_users(self, auth_sdk, mock_request):
+        """Users are fetched with one POST to the lookup route."""
+        users_response = {
+            "users": [
+                {"id": "user-2", "email": "second@example.com"},
+                {"id": "user-1", "email": "first@example.com"},
+            ]
+        }
+        mock_request.return_value.json.return_value = users_response
+
+        result = auth_sdk.get_users(["user-2", "user-1"])
+
+        mock_request.assert_called_once()
+        _, kwargs = mock_request.call_args
+        assert kwargs["method"] == "POST"
+        assert kwargs["url"] == f"{self.base_url}/v1/user/lookup"
+        assert json.loads(kwargs["data"]) == {"ids": ["user-2", "user-1"]}
+        assert kwargs["headers"]["Authorization"] == "Bearer test_token"
+        assert result == users_response
+
+    def test_get_teams(self, auth_sdk, mock_request):
+        """Teams are fetched with one POST to the lookup route."""
+        teams_response = {
+            "teams": [
+                {"id": "team-2", "name": "Second Team"},
+                {"id": "team-1", "name": "First Team"},
+            ]
+        }
+        mock_request.return_value.json.return_value = teams_response
+
+        result = auth_sdk.get_teams(["team-2", "team-1"])
+
+        mock_request.assert_called_once()
+        _, kwargs = mock_request.call_args
+        assert kwargs["method"] == "POST"
+        assert kwargs["url"] == f"{self.base_url}/v1/team/lookup"
+        assert json.loads(kwargs["data"]) == {"ids": ["team-2", "team-1"]}
+        assert result == teams_response
+
+
 if __name__ == "__main__":
     unittest.main()
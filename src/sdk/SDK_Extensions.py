@@ -180,6 +180,19 @@ class ExtensionsSDK(AbstractSDKHandler):
         """
         return self.get(f"/v1/extension/{extension_id}", resource_name="extension")
 
+    def get_extensions(self, extension_ids: List[str]) -> Dict[str, Any]:
+        """Get many extensions by ID with a single request.
+
+        Args:
+            extension_ids: Extension IDs
+
+        Returns:
+            Extensions that were found, in request order
+        """
+        return self.post(
+            "/v1/extension/lookup", {"ids": extension_ids}, resource_name="extensions"
+        )
+
     def update_extension(
         self,
         extension_id: str,
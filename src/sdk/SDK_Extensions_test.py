@@ -1,6 +1,8 @@
 import json
 import unittest
 
+import pytest
+
 from .AbstractSDKTest import AbstractSDKTest
 from .SDK_Extensions import ExtensionsSDK
 
@@ -352,5 +354,38 @@ class TestExtensionsSDK(AbstractSDKTest):
         self.assertEqual(result, search_response)
 
 
+class TestExtensionsLookup:
+    """Tests for the ExtensionsSDK multi-get methods.
+
+    Plain pytest tests backed by the ``mock_request`` fixture.
+    """
+
+    base_url = "https://api.example.com"
+
+    @pytest.fixture
+    def extensions_sdk(self):
+        return ExtensionsSDK(base_url=self.base_url, token="test_token")
+
+    def test_get_extensions(self, extensions_sdk, mock_request):
+        """Extensions are fetched with one POST to the lookup route."""
+        extensions_response = {
+            "extensions": [
+                {"id": "extension-2", "name": "Second Extension"},
+                {"id": "extension-1", "name": "First Extension"},
+            ]
+        }
+        mock_request.return_value.json.return_value = extensions_response
+
+        result = extensions_sdk.get_extensions(["extension-2", "extension-1"])
+
+        mock_request.assert_called_once()
+        _, kwargs = mock_request.call_args
+        assert kwargs["method"] == "POST"
+        assert kwargs["url"] == f"{self.base_url}/v1/extension/lookup"
+        assert json.loads(kwargs["data"]) == {"ids": ["extension-2", "extension-1"]}
+        assert kwargs["headers"]["Authorization"] == "Bearer test_token"
+        assert result == extensions_response
+
+
 if __name__ == "__main__":
     unittest.main()
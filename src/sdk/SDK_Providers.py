@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from .AbstractSDKHandler import AbstractSDKHandler
 
@@ -50,6 +50,19 @@ class ProvidersSDK(AbstractSDKHandler):
         """
         return self.get(f"/v1/provider/{provider_id}", resource_name="provider")
 
+    def get_providers(self, provider_ids: List[str]) -> Dict[str, Any]:
+        """Get many providers by ID with a single request.
+
+        Args:
+            provider_ids: Provider IDs
+
+        Returns:
+            Providers that were found, in request order
+        """
+        return self.post(
+            "/v1/provider/lookup", {"ids": provider_ids}, resource_name="providers"
+        )
+
     def update_provider(self, provider_id: str, **provider_data) -> Dict[str, Any]:
         """Update a provider.
 
@@ -175,6 +188,21 @@ class ProvidersSDK(AbstractSDKHandler):
             f"/v1/provider-instance/{instance_id}", resource_name="provider_instance"
         )
 
+    def get_provider_instances(self, instance_ids: List[str]) -> Dict[str, Any]:
+        """Get many provider instances by ID with a single request.
+
+        Args:
+            instance_ids: Provider instance IDs
+
+        Returns:
+            Provider instances that were found, in request order
+        """
+        return self.post(
+            "/v1/provider-instance/lookup",
+            {"ids": instance_ids},
+            resource_name="provider_instances",
+        )
+
     def update_provider_instance(
         self, instance_id: str, **instance_data
     ) -> Dict[str, Any]:
@@ -1,5 +1,9 @@
+import json
 import unittest
 
+import pytest
+
+from .AbstractSDKHandler import ValidationError
 from .AbstractSDKTest import AbstractSDKTest
 from .SDK_Providers import ProvidersSDK
 
@@ -595,5 +599,67 @@ class TestProvidersSDK(AbstractSDKTest):
         self.assertEqual(result, ability_response)
 
 
+class TestProvidersLookup:
+    """Tests for the ProvidersSDK multi-get methods.
+
+    Plain pytest tests backed by the ``mock_request`` fixture.
+    """
+
+    base_url = "https://api.example.com"
+
+    @pytest.fixture
+    def providers_sdk(self):
+        return ProvidersSDK(base_url=self.base_url, token="test_token")
+
+    def test_get_providers(self, providers_sdk, mock_request):
+        """Providers are fetched with one POST to the lookup route."""
+        providers_response = {
+            "providers": [
+                {"id": "provider-2", "name": "Second Provider"},
+                {"id": "provider-1", "name": "First Provider"},
+            ]
+        }
+        mock_request.return_value.json.return_value = providers_response
+
+        result = providers_sdk.get_providers(["provider-2", "provider-1"])
+
+        mock_request.assert_called_once()
+        _, kwargs = mock_request.call_args
+        assert kwargs["method"] == "POST"
+        assert kwargs["url"] == f"{self.base_url}/v1/provider/lookup"
+        assert json.loads(kwargs["data"]) == {"ids": ["provider-2", "provider-1"]}
+        assert kwargs["headers"]["Authorization"] == "Bearer test_token"
+        assert result == providers_response
+
+    def test_get_provider_instances(self, providers_sdk, mock_request):
+        """Provider instances are fetched with one POST to the lookup route."""
+        instances_response = {
+            "provider_instances": [
+                {"id": "instance-2", "name": "Second Instance"},
+                {"id": "instance-1", "name": "First Instance"},
+            ]
+        }
+        mock_request.return_value.json.return_value = instances_response
+
+        result = providers_sdk.get_provider_instances(["instance-2", "instance-1"])
+
+        mock_request.assert_called_once()
+        _, kwargs = mock_request.call_args
+        assert kwargs["method"] == "POST"
+        assert kwargs["url"] == f"{self.base_url}/v1/provider-instance/lookup"
+        assert json.loads(kwargs["data"]) == {"ids": ["instance-2", "instance-1"]}
+        assert result == instances_response
+
+    def test_get_providers_rejected(self, providers_sdk, mock_request):
+        """A 422 from the lookup route surfaces as ValidationError."""
+        mock_request.return_value.ok = False
+        mock_request.return_value.status_code = 422
+        mock_request.return_value.json.return_value = {
+            "detail": "At most 1000 ids can be looked up at once"
+        }
+
+        with pytest.raises(ValidationError):
+            providers_sdk.get_providers([f"provider-{i}" for i in range(1001)])
+
 if __name__ == "__main__":
     unittest.main()
@@ -141,3 +141,23 @@ def test_user_id() -> str:
 def test_team_id() -> str:
     """Provide a test team ID for tests."""
     return "test-team-id"
+
+
+@pytest.fixture(scope="function")
+def mock_request():
+    """Patch requests.request and return the mock.
+
+    The mock answers every call with a 200 JSON response; set
+    ``mock_request.return_value.json.return_value`` to change the body.
+    """
+    from unittest.mock import MagicMock, patch
+
+    from requests import Response
+
+    response = MagicMock(spec=Response)
+    response.status_code = 200
+    response.ok = True
+    response.json.return_value = {}
+
+    with patch("requests.request", return_value=response) as mock:
+        yield mock